@@ -29,7 +29,7 @@ SSE_BG_PID=$CURL_PID
 sleep 1.2
 
 # Extract session_id from logs (most reliable method for Docker)
-SESSION_ID=$(docker compose logs --tail 30 2>/dev/null | grep "SSE session created" | tail -1 | grep -oE '[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}' | tail -1)
+SESSION_ID=$(docker compose logs --tail 30 2>/dev/null | grep "SSE session created" | tail -1 | grep -oE '[a-f0-9]{32}' | tail -1)
 
 if [ -n "$SESSION_ID" ]; then
     echo "$SESSION_ID" > "$SESSION_ID_FILE"
@@ -44,7 +44,7 @@ if [ -f "$SESSION_ID_FILE" ]; then
 else
     # Fallback: try one more time from logs
     sleep 0.5
-    SESSION_ID=$(docker compose logs --tail 10 2>/dev/null | grep "SSE session created" | tail -1 | grep -oE '[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}' | tail -1)
+    SESSION_ID=$(docker compose logs --tail 10 2>/dev/null | grep "SSE session created" | tail -1 | grep -oE '[a-f0-9]{32}' | tail -1)
 fi
 
 if [ -z "$SESSION_ID" ]; then
@@ -0,0 +1,38 @@
+"""
+JSON encoding helpers shared by the MCP transports and the API client.
+
+Deribit payloads are number-heavy (tickers, order books, surfaces), which is
+where orjson is considerably faster than the stdlib encoder. orjson always
+emits compact UTF-8, matching the previous
+``json.dumps(separators=(",", ":"), ensure_ascii=False)`` output.
+
+Tool response models are encoded by pydantic-core directly, skipping the
+intermediate ``model_dump()`` dict; its output matches orjson's for them.
+"""
+
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+JSONDecodeError = orjson.JSONDecodeError
+
+loads = orjson.loads
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize data (a plain object or a pydantic model) to compact JSON bytes."""
+    if isinstance(data, BaseModel):
+        return to_json(data)
+    return orjson.dumps(data)
+
+
+def dumps_sorted(data: Any) -> bytes:
+    """Serialize a plain object to compact JSON bytes with sorted keys."""
+    return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+
+
+def compact_json(data: Any) -> str:
+    """Serialize data to a compact JSON string (for APIs that require str)."""
+    return dumps(data).decode()
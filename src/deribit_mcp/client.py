@@ -11,7 +11,7 @@ Features:
 
 import asyncio
 import hashlib
-import json
+import importlib.util
 import logging
 import random
 import time
@@ -20,16 +20,34 @@ from typing import Any
 
 import httpx
 
+from ._json import dumps, dumps_sorted, loads
 from .config import Settings, get_settings, sanitize_log_message
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 multiplexes concurrent requests over one connection; httpx only
+# supports it when the optional h2 package is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Every request goes to the same host, so keep a warm pool of connections
+# rather than paying a TLS handshake per burst
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
 
 class DeribitError(Exception):
-    """Base exception for Deribit API errors."""
+    """
+    Base exception for Deribit API errors.
+
+    The message is bounded at construction, so error paths never carry (or
+    re-slice) an arbitrarily large upstream error body.
+    """
+
+    MAX_MESSAGE_LENGTH = 200
 
     def __init__(self, code: int, message: str, data: Any = None):
         self.code = code
+        if len(message) > self.MAX_MESSAGE_LENGTH:
+            message = message[: self.MAX_MESSAGE_LENGTH]
         self.message = message
         self.data = data
         super().__init__(f"Deribit error {code}: {message}")
@@ -124,11 +142,14 @@ class DeribitJsonRpcClient:
     - Automatic authentication management
     """
 
-    # Methods that use slow cache (metadata)
+    # Methods that use slow cache (metadata and history). History queries
+    # are only cacheable because tools quantize their time windows.
     SLOW_CACHE_METHODS = {
         "public/get_instruments",
         "public/get_currencies",
         "public/get_index",
+        "public/get_volatility_index_data",
+        "public/get_funding_rate_history",
     }
 
     # Methods that should never be cached
@@ -144,6 +165,8 @@ class DeribitJsonRpcClient:
         self.settings = settings or get_settings()
         self._http_client: httpx.AsyncClient | None = None
         self._cache: dict[str, CacheEntry] = {}
+        # In-flight public calls by cache key, shared by concurrent callers
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
         self._rate_limiter = TokenBucket(
             rate=self.settings.max_rps,
             capacity=self.settings.max_rps * 2,  # Allow burst
@@ -159,6 +182,8 @@ class DeribitJsonRpcClient:
             self._http_client = httpx.AsyncClient(
                 base_url=self.settings.base_url,
                 timeout=httpx.Timeout(self.settings.timeout_s),
+                limits=_HTTP_LIMITS,
+                http2=_HTTP2_AVAILABLE,
                 headers={
                     "Content-Type": "application/json",
                     "User-Agent": "DeribitMCPServer/1.0",
@@ -174,9 +199,8 @@ class DeribitJsonRpcClient:
 
     def _get_cache_key(self, method: str, params: dict[str, Any] | None) -> str:
         """Generate a cache key from method and params."""
-        param_str = json.dumps(params or {}, sort_keys=True)
-        key_str = f"{method}:{param_str}"
-        return hashlib.md5(key_str.encode()).hexdigest()
+        key_bytes = method.encode() + b":" + dumps_sorted(params or {})
+        return hashlib.md5(key_bytes).hexdigest()
 
     def _get_cache_ttl(self, method: str) -> float:
         """Get appropriate TTL for a method."""
@@ -266,12 +290,15 @@ class DeribitJsonRpcClient:
             logger.debug(f"Making request: {method}")
             response = await self.http_client.post(
                 "",  # Empty path = POST to base_url directly
-                json=payload,
+                # Pre-encoded with orjson; the client sets the JSON content type
+                content=dumps(payload),
                 headers=headers,
             )
             response.raise_for_status()
-            data = response.json()
-                
+            # Instrument lists run to hundreds of KB; orjson decodes them
+            # several times faster than httpx's stdlib-based response.json()
+            data = loads(response.content)
+
         except httpx.TimeoutException as e:
             logger.error(f"Request timeout: {method} after {self.settings.timeout_s}s")
             raise DeribitTimeoutError(
@@ -339,6 +366,53 @@ class DeribitJsonRpcClient:
         if cached is not None:
             return cached
 
+        # Coalesce concurrent identical public calls into one request
+        if not use_auth and method not in self.NO_CACHE_METHODS:
+            return await self._call_shared(method, params, max_retries)
+
+        return await self._call_uncached(method, params, use_auth, max_retries)
+
+    async def _call_shared(
+        self,
+        method: str,
+        params: dict[str, Any] | None,
+        max_retries: int,
+    ) -> Any:
+        """
+        Join an in-flight identical call, or start one that others can join.
+
+        The request runs as its own task and each caller awaits it through
+        asyncio.shield, so one caller being cancelled does not cancel the
+        request for the others.
+        """
+        key = self._get_cache_key(method, params)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._call_uncached(method, params, False, max_retries)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish_inflight(key, t))
+        else:
+            logger.debug("Joining in-flight request for %s", method)
+        return await asyncio.shield(task)
+
+    def _finish_inflight(self, key: str, task: asyncio.Task[Any]) -> None:
+        """Drop a finished shared call from the in-flight map."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _call_uncached(
+        self,
+        method: str,
+        params: dict[str, Any] | None,
+        use_auth: bool,
+        max_retries: int,
+    ) -> Any:
+        """Perform the call with retries and cache a successful result."""
         # Get auth token if needed
         access_token = None
         if use_auth:
@@ -8,7 +8,7 @@ NEVER log or expose client_secret in plaintext.
 import re
 from enum import Enum
 from functools import lru_cache
-from typing import Literal
+from typing import Literal, NamedTuple
 
 from pydantic import Field, SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -59,6 +59,12 @@ class Settings(BaseSettings):
     max_rps: float = Field(
         default=8.0, ge=1.0, le=20.0, description="Maximum requests per second (token bucket rate)"
     )
+    public_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Max concurrent public requests issued by a single tool call",
+    )
 
     # Cache TTL settings
     cache_ttl_fast: float = Field(
@@ -79,6 +85,24 @@ class Settings(BaseSettings):
     # Server settings
     host: str = Field(default="0.0.0.0", description="HTTP server host")
     port: int = Field(default=8000, ge=1, le=65535, description="HTTP server port")
+    workers: int = Field(
+        default=1,
+        ge=0,
+        le=64,
+        description="HTTP server worker processes (0 = one per available CPU)",
+    )
+    sse_max_queue_size: int = Field(
+        default=256,
+        ge=1,
+        le=10000,
+        description="Max queued SSE messages per session (oldest dropped when full)",
+    )
+    sse_slow_client_disconnect: int = Field(
+        default=100,
+        ge=0,
+        le=100000,
+        description="Close an SSE session after this many dropped messages (0 = never)",
+    )
 
     @field_validator("client_id", "client_secret", mode="before")
     @classmethod
@@ -138,7 +162,7 @@ class Settings(BaseSettings):
         return s[:show_chars] + "****"
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get cached settings instance.
@@ -151,6 +175,42 @@ def get_settings() -> Settings:
     return Settings()
 
 
+class SettingsView(NamedTuple):
+    """Immutable snapshot of the settings read on request hot paths."""
+
+    env_value: str
+    enable_private: bool
+    has_credentials: bool
+    sse_max_queue_size: int
+    sse_slow_client_disconnect: int
+    public_concurrency: int
+
+
+@lru_cache(maxsize=1)
+def get_settings_view() -> SettingsView:
+    """
+    Get a cached snapshot of frequently read settings.
+
+    Built from get_settings(); clear both caches together when settings change.
+    """
+    settings = get_settings()
+    return SettingsView(
+        env_value=settings.env.value,
+        enable_private=settings.enable_private,
+        has_credentials=settings.has_credentials,
+        sse_max_queue_size=settings.sse_max_queue_size,
+        sse_slow_client_disconnect=settings.sse_slow_client_disconnect,
+        public_concurrency=settings.public_concurrency,
+    )
+
+
+# Generic key/value patterns for API keys/tokens
+_SECRET_PATTERN = re.compile(
+    r'(client_secret|api_key|secret|token|password)(["\s:=]+)[^\s,"}\]]+',
+    flags=re.IGNORECASE,
+)
+
+
 def sanitize_log_message(message: str, settings: Settings | None = None) -> str:
     """
     Sanitize a log message by removing any potential secrets.
@@ -173,12 +233,7 @@ def sanitize_log_message(message: str, settings: Settings | None = None) -> str:
         sanitized = sanitized.replace(settings.client_id, Settings._mask_string(settings.client_id))
 
     # Generic patterns for API keys/tokens
-    sanitized = re.sub(
-        r'(client_secret|api_key|secret|token|password)(["\s:=]+)[^\s,"}\]]+',
-        r"\1\2***REDACTED***",
-        sanitized,
-        flags=re.IGNORECASE,
-    )
+    sanitized = _SECRET_PATTERN.sub(r"\1\2***REDACTED***", sanitized)
 
     return sanitized
 
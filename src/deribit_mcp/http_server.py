@@ -21,24 +21,31 @@ Usage:
 """
 
 import asyncio
-import json
 import logging
+import os
+import secrets
 import sys
-import uuid
+import time
+import weakref
 from contextlib import asynccontextmanager
-from typing import Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional
 
 import uvicorn
-from sse_starlette.sse import EventSourceResponse
 from starlette.applications import Starlette
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response, StreamingResponse
 from starlette.routing import Route
+from starlette.types import Receive, Scope, Send
 
-from .client import get_client, shutdown_client
-from .config import get_settings, sanitize_log_message
+from . import __version__
+from ._json import JSONDecodeError, compact_json, dumps, loads
+from .client import DeribitJsonRpcClient, get_client, shutdown_client
+from .config import get_settings, get_settings_view, sanitize_log_message
 from .diagnostics import run_full_diagnostics, test_authentication, test_private_api, test_public_api
 from .server import _dispatch_tool, get_private_tools, get_public_tools
 from .tools import deribit_status
@@ -52,9 +59,20 @@ logging.basicConfig(
 logger = logging.getLogger("deribit_mcp.http")
 
 
-def _compact_json(data: dict) -> str:
-    """Convert dict to compact JSON string."""
-    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+class ORJSONResponse(Response):
+    """
+    JSON response rendered with orjson instead of the stdlib encoder.
+
+    Bytes are taken as an already-encoded JSON body and sent as-is;
+    Content-Length is set from the body by Response.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
 
 
 # =============================================================================
@@ -62,50 +80,116 @@ def _compact_json(data: dict) -> str:
 # =============================================================================
 
 
+# SSE wire format - all MCP messages use the "message" event type
+_SSE_FRAME = b"event: message\ndata: %b\n\n"
+# SSE comment sent on idle streams so proxies keep the connection open
+_KEEPALIVE_FRAME = b": ping\n\n"
+
+
 class SSESession:
-    """Manages an SSE session with message queue."""
+    """Manages an SSE session with a bounded queue of encoded frames."""
 
-    # Heartbeat interval (seconds)
-    HEARTBEAT_INTERVAL = 30.0
+    # Keep-alive comment interval (seconds) while the stream is idle
+    KEEPALIVE_INTERVAL = 15.0
     # Connection timeout (seconds) - close if no activity
     CONNECTION_TIMEOUT = 300.0  # 5 minutes
+    # Maximum stream lifetime (seconds) - clients reconnect afterwards
+    MAX_CONNECTION_DURATION = 1500.0  # 25 minutes
 
-    def __init__(self, session_id: str):
+    # Messages dropped across all sessions because a client fell behind
+    total_evictions = 0
+
+    def __init__(self, session_id: str, max_queue_size: int = 256, max_evictions: int = 0):
         self.session_id = session_id
-        self.queue: asyncio.Queue = asyncio.Queue()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
         self.created_at = asyncio.get_event_loop().time()
         self.last_activity = asyncio.get_event_loop().time()
+        self.max_evictions = max_evictions
+        self.slow_evictions = 0
         self._closed = False
-        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
+        # One timer per session covers both idle timeout and max lifetime
+        self._expiry_timer: Optional[asyncio.TimerHandle] = None
+        self._arm_expiry_timer(self.CONNECTION_TIMEOUT)
+
+    def _arm_expiry_timer(self, delay: float) -> None:
+        loop = asyncio.get_event_loop()
+        self._expiry_timer = loop.call_later(delay, self._on_expiry_timer)
+
+    def _on_expiry_timer(self) -> None:
+        """
+        Expire the session, or re-arm for the remaining time.
+
+        Activity only moves last_activity forward, so the timer is re-armed
+        lazily here instead of being rescheduled on every message.
+        """
+        if self._closed:
+            return
+        now = asyncio.get_event_loop().time()
+        remaining = min(
+            self.last_activity + self.CONNECTION_TIMEOUT,
+            self.created_at + self.MAX_CONNECTION_DURATION,
+        ) - now
+        if remaining > 0:
+            self._arm_expiry_timer(remaining)
+            return
+        logger.info("SSE session %s timed out (idle or max duration reached)", self.session_id)
+        _sessions.pop(self.session_id, None)
+        self._shutdown()
+
+    def _put(self, item) -> None:
+        """Enqueue without blocking, dropping the oldest message if the queue is full."""
+        try:
+            self.queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.queue.get_nowait()
+            self.queue.put_nowait(item)
+            self.slow_evictions += 1
+            SSESession.total_evictions += 1
 
     async def send(self, event: str, data: dict):
         """
         Send an event to the client.
-        
+
+        Never blocks: if the client is not draining its stream, the oldest
+        queued message is dropped. Sessions that keep falling behind are
+        closed once max_evictions is reached.
+
         Args:
             event: Event type (ignored, always uses "message" for MCP)
             data: JSON-RPC 2.0 formatted message dict
         """
+        await self.send_raw(dumps(data))
+
+    async def send_raw(self, payload: bytes):
+        """Send an already-encoded JSON-RPC message to the client."""
         if self._closed:
             return
         self.last_activity = asyncio.get_event_loop().time()
-        # Format as MCP message - all messages use "message" event type
-        # Data should already be JSON-RPC 2.0 formatted
-        await self.queue.put(
-            {
-                "event": "message",  # MCP standard event type
-                "data": _compact_json(data),
-            }
-        )
+        # Encode the SSE frame once; the stream writes these bytes as-is
+        self._put(_SSE_FRAME % payload)
+        if self.max_evictions and self.slow_evictions >= self.max_evictions:
+            logger.warning(
+                "Closing slow SSE session %s after %d dropped messages",
+                self.session_id,
+                self.slow_evictions,
+            )
+            await self.close()
 
-    async def close(self):
-        """Close the session."""
+    def _shutdown(self) -> None:
+        """Mark the session closed and wake the stream with a None sentinel."""
         if self._closed:
             return
         self._closed = True
-        if self._heartbeat_task:
-            self._heartbeat_task.cancel()
-        await self.queue.put(None)
+        if self._expiry_timer:
+            self._expiry_timer.cancel()
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+        self._put(None)
+
+    async def close(self):
+        """Close the session."""
+        self._shutdown()
 
     def mark_activity(self):
         """Mark that there was activity on this session."""
@@ -115,84 +199,44 @@ class SSESession:
         """Check if session has timed out."""
         if self._closed:
             return True
-        elapsed = asyncio.get_event_loop().time() - self.last_activity
-        return elapsed > self.CONNECTION_TIMEOUT
+        now = asyncio.get_event_loop().time()
+        if now - self.created_at > self.MAX_CONNECTION_DURATION:
+            return True
+        return now - self.last_activity > self.CONNECTION_TIMEOUT
 
 
-# Global session storage
-_sessions: dict[str, SSESession] = {}
-_shutdown_event: Optional[asyncio.Event] = None
+# Global session storage - entries disappear once a session's stream,
+# timers and tasks no longer reference it
+_sessions: weakref.WeakValueDictionary[str, SSESession] = weakref.WeakValueDictionary()
 
+# Public API probe result shared by rapid /health requests (load balancer probes)
+HEALTH_CACHE_TTL = 2.0
 
-async def _cleanup_stale_sessions():
-    """Periodically clean up stale/timed out sessions."""
-    while True:
-        try:
-            await asyncio.sleep(60)  # Check every minute
-            if _shutdown_event and _shutdown_event.is_set():
-                break
-
-            now = asyncio.get_event_loop().time()
-            timed_out_sessions = [
-                session_id
-                for session_id, session in list(_sessions.items())
-                if session.is_timed_out()
-            ]
-
-            for session_id in timed_out_sessions:
-                logger.info(f"Cleaning up timed out SSE session: {session_id}")
-                session = _sessions.get(session_id)
-                if session:
-                    await session.close()
-                if session_id in _sessions:
-                    del _sessions[session_id]
-
-        except asyncio.CancelledError:
-            break
-        except Exception as e:
-            logger.error(f"Error in cleanup task: {e}")
+
+@dataclass(frozen=True)
+class _HealthProbe:
+    """Outcome of one public API probe."""
+
+    ts: float = float("-inf")  # time.monotonic() when the probe started
+    api_ok: bool = False
+    server_time_ms: int | None = None
+    error: str | None = None
 
 
-async def _send_heartbeat(session: SSESession):
-    """Send periodic heartbeat to keep connection alive."""
+_health_probe = _HealthProbe()
+# Probe in flight, shared by concurrent /health requests that find the cache stale
+_health_probe_task: asyncio.Task[_HealthProbe] | None = None
+
+
+async def _send_keepalive(session: SSESession):
+    """Emit SSE comment frames while the stream is idle."""
     try:
-        # Wait longer before starting heartbeat to let connection fully establish
-        # MCP clients may need time to process initialization
-        await asyncio.sleep(30.0)
-        
-        heartbeat_count = 0
         while not session._closed:
-            if session._closed or session.is_timed_out():
-                break
-            
-            try:
-                # Send heartbeat as MCP notification (optional, some clients don't need it)
-                # Only send if session is still active
-                if not session._closed:
-                    heartbeat_message = {
-                        "jsonrpc": "2.0",
-                        "method": "ping",
-                        "params": {
-                            "timestamp": asyncio.get_event_loop().time(),
-                            "session_id": session.session_id,
-                            "count": heartbeat_count,
-                        },
-                    }
-                    await session.send("notification", heartbeat_message)
-                    heartbeat_count += 1
-                    logger.debug(f"Heartbeat #{heartbeat_count} sent for session {session.session_id}")
-            except Exception as e:
-                logger.debug(f"Error sending heartbeat for {session.session_id}: {e}")
-                # Don't break on heartbeat errors, just log and continue
-                pass
-            
-            # Wait for next heartbeat interval
-            await asyncio.sleep(session.HEARTBEAT_INTERVAL)
-            
+            await asyncio.sleep(session.KEEPALIVE_INTERVAL)
+            if session.queue.empty():
+                session._put(_KEEPALIVE_FRAME)
     except asyncio.CancelledError:
-        logger.debug(f"Heartbeat task cancelled for session {session.session_id}")
-    except Exception as e:
-        logger.debug(f"Heartbeat error for session {session.session_id}: {e}")
+        pass
 
 
 # =============================================================================
@@ -200,29 +244,65 @@ async def _send_heartbeat(session: SSESession):
 # =============================================================================
 
 
-async def health_check(request: Request) -> JSONResponse:
+async def _probe_public_api(client: DeribitJsonRpcClient) -> _HealthProbe:
+    """Run one public API probe; failures are recorded, not raised."""
+    started = time.monotonic()
+    try:
+        status = await deribit_status(client=client)
+        return _HealthProbe(ts=started, api_ok=status.api_ok, server_time_ms=status.server_time_ms)
+    except Exception as e:
+        logger.error("Health check failed: %s", e, exc_info=True)
+        return _HealthProbe(ts=started, error=f"Public API error: {str(e)[:100]}")
+
+
+def _finish_health_probe(task: asyncio.Task[_HealthProbe]) -> None:
+    """Publish a finished probe and clear the in-flight slot."""
+    global _health_probe, _health_probe_task
+    if _health_probe_task is task:
+        _health_probe_task = None
+    if not task.cancelled():
+        _health_probe = task.result()
+
+
+async def _current_health_probe(client: DeribitJsonRpcClient) -> _HealthProbe:
+    """
+    Latest public API probe, refreshed at most once per HEALTH_CACHE_TTL.
+
+    Concurrent callers that find the result stale share one probe; shielding
+    it means a disconnecting caller doesn't cancel it for the others.
+    """
+    global _health_probe_task
+    if time.monotonic() - _health_probe.ts < HEALTH_CACHE_TTL:
+        return _health_probe
+    if _health_probe_task is None:
+        _health_probe_task = asyncio.ensure_future(_probe_public_api(client))
+        _health_probe_task.add_done_callback(_finish_health_probe)
+    return await asyncio.shield(_health_probe_task)
+
+
+async def health_check(request: Request) -> ORJSONResponse:
     """Health check endpoint with detailed diagnostics."""
-    settings = get_settings()
+    settings = get_settings_view()
     client = get_client()
     
-    diagnostics = {
+    diagnostics: dict[str, Any] = {
         "status": "healthy",
-        "env": settings.env.value,
+        "env": settings.env_value,
         "api_ok": False,
         "private_enabled": settings.enable_private,
         "has_credentials": settings.has_credentials,
+        "sse_sessions": len(_sessions),
+        "sse_slow_evictions": SSESession.total_evictions,
         "errors": [],
     }
 
-    # Test public API
-    try:
-        status = await deribit_status(client=client)
-        diagnostics["api_ok"] = status.get("api_ok", False)
-        diagnostics["server_time_ms"] = status.get("server_time_ms")
-    except Exception as e:
-        diagnostics["api_ok"] = False
-        diagnostics["errors"].append(f"Public API error: {str(e)[:100]}")
-        logger.error(f"Health check failed: {e}", exc_info=True)
+    # Test public API (reuse the last probe if it is fresh enough)
+    probe = await _current_health_probe(client)
+    diagnostics["api_ok"] = probe.api_ok
+    if probe.error:
+        diagnostics["errors"].append(probe.error)
+    else:
+        diagnostics["server_time_ms"] = probe.server_time_ms
 
     # Test authentication if private API is enabled
     if settings.enable_private:
@@ -255,37 +335,50 @@ async def health_check(request: Request) -> JSONResponse:
     elif diagnostics.get("errors"):
         diagnostics["status"] = "degraded"
 
-    return JSONResponse(diagnostics)
+    return ORJSONResponse(diagnostics)
 
 
-async def list_tools_endpoint(request: Request) -> JSONResponse:
-    """List all available tools."""
-    settings = get_settings()
-    tools = get_public_tools()
+@lru_cache(maxsize=2)
+def _tools_result(include_private: bool) -> dict:
+    """
+    Build the tools/list result once per private-API mode.
 
-    if settings.enable_private:
-        tools.extend(get_private_tools())
+    Tool metadata is fixed for the process lifetime, so both the MCP
+    tools/list handler and GET /tools reuse this object. Do not mutate it.
+    """
+    tools = get_public_tools()
+    if include_private:
+        tools = tools + get_private_tools()
 
-    # Convert tools to serializable format
-    tools_list = []
-    for tool in tools:
-        tools_list.append(
+    return {
+        "tools": [
             {
                 "name": tool.name,
                 "description": tool.description,
                 "inputSchema": tool.inputSchema,
             }
-        )
+            for tool in tools
+        ]
+    }
+
 
-    return JSONResponse({"tools": tools_list})
+@lru_cache(maxsize=2)
+def _tools_body(include_private: bool) -> bytes:
+    """Serialized tools/list result for GET /tools."""
+    return dumps(_tools_result(include_private))
 
 
-async def call_tool_endpoint(request: Request) -> JSONResponse:
+async def list_tools_endpoint(request: Request) -> ORJSONResponse:
+    """List all available tools."""
+    return ORJSONResponse(_tools_body(get_settings_view().enable_private))
+
+
+async def call_tool_endpoint(request: Request) -> ORJSONResponse:
     """Call a specific tool via HTTP POST."""
     try:
-        body = await request.json()
-    except json.JSONDecodeError:
-        return JSONResponse(
+        body = loads(await request.body())
+    except JSONDecodeError:
+        return ORJSONResponse(
             {"error": True, "code": 400, "message": "Invalid JSON"},
             status_code=400,
         )
@@ -294,26 +387,45 @@ async def call_tool_endpoint(request: Request) -> JSONResponse:
     arguments = body.get("arguments", {})
 
     if not tool_name:
-        return JSONResponse(
+        return ORJSONResponse(
             {"error": True, "code": 400, "message": "Missing tool name"},
             status_code=400,
         )
 
-    logger.info(f"HTTP tool call: {tool_name}")
-    logger.debug(f"Arguments: {sanitize_log_message(str(arguments))}")
+    logger.info("HTTP tool call: %s", tool_name)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Arguments: %s", sanitize_log_message(str(arguments)))
 
     try:
         result = await _dispatch_tool(tool_name, arguments)
-        return JSONResponse(result)
+        return ORJSONResponse(result)
     except Exception as e:
-        logger.error(f"Tool {tool_name} error: {e}")
-        return JSONResponse(
+        logger.error("Tool %s error: %s", tool_name, e)
+        return ORJSONResponse(
             {"error": True, "code": 500, "message": str(e)[:200]},
             status_code=500,
         )
 
 
-async def sse_endpoint(request: Request) -> EventSourceResponse:
+def _drain_frames(queue: asyncio.Queue, first: bytes) -> tuple[bytes, bool]:
+    """
+    Join a frame with every frame already waiting in the queue.
+
+    Returns the concatenated bytes and whether the None close sentinel was
+    reached; frames queued before the sentinel are still returned.
+    """
+    frames = [first]
+    while True:
+        try:
+            frame = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return b"".join(frames), False
+        if frame is None:
+            return b"".join(frames), True
+        frames.append(frame)
+
+
+async def sse_endpoint(request: Request) -> StreamingResponse:
     """
     SSE endpoint for MCP protocol.
 
@@ -324,15 +436,19 @@ async def sse_endpoint(request: Request) -> EventSourceResponse:
     - Event type: "message" (standard MCP format)
     - Data: JSON-RPC 2.0 formatted string
     """
-    session_id = str(uuid.uuid4())
-    session = SSESession(session_id)
+    settings = get_settings_view()
+    session_id = secrets.token_hex(16)
+    session = SSESession(
+        session_id,
+        max_queue_size=settings.sse_max_queue_size,
+        max_evictions=settings.sse_slow_client_disconnect,
+    )
     _sessions[session_id] = session
 
     client_ip = request.client.host if request.client else 'unknown'
-    logger.info(f"SSE session created: {session_id} (client: {client_ip})")
+    logger.info("SSE session created: %s (client: %s)", session_id, client_ip)
 
-    # Start heartbeat task (delayed to let connection stabilize)
-    session._heartbeat_task = asyncio.create_task(_send_heartbeat(session))
+    session._keepalive_task = asyncio.create_task(_send_keepalive(session))
 
     async def event_generator():
         connection_alive = True
@@ -371,112 +487,237 @@ async def sse_endpoint(request: Request) -> EventSourceResponse:
                         "session_id": session_id,
                     },
                 }
-                yield {
-                    "event": "message",
-                    "data": _compact_json(ready_notification),
-                }
-                logger.info(f"SSE session {session_id} connection ready notification sent (client: {client_ip})")
+                yield _SSE_FRAME % dumps(ready_notification)
+                logger.info(
+                    "SSE session %s connection ready notification sent (client: %s)",
+                    session_id,
+                    client_ip,
+                )
             except Exception as e:
-                logger.warning(f"Error sending ready notification: {e}")
+                logger.warning("Error sending ready notification: %s", e)
                 # Continue anyway - session_id is in header, connection is still valid
             
             # Now wait for client to send initialize request
-            logger.debug(f"Waiting for initialize request for session {session_id}")
+            logger.debug("Waiting for initialize request for session %s", session_id)
 
             # Main message loop - keep connection alive
             while connection_alive and not session._closed:
                 try:
-                    # Wait for message with reasonable timeout
-                    # Longer timeout reduces CPU usage while still checking connection
-                    try:
-                        message = await asyncio.wait_for(
-                            session.queue.get(), timeout=15.0
-                        )
-                    except asyncio.TimeoutError:
-                        # Timeout occurred - check if we should continue
-                        # Don't check disconnect status too frequently to avoid overhead
-                        if session.is_timed_out():
-                            logger.info(f"SSE session {session_id} timed out after {session.CONNECTION_TIMEOUT}s")
-                            connection_alive = False
-                            break
-                        # Continue waiting - heartbeat will keep connection alive
-                        continue
-                    
+                    # Block until the next message. Closing the session - by
+                    # its expiry timer, on shutdown, or explicitly - enqueues
+                    # a None sentinel that wakes this loop.
+                    message = await session.queue.get()
+
                     if message is None:
                         # Close signal received
-                        logger.debug(f"SSE session {session_id} received close signal")
+                        logger.debug("SSE session %s received close signal", session_id)
                         connection_alive = False
                         break
                     
-                    # Yield the message to client
-                    # Message should already be in correct format: {"event": "message", "data": "..."}
-                    if isinstance(message, dict) and "event" in message and "data" in message:
-                        yield message
-                    else:
-                        # Fallback: wrap in MCP format
-                        logger.warning(f"Unexpected message format for session {session_id}: {type(message)}")
-                        mcp_message = {
-                            "jsonrpc": "2.0",
-                            "method": "notification",
-                            "params": message if isinstance(message, dict) else {"data": str(message)},
-                        }
-                        yield {
-                            "event": "message",
-                            "data": _compact_json(mcp_message),
-                        }
-                    
+                    # Frames are pre-encoded SSE bytes; flush everything
+                    # already queued in one write instead of one per frame
+                    payload, closing = _drain_frames(session.queue, message)
+                    yield payload
+                    if closing:
+                        logger.debug("SSE session %s received close signal", session_id)
+                        connection_alive = False
+                        break
+
                 except GeneratorExit:
                     # Client closed the connection gracefully
-                    logger.info(f"SSE connection closed by client {client_ip} for session {session_id}")
+                    logger.info(
+                        "SSE connection closed by client %s for session %s",
+                        client_ip,
+                        session_id,
+                    )
                     connection_alive = False
                     break
                     
                 except asyncio.CancelledError:
                     # Task was cancelled
-                    logger.debug(f"SSE session {session_id} generator cancelled")
+                    logger.debug("SSE session %s generator cancelled", session_id)
                     connection_alive = False
                     break
                     
                 except Exception as e:
-                    logger.error(f"Error in event generator for {session_id}: {e}", exc_info=True)
+                    logger.error(
+                        "Error in event generator for %s: %s",
+                        session_id,
+                        e,
+                        exc_info=True,
+                    )
                     connection_alive = False
                     break
                     
         except Exception as e:
-            logger.error(f"Fatal error in event generator for {session_id}: {e}", exc_info=True)
+            logger.error("Fatal error in event generator for %s: %s", session_id, e, exc_info=True)
         finally:
             # Cleanup session
             connection_alive = False
             try:
                 await session.close()
             except Exception as e:
-                logger.debug(f"Error closing session {session_id}: {e}")
+                logger.debug("Error closing session %s: %s", session_id, e)
             
             if session_id in _sessions:
                 del _sessions[session_id]
             
-            logger.info(f"SSE session closed: {session_id} (client: {client_ip})")
+            logger.info("SSE session closed: %s (client: %s)", session_id, client_ip)
 
     # Create SSE response with proper headers
-    response = EventSourceResponse(
+    response = StreamingResponse(
         event_generator(),
+        media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache, no-transform",
             "Connection": "keep-alive",
             "X-Accel-Buffering": "no",  # Disable buffering for nginx/proxy
             "X-Session-Id": session_id,  # Critical: client needs this to send messages
-            "Content-Type": "text/event-stream; charset=utf-8",
             "Access-Control-Allow-Origin": "*",  # CORS for web clients
             "Access-Control-Allow-Headers": "Cache-Control, X-Session-Id",
             "Access-Control-Expose-Headers": "X-Session-Id",  # Allow client to read session_id
         },
     )
     
-    logger.debug(f"SSE response created for session {session_id} with headers")
+    logger.debug("SSE response created for session %s with headers", session_id)
     return response
 
 
-async def mcp_message_endpoint(request: Request) -> JSONResponse:
+# JSON-RPC error body - fixed shape, only id/code/message vary
+_ERROR_TEMPLATE = b'{"jsonrpc":"2.0","id":%b,"error":{"code":%d,"message":%b}}'
+
+
+def _error_body(request_id, code: int, message: str) -> bytes:
+    """Encode a JSON-RPC error response by splicing into the byte template."""
+    return _ERROR_TEMPLATE % (dumps(request_id), code, dumps(message))
+
+
+def _error_response(request_id, code: int, message: str, status_code: int = 400) -> ORJSONResponse:
+    """HTTP response carrying a templated JSON-RPC error body."""
+    return ORJSONResponse(_error_body(request_id, code, message), status_code=status_code)
+
+
+# MCP initialize result - static for the process lifetime, only the id varies
+_INIT_RESULT = {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {
+        "tools": {
+            "listChanged": False,  # We don't support dynamic tool changes
+        },
+    },
+    "serverInfo": {
+        "name": "deribit-mcp-server",
+        "version": __version__,
+    },
+}
+
+
+# JSON-RPC success bodies - only the id (and tool output) vary. Ids may be
+# strings, so they are spliced in orjson-encoded rather than via %d.
+_RESULT_TEMPLATE = b'{"jsonrpc":"2.0","id":%b,"result":%b}'
+_TOOLS_CALL_TEMPLATE = (
+    b'{"jsonrpc":"2.0","id":%b,"result":{"content":[{"type":"text","text":%b}]}}'
+)
+_INIT_RESULT_BODY = dumps(_INIT_RESULT)
+
+
+async def _reply(session: SSESession, body: bytes, push_sse: bool) -> ORJSONResponse:
+    """Send an encoded JSON-RPC response over SSE (if requested) and as the HTTP body."""
+    if push_sse:
+        await session.send_raw(body)
+    return ORJSONResponse(body)
+
+
+async def _reply_error(
+    session: SSESession, request_id, code: int, message: str, push_sse: bool
+) -> ORJSONResponse:
+    """Send a JSON-RPC error over SSE (if requested) and as the HTTP body."""
+    return await _reply(session, _error_body(request_id, code, message), push_sse)
+
+
+async def _handle_tools_list(
+    session: SSESession, request_id, params: dict, push_sse: bool
+) -> ORJSONResponse:
+    tools_body = _tools_body(get_settings_view().enable_private)
+    return await _reply(session, _RESULT_TEMPLATE % (dumps(request_id), tools_body), push_sse)
+
+
+async def _handle_tools_call(
+    session: SSESession, request_id, params: dict, push_sse: bool
+) -> ORJSONResponse:
+    tool_name = params.get("name")
+    arguments = params.get("arguments", {})
+
+    if not tool_name:
+        return await _reply_error(session, request_id, -32602, "Missing tool name", push_sse)
+
+    try:
+        logger.info("Executing tool: %s for session %s...", tool_name, session.session_id[:8])
+        result = await _dispatch_tool(tool_name, arguments)
+
+        # MCP tools/call response format; the text content is the compact
+        # result JSON, encoded again as a JSON string
+        body = _TOOLS_CALL_TEMPLATE % (dumps(request_id), dumps(compact_json(result)))
+
+        # Send via SSE FIRST (client is waiting for this)
+        if push_sse:
+            await session.send_raw(body)
+            logger.info(
+                "Tool %s response sent via SSE for session %s...",
+                tool_name,
+                session.session_id[:8],
+            )
+
+            # Small delay to ensure SSE message is sent
+            await asyncio.sleep(0.05)
+
+        # Also return HTTP response
+        return ORJSONResponse(body)
+    except Exception as e:
+        return await _reply_error(session, request_id, -32000, str(e)[:200], push_sse)
+
+
+async def _handle_initialize(
+    session: SSESession, request_id, params: dict, push_sse: bool
+) -> ORJSONResponse:
+    # Handle MCP initialization - this is critical for client connection
+    logger.info(
+        "MCP initialize request for session %s (request_id: %s)",
+        session.session_id,
+        request_id,
+    )
+
+    # Build initialize response according to MCP spec; the id must match
+    # the client's request ID
+    body = _RESULT_TEMPLATE % (dumps(request_id), _INIT_RESULT_BODY)
+
+    # Send response via SSE FIRST (this is what the client is waiting for)
+    # The client is likely blocking on this response
+    if push_sse:
+        await session.send_raw(body)
+        logger.info("MCP initialize response sent via SSE for session %s", session.session_id)
+
+        # Small delay to ensure SSE message is sent before HTTP response
+        await asyncio.sleep(0.05)
+
+    # Also return HTTP response for compatibility
+    return ORJSONResponse(body)
+
+
+async def _handle_unknown_method(
+    session: SSESession, request_id, method: str, push_sse: bool
+) -> ORJSONResponse:
+    return await _reply_error(session, request_id, -32601, f"Unknown method: {method}", push_sse)
+
+
+_METHOD_HANDLERS = {
+    "tools/list": _handle_tools_list,
+    "tools/call": _handle_tools_call,
+    "initialize": _handle_initialize,
+}
+
+
+async def mcp_message_endpoint(request: Request) -> ORJSONResponse:
     """
     Handle MCP messages via HTTP POST.
 
@@ -489,37 +730,16 @@ async def mcp_message_endpoint(request: Request) -> JSONResponse:
     """
     # Parse request body
     try:
-        body = await request.json()
-    except json.JSONDecodeError as e:
-        logger.warning(f"Invalid JSON in request body: {e}")
-        return JSONResponse(
-            {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "error": {"code": -32700, "message": f"Parse error: Invalid JSON - {str(e)[:100]}"},
-            },
-            status_code=400,
-        )
+        body = loads(await request.body())
+    except JSONDecodeError as e:
+        logger.warning("Invalid JSON in request body: %s", e)
+        return _error_response(1, -32700, f"Parse error: Invalid JSON - {str(e)[:100]}")
     except Exception as e:
-        logger.error(f"Error parsing request body: {e}", exc_info=True)
-        return JSONResponse(
-            {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "error": {"code": -32600, "message": f"Invalid Request: {str(e)[:100]}"},
-            },
-            status_code=400,
-        )
+        logger.error("Error parsing request body: %s", e, exc_info=True)
+        return _error_response(1, -32600, f"Invalid Request: {str(e)[:100]}")
 
     if not isinstance(body, dict):
-        return JSONResponse(
-            {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "error": {"code": -32600, "message": "Invalid Request: Body must be a JSON object"},
-            },
-            status_code=400,
-        )
+        return _error_response(1, -32600, "Invalid Request: Body must be a JSON object")
 
     # Try to get session_id from header first, then body
     session_id = request.headers.get("X-Session-Id")
@@ -529,6 +749,11 @@ async def mcp_message_endpoint(request: Request) -> JSONResponse:
     method = body.get("method")
     params = body.get("params", {})
     request_id = body.get("id")
+
+    # Standard MCP SSE clients read responses from the stream. Clients that
+    # consume the HTTP response body can send "stream": false to skip the
+    # duplicate SSE push.
+    push_sse = body.get("stream", True) is not False
     
     # Generate request_id if not provided
     if request_id is None:
@@ -536,230 +761,97 @@ async def mcp_message_endpoint(request: Request) -> JSONResponse:
 
     # Validate required fields
     if not method:
-        return JSONResponse(
-            {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "error": {"code": -32600, "message": "Invalid Request: Missing 'method' field"},
-            },
-            status_code=400,
-        )
+        return _error_response(request_id, -32600, "Invalid Request: Missing 'method' field")
 
     if not session_id:
-        return JSONResponse(
-            {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "error": {"code": -32602, "message": "Invalid Params: Missing session_id (provide via X-Session-Id header or body)"},
-            },
-            status_code=400,
+        return _error_response(
+            request_id,
+            -32602,
+            "Invalid Params: Missing session_id (provide via X-Session-Id header or body)",
         )
     
-    if session_id not in _sessions:
+    session = _sessions.get(session_id)
+    if session is None:
         available_sessions = list(_sessions.keys())
         logger.warning(
-            f"Invalid session_id for method '{method}': {session_id[:8]}... "
-            f"(available: {len(available_sessions)} sessions)"
+            "Invalid session_id for method '%s': %s... (available: %d sessions)",
+            method,
+            session_id[:8],
+            len(available_sessions),
         )
         # Log recent sessions for debugging
         if available_sessions:
             recent = available_sessions[-5:]  # Show last 5 sessions
-            logger.info(f"Recent sessions: {[s[:8] + '...' for s in recent]}")
-            logger.debug(f"Full recent session IDs: {recent}")
+            logger.info("Recent sessions: %s", [s[:8] + '...' for s in recent])
+            logger.debug("Full recent session IDs: %s", recent)
         else:
             logger.warning("No active sessions available")
             
         # Check if this might be a timing issue (session created but not yet registered)
         # This shouldn't happen, but log it if it does
-        logger.debug(f"Request headers: X-Session-Id={request.headers.get('X-Session-Id')}")
-        logger.debug(f"Request body session_id: {body.get('session_id')}")
+        logger.debug("Request headers: X-Session-Id=%s", request.headers.get('X-Session-Id'))
+        logger.debug("Request body session_id: %s", body.get('session_id'))
         
-        return JSONResponse(
-            {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "error": {
-                    "code": -32602,
-                    "message": f"Invalid or expired session_id '{session_id[:8]}...'. Available sessions: {len(available_sessions)}",
-                },
-            },
-            status_code=400,
+        return _error_response(
+            request_id,
+            -32602,
+            f"Invalid or expired session_id '{session_id[:8]}...'. "
+            f"Available sessions: {len(available_sessions)}",
         )
 
-    session = _sessions[session_id]
-    
     # Mark activity to prevent timeout
     session.mark_activity()
     
     # Check if session is closed or timed out
     if session._closed or session.is_timed_out():
-        return JSONResponse(
-            {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "error": {"code": -32000, "message": "Session expired or closed"},
-            },
-            status_code=400,
-        )
+        return _error_response(request_id, -32000, "Session expired or closed")
     
-    logger.info(f"MCP message received: {method} (id={request_id}) for session {session_id[:8]}...")
-
-    # Handle MCP methods
-    if method == "tools/list":
-        settings = get_settings()
-        tools = get_public_tools()
-        if settings.enable_private:
-            tools.extend(get_private_tools())
-
-        tools_list = []
-        for tool in tools:
-            tools_list.append(
-                {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "inputSchema": tool.inputSchema,
-                }
-            )
-
-        response = {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "result": {"tools": tools_list},
-        }
-
-        # Send via SSE
-        await session.send("response", response)
-        return JSONResponse(response)
-
-    elif method == "tools/call":
-        tool_name = params.get("name")
-        arguments = params.get("arguments", {})
-
-        if not tool_name:
-            error_response = {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "error": {"code": -32602, "message": "Missing tool name"},
-            }
-            await session.send("response", error_response)
-            return JSONResponse(error_response)
-
-        try:
-            logger.info(f"Executing tool: {tool_name} for session {session_id[:8]}...")
-            result = await _dispatch_tool(tool_name, arguments)
-            
-            # MCP tools/call response format
-            response = {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "result": {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": _compact_json(result),
-                        }
-                    ],
-                },
-            }
-            
-            # Send via SSE FIRST (client is waiting for this)
-            await session.send("response", response)
-            logger.info(f"Tool {tool_name} response sent via SSE for session {session_id[:8]}...")
-            
-            # Small delay to ensure SSE message is sent
-            await asyncio.sleep(0.05)
-            
-            # Also return HTTP response
-            return JSONResponse(response)
-        except Exception as e:
-            error_response = {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "error": {"code": -32000, "message": str(e)[:200]},
-            }
-            await session.send("response", error_response)
-            return JSONResponse(error_response)
-
-    elif method == "initialize":
-        # Handle MCP initialization - this is critical for client connection
-        logger.info(f"MCP initialize request for session {session_id} (request_id: {request_id})")
-        
-        # Get capabilities based on configuration
-        settings = get_settings()
-        capabilities = {
-            "tools": {
-                "listChanged": False,  # We don't support dynamic tool changes
-            },
-        }
-        
-        # Build initialize response according to MCP spec
-        response = {
-            "jsonrpc": "2.0",
-            "id": request_id,  # Must match client's request ID
-            "result": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": capabilities,
-                "serverInfo": {
-                    "name": "deribit-mcp-server",
-                    "version": "1.0.0",
-                },
-            },
-        }
-        
-        # Send response via SSE FIRST (this is what the client is waiting for)
-        # The client is likely blocking on this response
-        await session.send("response", response)
-        logger.info(f"MCP initialize response sent via SSE for session {session_id}")
-        
-        # Small delay to ensure SSE message is sent before HTTP response
-        await asyncio.sleep(0.05)
-        
-        # Also return HTTP response for compatibility
-        return JSONResponse(response)
+    logger.info(
+        "MCP message received: %s (id=%s) for session %s...",
+        method,
+        request_id,
+        session_id[:8],
+    )
 
-    else:
-        error_response = {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "error": {"code": -32601, "message": f"Unknown method: {method}"},
-        }
-        await session.send("response", error_response)
-        return JSONResponse(error_response)
+    handler = _METHOD_HANDLERS.get(method)
+    if handler is None:
+        return await _handle_unknown_method(session, request_id, method, push_sse)
+    return await handler(session, request_id, params, push_sse)
 
 
-async def close_session_endpoint(request: Request) -> JSONResponse:
+async def close_session_endpoint(request: Request) -> ORJSONResponse:
     """Close an SSE session."""
     try:
-        body = await request.json()
+        body = loads(await request.body())
         session_id = body.get("session_id")
-    except json.JSONDecodeError:
+    except JSONDecodeError:
         session_id = request.query_params.get("session_id")
 
     if session_id and session_id in _sessions:
         session = _sessions[session_id]
         await session.close()
-        return JSONResponse({"status": "closed", "session_id": session_id})
+        return ORJSONResponse({"status": "closed", "session_id": session_id})
 
-    return JSONResponse(
+    return ORJSONResponse(
         {"error": True, "message": "Session not found"},
         status_code=404,
     )
 
 
-async def diagnostics_endpoint(request: Request) -> JSONResponse:
+async def diagnostics_endpoint(request: Request) -> ORJSONResponse:
     """Run full diagnostic tests."""
     try:
         results = await run_full_diagnostics()
-        return JSONResponse(results)
+        return ORJSONResponse(results)
     except Exception as e:
-        logger.error(f"Diagnostics error: {e}", exc_info=True)
-        return JSONResponse(
+        logger.error("Diagnostics error: %s", e, exc_info=True)
+        return ORJSONResponse(
             {"error": True, "message": str(e)[:200]},
             status_code=500,
         )
 
 
-async def test_connection_endpoint(request: Request) -> JSONResponse:
+async def test_connection_endpoint(request: Request) -> ORJSONResponse:
     """Quick connection test endpoint."""
     results = {
         "public_api": await test_public_api(),
@@ -769,7 +861,7 @@ async def test_connection_endpoint(request: Request) -> JSONResponse:
     if results["authentication"]["success"]:
         results["private_api"] = await test_private_api()
     
-    return JSONResponse(results)
+    return ORJSONResponse(results)
 
 
 # =============================================================================
@@ -777,44 +869,37 @@ async def test_connection_endpoint(request: Request) -> JSONResponse:
 # =============================================================================
 
 
+async def _close_all_sessions() -> None:
+    """
+    Close every active SSE session, one at a time.
+
+    close() only cancels timers and enqueues the close sentinel, so a plain
+    loop finishes quickly without creating a task per session.
+    """
+    for session in list(_sessions.values()):
+        try:
+            await session.close()
+        except Exception as e:
+            logger.debug("Error closing session %s: %s", session.session_id, e)
+
+
 @asynccontextmanager
 async def lifespan(app: Starlette):
     """Application lifespan handler."""
-    global _shutdown_event
-    _shutdown_event = asyncio.Event()
-    
     settings = get_settings()
     logger.info("Starting Deribit MCP HTTP Server")
-    logger.info(f"Configuration: {settings.get_safe_config_summary()}")
-
-    # Start cleanup task
-    cleanup_task = asyncio.create_task(_cleanup_stale_sessions())
+    logger.info("Configuration: %s", settings.get_safe_config_summary())
 
     try:
         yield
     finally:
-        # Signal shutdown
-        _shutdown_event.set()
-        
-        # Cancel cleanup task
-        cleanup_task.cancel()
-        try:
-            await cleanup_task
-        except asyncio.CancelledError:
-            pass
-
         # Close all active SSE sessions
-        logger.info(f"Closing {len(_sessions)} active SSE sessions...")
-        close_tasks = [session.close() for session in _sessions.values()]
-        if close_tasks:
-            try:
-                # Wait up to 5 seconds for sessions to close gracefully
-                await asyncio.wait_for(
-                    asyncio.gather(*close_tasks, return_exceptions=True),
-                    timeout=5.0
-                )
-            except asyncio.TimeoutError:
-                logger.warning("Some SSE sessions did not close within timeout")
+        logger.info("Closing %s active SSE sessions...", len(_sessions))
+        try:
+            # Wait up to 5 seconds for sessions to close gracefully
+            await asyncio.wait_for(_close_all_sessions(), timeout=5.0)
+        except asyncio.TimeoutError:
+            logger.warning("Some SSE sessions did not close within timeout")
         _sessions.clear()
 
         # Cleanup client
@@ -834,7 +919,26 @@ routes = [
     Route("/mcp/session/close", close_session_endpoint, methods=["POST"]),
 ]
 
-# CORS middleware for web clients
+
+
+class StreamSafeGZipMiddleware(GZipMiddleware):
+    """
+    GZip for regular responses that never touches the SSE stream.
+
+    Compressing text/event-stream buffers frames and breaks incremental
+    delivery. Older Starlette releases do not exclude it, so the stream
+    route is bypassed by path.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] == "/sse":
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# CORS middleware for web clients; large tool results (instruments, surface
+# snapshots) are gzipped at a cheap compression level
 middleware = [
     Middleware(
         CORSMiddleware,
@@ -843,6 +947,7 @@ middleware = [
         allow_methods=["*"],
         allow_headers=["*"],
     ),
+    Middleware(StreamSafeGZipMiddleware, minimum_size=1024, compresslevel=1),
 ]
 
 # Create Starlette application
@@ -854,11 +959,27 @@ app = Starlette(
 )
 
 
+def _resolve_workers(configured: int) -> int:
+    """Resolve the worker count, where 0 means one per CPU available to this process."""
+    if configured > 0:
+        return configured
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
 def main():
     """Main entry point for HTTP server."""
     settings = get_settings()
+    workers = _resolve_workers(settings.workers)
 
-    logger.info(f"Starting HTTP server on {settings.host}:{settings.port}")
+    logger.info(
+        "Starting HTTP server on %s:%s (workers: %s)", settings.host, settings.port, workers
+    )
+    if workers > 1:
+        # SSE sessions live in process memory; /mcp/message must reach the
+        # worker that owns the stream, so a load balancer needs sticky routing
+        logger.warning("Multiple workers: route X-Session-Id requests to the same worker")
 
     uvicorn.run(
         "deribit_mcp.http_server:app",
@@ -866,6 +987,12 @@ def main():
         port=settings.port,
         log_level="info",
         reload=False,
+        workers=workers,
+        timeout_keep_alive=75,
+        # "auto" selects uvloop and httptools (both dependencies) when they
+        # are importable, and falls back to asyncio/h11 on other platforms
+        loop="auto",
+        http="auto",
     )
 
 
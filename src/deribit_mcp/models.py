@@ -7,7 +7,7 @@ Field names are kept short for token efficiency.
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # Type aliases
 Currency = Literal["BTC", "ETH"]
@@ -15,12 +15,23 @@ InstrumentKind = Literal["option", "future"]
 OptionType = Literal["call", "put"]
 
 
+class CompactModel(BaseModel):
+    """
+    Base for tool output models.
+
+    Outputs are built once and only serialized afterwards, so they are
+    frozen: shared instances cannot be mutated by accident.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+
 # =============================================================================
 # Status Models
 # =============================================================================
 
 
-class StatusResponse(BaseModel):
+class StatusResponse(CompactModel):
     """Response from deribit_status tool."""
 
     env: str = Field(description="Environment: prod or test")
@@ -34,7 +45,7 @@ class StatusResponse(BaseModel):
 # =============================================================================
 
 
-class InstrumentCompact(BaseModel):
+class InstrumentCompact(CompactModel):
     """Compact instrument representation (minimal fields)."""
 
     name: str = Field(description="Instrument name")
@@ -45,7 +56,7 @@ class InstrumentCompact(BaseModel):
     size: float = Field(description="Contract size")
 
 
-class InstrumentsResponse(BaseModel):
+class InstrumentsResponse(CompactModel):
     """Response from deribit_instruments tool."""
 
     count: int = Field(description="Total instruments matching")
@@ -58,7 +69,7 @@ class InstrumentsResponse(BaseModel):
 # =============================================================================
 
 
-class GreeksCompact(BaseModel):
+class GreeksCompact(CompactModel):
     """Compact greeks for options."""
 
     delta: float | None = None
@@ -67,7 +78,7 @@ class GreeksCompact(BaseModel):
     theta: float | None = None
 
 
-class TickerResponse(BaseModel):
+class TickerResponse(CompactModel):
     """Response from deribit_ticker tool - compact market snapshot."""
 
     inst: str = Field(description="Instrument name")
@@ -91,14 +102,14 @@ class TickerResponse(BaseModel):
 # =============================================================================
 
 
-class PriceLevel(BaseModel):
+class PriceLevel(CompactModel):
     """Single price level."""
 
     p: float = Field(description="Price")
     q: float = Field(description="Quantity")
 
 
-class OrderBookSummaryResponse(BaseModel):
+class OrderBookSummaryResponse(CompactModel):
     """Response from deribit_orderbook_summary tool."""
 
     inst: str = Field(description="Instrument name")
@@ -119,7 +130,7 @@ class OrderBookSummaryResponse(BaseModel):
 # =============================================================================
 
 
-class DvolResponse(BaseModel):
+class DvolResponse(CompactModel):
     """Response from dvol_snapshot tool."""
 
     ccy: Currency = Field(description="Currency")
@@ -130,7 +141,7 @@ class DvolResponse(BaseModel):
     notes: list[str] = Field(default_factory=list, max_length=6)
 
 
-class TenorIV(BaseModel):
+class TenorIV(CompactModel):
     """IV data for a specific tenor."""
 
     days: int = Field(description="Days to expiration")
@@ -140,7 +151,7 @@ class TenorIV(BaseModel):
     fwd: float | None = Field(default=None, description="Forward price")
 
 
-class SurfaceResponse(BaseModel):
+class SurfaceResponse(CompactModel):
     """Response from options_surface_snapshot tool."""
 
     ccy: Currency = Field(description="Currency")
@@ -156,7 +167,7 @@ class SurfaceResponse(BaseModel):
 # =============================================================================
 
 
-class ExpectedMoveResponse(BaseModel):
+class ExpectedMoveResponse(CompactModel):
     """Response from expected_move_iv tool."""
 
     ccy: Currency = Field(description="Currency")
@@ -172,19 +183,26 @@ class ExpectedMoveResponse(BaseModel):
     notes: list[str] = Field(default_factory=list, max_length=6)
 
 
+class MarketIVResponse(CompactModel):
+    """Response from market_iv_snapshot tool (surface + expected move)."""
+
+    surface: SurfaceResponse = Field(description="Volatility surface snapshot")
+    move: ExpectedMoveResponse = Field(description="1σ expected move")
+
+
 # =============================================================================
 # Funding Models
 # =============================================================================
 
 
-class FundingEntry(BaseModel):
+class FundingEntry(CompactModel):
     """Single funding rate entry."""
 
     ts: int = Field(description="Timestamp ms")
     rate: float = Field(description="Funding rate")
 
 
-class FundingResponse(BaseModel):
+class FundingResponse(CompactModel):
     """Response from funding_snapshot tool."""
 
     ccy: Currency = Field(description="Currency")
@@ -201,7 +219,7 @@ class FundingResponse(BaseModel):
 # =============================================================================
 
 
-class AccountSummaryResponse(BaseModel):
+class AccountSummaryResponse(CompactModel):
     """Response from account_summary tool (private)."""
 
     ccy: Currency
@@ -214,7 +232,7 @@ class AccountSummaryResponse(BaseModel):
     notes: list[str] = Field(default_factory=list, max_length=6)
 
 
-class PositionCompact(BaseModel):
+class PositionCompact(CompactModel):
     """Compact position representation."""
 
     inst: str = Field(description="Instrument name")
@@ -226,7 +244,7 @@ class PositionCompact(BaseModel):
     liq: float | None = Field(default=None, description="Liquidation price")
 
 
-class PositionsResponse(BaseModel):
+class PositionsResponse(CompactModel):
     """Response from positions tool (private)."""
 
     ccy: Currency
@@ -235,7 +253,7 @@ class PositionsResponse(BaseModel):
     notes: list[str] = Field(default_factory=list, max_length=6)
 
 
-class OrderCompact(BaseModel):
+class OrderCompact(CompactModel):
     """Compact order representation."""
 
     id: str = Field(description="Order ID")
@@ -248,7 +266,7 @@ class OrderCompact(BaseModel):
     state: str = Field(description="Order state")
 
 
-class OpenOrdersResponse(BaseModel):
+class OpenOrdersResponse(CompactModel):
     """Response from open_orders tool (private)."""
 
     count: int = Field(description="Total open orders")
@@ -268,7 +286,7 @@ class PlaceOrderRequest(BaseModel):
     reduce_only: bool = Field(default=False, description="Reduce-only flag")
 
 
-class PlaceOrderResponse(BaseModel):
+class PlaceOrderResponse(CompactModel):
     """Response from place_order tool (private)."""
 
     dry_run: bool = Field(description="Whether this was a dry run")
@@ -283,7 +301,7 @@ class PlaceOrderResponse(BaseModel):
 # =============================================================================
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(CompactModel):
     """Standard error response."""
 
     error: bool = True
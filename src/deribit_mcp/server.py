@@ -14,20 +14,25 @@ Usage:
 """
 
 import asyncio
-import json
 import logging
 import sys
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
 from typing import Any
 
+import fastjsonschema
 from mcp.server import Server
+from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import (
     TextContent,
     Tool,
 )
+from pydantic import BaseModel
 
+from ._json import compact_json, dumps
 from .client import get_client, shutdown_client
-from .config import get_settings, sanitize_log_message
+from .config import get_settings, get_settings_view, sanitize_log_message
 from .models import PlaceOrderRequest
 from .tools import (
     account_summary,
@@ -39,6 +44,7 @@ from .tools import (
     dvol_snapshot,
     expected_move_iv,
     funding_snapshot,
+    market_iv_snapshot,
     open_orders,
     options_surface_snapshot,
     place_order,
@@ -58,288 +64,288 @@ logger = logging.getLogger("deribit_mcp")
 server = Server("deribit-mcp-server")
 
 
-def _compact_json(data: dict) -> str:
-    """Convert dict to compact JSON string."""
-    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
-
-
 # =============================================================================
 # Tool Definitions
 # =============================================================================
 
 
-def get_public_tools() -> list[Tool]:
-    """Get list of public (read-only) tools."""
-    return [
-        Tool(
-            name="deribit_status",
-            description="Check Deribit API connectivity and status. Returns environment, API status, and server time.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": [],
-            },
-        ),
-        Tool(
-            name="deribit_instruments",
-            description="Get available instruments for BTC/ETH. Returns compact list (max 50) with nearest expirations for options.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "currency": {
-                        "type": "string",
-                        "enum": ["BTC", "ETH"],
-                        "description": "Currency: BTC or ETH",
-                    },
-                    "kind": {
-                        "type": "string",
-                        "enum": ["option", "future"],
-                        "default": "option",
-                        "description": "Instrument kind",
-                    },
-                    "expired": {
-                        "type": "boolean",
-                        "default": False,
-                        "description": "Include expired instruments",
-                    },
+# Schema fragments shared by several tools (referenced, not copied)
+_CURRENCY_FIELD = {
+    "type": "string",
+    "enum": ["BTC", "ETH"],
+    "description": "Currency: BTC or ETH",
+}
+_CURRENCY_ONLY_SCHEMA = {
+    "type": "object",
+    "properties": {"currency": _CURRENCY_FIELD},
+    "required": ["currency"],
+}
+
+# Tool definitions are fixed for the process lifetime and built once at import.
+# The lists are shared - callers must not mutate them.
+_PUBLIC_TOOLS: list[Tool] = [
+    Tool(
+        name="deribit_status",
+        description="Check Deribit API connectivity and status. Returns environment, API status, and server time.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+    ),
+    Tool(
+        name="deribit_instruments",
+        description="Get available instruments for BTC/ETH. Returns compact list (max 50) with nearest expirations for options.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "currency": _CURRENCY_FIELD,
+                "kind": {
+                    "type": "string",
+                    "enum": ["option", "future"],
+                    "default": "option",
+                    "description": "Instrument kind",
                 },
-                "required": ["currency"],
-            },
-        ),
-        Tool(
-            name="deribit_ticker",
-            description="Get compact ticker snapshot for an instrument. Includes price, IV, greeks (for options), funding (for perps).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "instrument_name": {
-                        "type": "string",
-                        "description": "Full instrument name (e.g., BTC-PERPETUAL, BTC-28JUN24-70000-C)",
-                    },
+                "expired": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Include expired instruments",
                 },
-                "required": ["instrument_name"],
             },
-        ),
-        Tool(
-            name="deribit_orderbook_summary",
-            description="Get order book summary with top 5 levels and depth metrics. Does NOT return full orderbook.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "instrument_name": {
-                        "type": "string",
-                        "description": "Full instrument name",
-                    },
-                    "depth": {
-                        "type": "integer",
-                        "default": 20,
-                        "minimum": 1,
-                        "maximum": 20,
-                        "description": "Depth to fetch (max 20)",
-                    },
+            "required": ["currency"],
+        },
+    ),
+    Tool(
+        name="deribit_ticker",
+        description="Get compact ticker snapshot for an instrument. Includes price, IV, greeks (for options), funding (for perps).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "instrument_name": {
+                    "type": "string",
+                    "description": "Full instrument name (e.g., BTC-PERPETUAL, BTC-28JUN24-70000-C)",
                 },
-                "required": ["instrument_name"],
             },
-        ),
-        Tool(
-            name="dvol_snapshot",
-            description="Get DVOL (Deribit Volatility Index) snapshot. DVOL represents 30-day implied volatility.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "currency": {
-                        "type": "string",
-                        "enum": ["BTC", "ETH"],
-                        "description": "Currency: BTC or ETH",
-                    },
+            "required": ["instrument_name"],
+        },
+    ),
+    Tool(
+        name="deribit_orderbook_summary",
+        description="Get order book summary with top 5 levels and depth metrics. Does NOT return full orderbook.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "instrument_name": {
+                    "type": "string",
+                    "description": "Full instrument name",
                 },
-                "required": ["currency"],
-            },
-        ),
-        Tool(
-            name="options_surface_snapshot",
-            description="Get volatility surface snapshot with ATM IV, risk reversal (25d), and butterfly (25d) for key tenors.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "currency": {
-                        "type": "string",
-                        "enum": ["BTC", "ETH"],
-                        "description": "Currency: BTC or ETH",
-                    },
-                    "tenor_days": {
-                        "type": "array",
-                        "items": {"type": "integer"},
-                        "default": [7, 14, 30, 60],
-                        "description": "Target tenors in days",
-                    },
+                "depth": {
+                    "type": "integer",
+                    "default": 20,
+                    "minimum": 1,
+                    "maximum": 20,
+                    "description": "Depth to fetch (max 20)",
                 },
-                "required": ["currency"],
             },
-        ),
-        Tool(
-            name="expected_move_iv",
-            description="Calculate expected price move (1σ) based on IV. Formula: move = spot × IV × √(T_years). Returns bands and move in points/bps.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "currency": {
-                        "type": "string",
-                        "enum": ["BTC", "ETH"],
-                        "description": "Currency: BTC or ETH",
-                    },
-                    "horizon_minutes": {
-                        "type": "integer",
-                        "default": 60,
-                        "minimum": 1,
-                        "maximum": 10080,
-                        "description": "Time horizon in minutes (default: 60)",
-                    },
-                    "method": {
-                        "type": "string",
-                        "enum": ["dvol", "atm_iv"],
-                        "default": "dvol",
-                        "description": "IV source: dvol or atm_iv",
-                    },
+            "required": ["instrument_name"],
+        },
+    ),
+    Tool(
+        name="dvol_snapshot",
+        description="Get DVOL (Deribit Volatility Index) snapshot. DVOL represents 30-day implied volatility.",
+        inputSchema=_CURRENCY_ONLY_SCHEMA,
+    ),
+    Tool(
+        name="options_surface_snapshot",
+        description="Get volatility surface snapshot with ATM IV, risk reversal (25d), and butterfly (25d) for key tenors.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "currency": _CURRENCY_FIELD,
+                "tenor_days": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "default": [7, 14, 30, 60],
+                    "description": "Target tenors in days",
                 },
-                "required": ["currency"],
             },
-        ),
-        Tool(
-            name="funding_snapshot",
-            description="Get perpetual funding rate snapshot with current rate and recent history (last 5 periods).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "currency": {
-                        "type": "string",
-                        "enum": ["BTC", "ETH"],
-                        "description": "Currency: BTC or ETH",
-                    },
+            "required": ["currency"],
+        },
+    ),
+    Tool(
+        name="expected_move_iv",
+        description="Calculate expected price move (1σ) based on IV. Formula: move = spot × IV × √(T_years). Returns bands and move in points/bps.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "currency": _CURRENCY_FIELD,
+                "horizon_minutes": {
+                    "type": "integer",
+                    "default": 60,
+                    "minimum": 1,
+                    "maximum": 10080,
+                    "description": "Time horizon in minutes (default: 60)",
+                },
+                "method": {
+                    "type": "string",
+                    "enum": ["dvol", "atm_iv"],
+                    "default": "dvol",
+                    "description": "IV source: dvol or atm_iv",
                 },
-                "required": ["currency"],
             },
-        ),
-    ]
-
-
-def get_private_tools() -> list[Tool]:
-    """Get list of private (authenticated) tools."""
-    return [
-        Tool(
-            name="account_summary",
-            description="[PRIVATE] Get account summary with equity, margin, and delta. Requires DERIBIT_ENABLE_PRIVATE=true.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "currency": {
-                        "type": "string",
-                        "enum": ["BTC", "ETH"],
-                        "description": "Currency: BTC or ETH",
-                    },
+            "required": ["currency"],
+        },
+    ),
+    Tool(
+        name="funding_snapshot",
+        description="Get perpetual funding rate snapshot with current rate and recent history (last 5 periods).",
+        inputSchema=_CURRENCY_ONLY_SCHEMA,
+    ),
+    Tool(
+        name="market_iv_snapshot",
+        description="Get volatility surface and expected move (1σ) in one call. Same outputs as options_surface_snapshot + expected_move_iv (dvol, ATM fallback) with shared API calls.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "currency": _CURRENCY_FIELD,
+                "tenor_days": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "default": [7, 14, 30, 60],
+                    "description": "Target tenors in days",
+                },
+                "horizon_minutes": {
+                    "type": "integer",
+                    "default": 60,
+                    "minimum": 1,
+                    "maximum": 10080,
+                    "description": "Expected move horizon in minutes (default: 60)",
                 },
-                "required": ["currency"],
             },
-        ),
-        Tool(
-            name="positions",
-            description="[PRIVATE] Get open positions (max 20). Requires DERIBIT_ENABLE_PRIVATE=true.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "currency": {
-                        "type": "string",
-                        "enum": ["BTC", "ETH"],
-                        "description": "Currency: BTC or ETH",
-                    },
-                    "kind": {
-                        "type": "string",
-                        "enum": ["future", "option"],
-                        "default": "future",
-                        "description": "Instrument kind",
-                    },
+            "required": ["currency"],
+        },
+    ),
+]
+
+
+_PRIVATE_TOOLS: list[Tool] = [
+    Tool(
+        name="account_summary",
+        description="[PRIVATE] Get account summary with equity, margin, and delta. Requires DERIBIT_ENABLE_PRIVATE=true.",
+        inputSchema=_CURRENCY_ONLY_SCHEMA,
+    ),
+    Tool(
+        name="positions",
+        description="[PRIVATE] Get open positions (max 20). Requires DERIBIT_ENABLE_PRIVATE=true.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "currency": _CURRENCY_FIELD,
+                "kind": {
+                    "type": "string",
+                    "enum": ["future", "option"],
+                    "default": "future",
+                    "description": "Instrument kind",
                 },
-                "required": ["currency"],
             },
-        ),
-        Tool(
-            name="open_orders",
-            description="[PRIVATE] Get open orders (max 20). Requires DERIBIT_ENABLE_PRIVATE=true.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "currency": {
-                        "type": "string",
-                        "enum": ["BTC", "ETH"],
-                        "description": "Currency: BTC or ETH (optional if instrument_name provided)",
-                    },
-                    "instrument_name": {
-                        "type": "string",
-                        "description": "Specific instrument (optional)",
-                    },
+            "required": ["currency"],
+        },
+    ),
+    Tool(
+        name="open_orders",
+        description="[PRIVATE] Get open orders (max 20). Requires DERIBIT_ENABLE_PRIVATE=true.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "currency": {
+                    "type": "string",
+                    "enum": ["BTC", "ETH"],
+                    "description": "Currency: BTC or ETH (optional if instrument_name provided)",
+                },
+                "instrument_name": {
+                    "type": "string",
+                    "description": "Specific instrument (optional)",
                 },
-                "required": [],
             },
-        ),
-        Tool(
-            name="place_order",
-            description="[PRIVATE] Place an order. SAFETY: Runs in DRY_RUN mode by default. Set DERIBIT_DRY_RUN=false for live trading.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "instrument": {
-                        "type": "string",
-                        "description": "Instrument name",
-                    },
-                    "side": {
-                        "type": "string",
-                        "enum": ["buy", "sell"],
-                        "description": "Order side",
-                    },
-                    "type": {
-                        "type": "string",
-                        "enum": ["limit", "market"],
-                        "default": "limit",
-                        "description": "Order type",
-                    },
-                    "amount": {
-                        "type": "number",
-                        "minimum": 0,
-                        "description": "Order amount",
-                    },
-                    "price": {
-                        "type": "number",
-                        "description": "Limit price (required for limit orders)",
-                    },
-                    "post_only": {
-                        "type": "boolean",
-                        "default": False,
-                        "description": "Post-only flag",
-                    },
-                    "reduce_only": {
-                        "type": "boolean",
-                        "default": False,
-                        "description": "Reduce-only flag",
-                    },
+            "required": [],
+        },
+    ),
+    Tool(
+        name="place_order",
+        description="[PRIVATE] Place an order. SAFETY: Runs in DRY_RUN mode by default. Set DERIBIT_DRY_RUN=false for live trading.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "instrument": {
+                    "type": "string",
+                    "description": "Instrument name",
+                },
+                "side": {
+                    "type": "string",
+                    "enum": ["buy", "sell"],
+                    "description": "Order side",
+                },
+                "type": {
+                    "type": "string",
+                    "enum": ["limit", "market"],
+                    "default": "limit",
+                    "description": "Order type",
+                },
+                "amount": {
+                    "type": "number",
+                    "minimum": 0,
+                    "description": "Order amount",
+                },
+                "price": {
+                    "type": "number",
+                    "description": "Limit price (required for limit orders)",
+                },
+                "post_only": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Post-only flag",
+                },
+                "reduce_only": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Reduce-only flag",
                 },
-                "required": ["instrument", "side", "amount"],
             },
-        ),
-        Tool(
-            name="cancel_order",
-            description="[PRIVATE] Cancel an order. Respects DRY_RUN mode.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "order_id": {
-                        "type": "string",
-                        "description": "Order ID to cancel",
-                    },
+            "required": ["instrument", "side", "amount"],
+        },
+    ),
+    Tool(
+        name="cancel_order",
+        description="[PRIVATE] Cancel an order. Respects DRY_RUN mode.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "order_id": {
+                    "type": "string",
+                    "description": "Order ID to cancel",
                 },
-                "required": ["order_id"],
             },
-        ),
-    ]
+            "required": ["order_id"],
+        },
+    ),
+]
+
+
+def get_public_tools() -> list[Tool]:
+    """Get list of public (read-only) tools."""
+    return _PUBLIC_TOOLS
+
+
+def get_private_tools() -> list[Tool]:
+    """Get list of private (authenticated) tools."""
+    return _PRIVATE_TOOLS
+
+
+_ALL_TOOLS: list[Tool] = _PUBLIC_TOOLS + _PRIVATE_TOOLS
+
+# Argument validators, compiled once from the tool input schemas. Each
+# validator returns the arguments with schema defaults filled in.
+_VALIDATORS = {tool.name: fastjsonschema.compile(tool.inputSchema) for tool in _ALL_TOOLS}
 
 
 # =============================================================================
@@ -350,142 +356,65 @@ def get_private_tools() -> list[Tool]:
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """List all available tools."""
-    settings = get_settings()
-    tools = get_public_tools()
-
-    if settings.enable_private:
-        tools.extend(get_private_tools())
+    if get_settings_view().enable_private:
         logger.info("Private tools enabled")
+        return _ALL_TOOLS
 
-    return tools
+    return _PUBLIC_TOOLS
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Execute a tool and return results."""
-    logger.info(f"Tool called: {name}")
-    logger.debug(f"Arguments: {sanitize_log_message(str(arguments))}")
+    logger.info("Tool called: %s", name)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Arguments: %s", sanitize_log_message(str(arguments)))
 
     try:
         result = await _dispatch_tool(name, arguments)
-        json_result = _compact_json(result)
+        json_bytes = dumps(result)
 
-        # Log result size for monitoring
-        result_size = len(json_result)
+        # Log result size for monitoring (encoded bytes, no extra encode pass)
+        result_size = len(json_bytes)
         if result_size > 5000:
-            logger.warning(f"Tool {name} returned {result_size} bytes (exceeds 5KB target)")
+            logger.warning("Tool %s returned %d bytes (exceeds 5KB target)", name, result_size)
         elif result_size > 2000:
-            logger.info(f"Tool {name} returned {result_size} bytes (exceeds 2KB soft target)")
+            logger.info("Tool %s returned %d bytes (exceeds 2KB soft target)", name, result_size)
 
-        return [TextContent(type="text", text=json_result)]
+        # TextContent only accepts str, so decode once at the very end
+        return [TextContent(type="text", text=json_bytes.decode())]
 
     except Exception as e:
-        logger.error(f"Tool {name} error: {e}")
+        logger.error("Tool %s error: %s", name, e)
         error_result = {
             "error": True,
             "code": -1,
             "message": str(e)[:200],
             "notes": ["internal_error"],
         }
-        return [TextContent(type="text", text=_compact_json(error_result))]
-
-
-async def _dispatch_tool(name: str, arguments: dict[str, Any]) -> dict:
-    """Dispatch tool call to appropriate handler."""
-    client = get_client()
-
-    # Public tools
-    if name == "deribit_status":
-        return await deribit_status(client=client)
-
-    elif name == "deribit_instruments":
-        return await deribit_instruments(
-            currency=arguments["currency"],
-            kind=arguments.get("kind", "option"),
-            expired=arguments.get("expired", False),
-            client=client,
-        )
-
-    elif name == "deribit_ticker":
-        return await deribit_ticker(
-            instrument_name=arguments["instrument_name"],
-            client=client,
-        )
-
-    elif name == "deribit_orderbook_summary":
-        return await deribit_orderbook_summary(
-            instrument_name=arguments["instrument_name"],
-            depth=arguments.get("depth", 20),
-            client=client,
-        )
-
-    elif name == "dvol_snapshot":
-        return await dvol_snapshot(
-            currency=arguments["currency"],
-            client=client,
-        )
-
-    elif name == "options_surface_snapshot":
-        return await options_surface_snapshot(
-            currency=arguments["currency"],
-            tenor_days=arguments.get("tenor_days"),
-            client=client,
-        )
-
-    elif name == "expected_move_iv":
-        return await expected_move_iv(
-            currency=arguments["currency"],
-            horizon_minutes=arguments.get("horizon_minutes", 60),
-            method=arguments.get("method", "dvol"),
-            client=client,
-        )
-
-    elif name == "funding_snapshot":
-        return await funding_snapshot(
-            currency=arguments["currency"],
-            client=client,
-        )
-
-    # Private tools
-    elif name == "account_summary":
-        return await account_summary(
-            currency=arguments["currency"],
-            client=client,
-        )
-
-    elif name == "positions":
-        return await positions(
-            currency=arguments["currency"],
-            kind=arguments.get("kind", "future"),
-            client=client,
-        )
-
-    elif name == "open_orders":
-        return await open_orders(
-            currency=arguments.get("currency"),
-            instrument_name=arguments.get("instrument_name"),
-            client=client,
-        )
-
-    elif name == "place_order":
-        request = PlaceOrderRequest(
-            instrument=arguments["instrument"],
-            side=arguments["side"],
-            type=arguments.get("type", "limit"),
-            amount=arguments["amount"],
-            price=arguments.get("price"),
-            post_only=arguments.get("post_only", False),
-            reduce_only=arguments.get("reduce_only", False),
-        )
-        return await place_order(request=request, client=client)
-
-    elif name == "cancel_order":
-        return await cancel_order(
-            order_id=arguments["order_id"],
-            client=client,
-        )
-
-    else:
+        return [TextContent(type="text", text=compact_json(error_result))]
+
+
+async def _dispatch_tool(name: str, arguments: dict[str, Any]) -> BaseModel | dict:
+    """
+    Dispatch tool call to appropriate handler.
+
+    Tools return their response model; encode it with compact_json.
+    """
+    validate = _VALIDATORS.get(name)
+    if validate is not None:
+        try:
+            arguments = validate(arguments)
+        except fastjsonschema.JsonSchemaException as e:
+            return {
+                "error": True,
+                "code": 400,
+                "message": f"Invalid arguments: {e.message}"[:200],
+                "notes": ["invalid_params"],
+            }
+
+    handler = _HANDLERS.get(name)
+    if handler is None:
         return {
             "error": True,
             "code": 404,
@@ -493,24 +422,118 @@ async def _dispatch_tool(name: str, arguments: dict[str, Any]) -> dict:
             "notes": [],
         }
 
+    return await handler(arguments, get_client())
+
+
+def _place_order(arguments: dict[str, Any], client) -> Awaitable[BaseModel]:
+    request = PlaceOrderRequest(
+        instrument=arguments["instrument"],
+        side=arguments["side"],
+        type=arguments["type"],
+        amount=arguments["amount"],
+        price=arguments.get("price"),
+        post_only=arguments["post_only"],
+        reduce_only=arguments["reduce_only"],
+    )
+    return place_order(request=request, client=client)
+
+
+# Tool name -> adapter mapping validated arguments onto the tool function.
+# The validators fill in schema defaults, so defaulted keys are always present.
+_HANDLERS: dict[str, Callable[[dict[str, Any], Any], Awaitable[BaseModel | dict]]] = {
+    # Public tools
+    "deribit_status": lambda args, client: deribit_status(client=client),
+    "deribit_instruments": lambda args, client: deribit_instruments(
+        currency=args["currency"],
+        kind=args["kind"],
+        expired=args["expired"],
+        client=client,
+    ),
+    "deribit_ticker": lambda args, client: deribit_ticker(
+        instrument_name=args["instrument_name"],
+        client=client,
+    ),
+    "deribit_orderbook_summary": lambda args, client: deribit_orderbook_summary(
+        instrument_name=args["instrument_name"],
+        depth=args["depth"],
+        client=client,
+    ),
+    "dvol_snapshot": lambda args, client: dvol_snapshot(
+        currency=args["currency"],
+        client=client,
+    ),
+    "options_surface_snapshot": lambda args, client: options_surface_snapshot(
+        currency=args["currency"],
+        tenor_days=args["tenor_days"],
+        client=client,
+    ),
+    "expected_move_iv": lambda args, client: expected_move_iv(
+        currency=args["currency"],
+        horizon_minutes=args["horizon_minutes"],
+        method=args["method"],
+        client=client,
+    ),
+    "funding_snapshot": lambda args, client: funding_snapshot(
+        currency=args["currency"],
+        client=client,
+    ),
+    "market_iv_snapshot": lambda args, client: market_iv_snapshot(
+        currency=args["currency"],
+        tenor_days=args["tenor_days"],
+        horizon_minutes=args["horizon_minutes"],
+        client=client,
+    ),
+    # Private tools
+    "account_summary": lambda args, client: account_summary(
+        currency=args["currency"],
+        client=client,
+    ),
+    "positions": lambda args, client: positions(
+        currency=args["currency"],
+        kind=args["kind"],
+        client=client,
+    ),
+    "open_orders": lambda args, client: open_orders(
+        currency=args.get("currency"),
+        instrument_name=args.get("instrument_name"),
+        client=client,
+    ),
+    "place_order": _place_order,
+    "cancel_order": lambda args, client: cancel_order(
+        order_id=args["order_id"],
+        client=client,
+    ),
+}
+
 
 # =============================================================================
 # Server Entry Point
 # =============================================================================
 
 
+@lru_cache(maxsize=1)
+def _initialization_options() -> InitializationOptions:
+    """
+    Build the MCP initialization options once.
+
+    Built lazily rather than at import: the capabilities are derived from the
+    handlers registered above, so this must run after they exist.
+    """
+    return server.create_initialization_options()
+
+
 async def run_stdio():
     """Run the MCP server using stdio transport."""
     settings = get_settings()
     logger.info("Starting Deribit MCP Server (stdio mode)")
-    logger.info(f"Configuration: {settings.get_safe_config_summary()}")
+    logger.info("Configuration: %s", settings.get_safe_config_summary())
 
     try:
         async with stdio_server() as (read_stream, write_stream):
             await server.run(
                 read_stream,
                 write_stream,
-                server.create_initialization_options(),
+                _initialization_options(),
             )
     finally:
         await shutdown_client()
@@ -524,7 +547,7 @@ def main():
     except KeyboardInterrupt:
         logger.info("Received interrupt signal")
     except Exception as e:
-        logger.error(f"Server error: {e}")
+        logger.error("Server error: %s", e)
         sys.exit(1)
 
 
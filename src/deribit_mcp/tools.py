@@ -1,13 +1,22 @@
 """
 MCP Tools implementation for Deribit API.
 
-All tools return compact JSON (≤2KB target).
+All tools return compact response models (≤2KB JSON target).
 Each tool handles errors gracefully with degraded responses.
 """
 
+import asyncio
+import bisect
+import heapq
+import itertools
 import logging
 import time
-from typing import Any, Literal
+from collections.abc import Awaitable, Iterable
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any, Literal, NamedTuple, TypeVar, overload
+
+from pydantic import TypeAdapter
 
 from .analytics import (
     calculate_butterfly,
@@ -19,7 +28,7 @@ from .analytics import (
     spread_in_bps,
 )
 from .client import DeribitError, DeribitJsonRpcClient, get_client
-from .config import Currency, InstrumentKind, get_settings
+from .config import Currency, InstrumentKind, get_settings, get_settings_view
 from .models import (
     AccountSummaryResponse,
     DvolResponse,
@@ -30,6 +39,7 @@ from .models import (
     GreeksCompact,
     InstrumentCompact,
     InstrumentsResponse,
+    MarketIVResponse,
     OpenOrdersResponse,
     OrderBookSummaryResponse,
     OrderCompact,
@@ -46,14 +56,39 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Batch validators for list fields; one pydantic-core call per list instead
+# of one model construction per item
+_INSTRUMENT_LIST_ADAPTER = TypeAdapter(list[InstrumentCompact])
+_LEVEL_LIST_ADAPTER = TypeAdapter(list[PriceLevel])
+
 
 def _current_ts_ms() -> int:
     """Get current timestamp in milliseconds."""
-    return int(time.time() * 1000)
+    # Integer-only; no float multiply or rounding
+    return time.time_ns() // 1_000_000
+
+
+def _quantized_ts_ms(step_ms: int = 60_000) -> int:
+    """
+    Current timestamp in ms, floored to step_ms.
+
+    Used for history query windows so repeated calls within a step share the
+    same params, and therefore the same client cache entry.
+    """
+    now = _current_ts_ms()
+    return now - now % step_ms
 
 
 def _safe_float(value: Any, default: float | None = None) -> float | None:
     """Safely convert value to float."""
+    # Fast path: Deribit numbers arrive already decoded as float/int
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
     if value is None:
         return default
     try:
@@ -62,6 +97,36 @@ def _safe_float(value: Any, default: float | None = None) -> float | None:
         return default
 
 
+@overload
+async def _gather_limited(
+    *aws: Awaitable[Any], limit: int | None = None, return_exceptions: Literal[False] = False
+) -> list[Any]: ...
+
+
+@overload
+async def _gather_limited(
+    *aws: Awaitable[T], limit: int | None = None, return_exceptions: Literal[True]
+) -> list[T | BaseException]: ...
+
+
+async def _gather_limited(
+    *aws: Awaitable[Any], limit: int | None = None, return_exceptions: bool = False
+) -> list[Any]:
+    """
+    Like asyncio.gather, but with at most `limit` awaitables running at once.
+
+    Bounds per-call fan-out so a single tool can't burst past Deribit's
+    public rate limits. Defaults to the public_concurrency setting.
+    """
+    semaphore = asyncio.Semaphore(limit or get_settings_view().public_concurrency)
+
+    async def run(aw: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=return_exceptions)
+
+
 def _round_or_none(value: float | None, decimals: int = 6) -> float | None:
     """Round value if not None."""
     if value is None:
@@ -76,7 +141,7 @@ def _round_or_none(value: float | None, decimals: int = 6) -> float | None:
 
 async def deribit_status(
     client: DeribitJsonRpcClient | None = None,
-) -> dict:
+) -> StatusResponse:
     """
     Check Deribit API connectivity and status.
 
@@ -89,38 +154,44 @@ async def deribit_status(
     api_ok = False
     server_time_ms = 0
 
-    try:
-        # Get server time (validates connectivity)
-        time_result = await client.call_public("public/get_time")
+    # Server time validates connectivity; status info is optional. Both are
+    # independent, so fetch them concurrently.
+    time_result: Any | BaseException
+    status_result: Any | BaseException
+    time_result, status_result = await asyncio.gather(
+        client.call_public("public/get_time"),
+        client.call_public("public/status"),
+        return_exceptions=True,
+    )
+
+    if isinstance(time_result, DeribitError):
+        notes.append(f"error:{time_result.code}")
+        notes.append(time_result.message[:50])
+    elif isinstance(time_result, BaseException):
+        notes.append(f"connection_error:{type(time_result).__name__}")
+    else:
         server_time_ms = time_result
         api_ok = True
 
-        # Try to get status info
-        try:
-            status_result = await client.call_public("public/status")
-            if status_result.get("locked"):
-                notes.append("platform_locked")
-        except DeribitError:
+        if isinstance(status_result, DeribitError):
             # Status endpoint might not be available, that's ok
             pass
+        elif isinstance(status_result, BaseException):
+            notes.append(f"connection_error:{type(status_result).__name__}")
+        elif status_result.get("locked"):
+            notes.append("platform_locked")
 
         # Check cache stats
         cache_stats = client.get_cache_stats()
         if cache_stats["total_entries"] > 0:
             notes.append(f"cache_entries:{cache_stats['total_entries']}")
 
-    except DeribitError as e:
-        notes.append(f"error:{e.code}")
-        notes.append(e.message[:50])
-    except Exception as e:
-        notes.append(f"connection_error:{type(e).__name__}")
-
     return StatusResponse(
         env=settings.env.value,
         api_ok=api_ok,
         server_time_ms=server_time_ms,
         notes=notes[:6],
-    ).model_dump()
+    )
 
 
 # =============================================================================
@@ -133,7 +204,7 @@ async def deribit_instruments(
     kind: InstrumentKind = "option",
     expired: bool = False,
     client: DeribitJsonRpcClient | None = None,
-) -> dict:
+) -> InstrumentsResponse | ErrorResponse:
     """
     Get available instruments for a currency.
 
@@ -170,53 +241,49 @@ async def deribit_instruments(
             # For options, prioritize nearest expirations
             if kind == "option":
                 current_ts = _current_ts_ms()
-                # Group by expiration
-                by_expiry: dict[int, list] = {}
-                for inst in instruments_raw:
-                    exp = inst.get("expiration_timestamp", 0)
-                    if exp not in by_expiry:
-                        by_expiry[exp] = []
-                    by_expiry[exp].append(inst)
+                # Pick the nearest 3 future expirations without sorting them all
+                expiries = {inst.get("expiration_timestamp", 0) for inst in instruments_raw}
+                nearest = heapq.nsmallest(3, (e for e in expiries if e > current_ts))
 
-                # Sort expirations and take nearest 3
-                sorted_expiries = sorted([e for e in by_expiry if e > current_ts])[:3]
-
-                # Collect instruments from these expirations
-                filtered = []
-                for exp in sorted_expiries:
-                    filtered.extend(by_expiry[exp])
+                # Bucket only those expirations, keeping nearest-first order
+                by_expiry: dict[int, list[dict[str, Any]]] = {exp: [] for exp in nearest}
+                for inst in instruments_raw:
+                    bucket = by_expiry.get(inst.get("expiration_timestamp", 0))
+                    if bucket is not None:
+                        bucket.append(inst)
 
-                instruments_raw = filtered[:50]
-                notes.append(f"nearest_{len(sorted_expiries)}_expiries")
+                instruments_raw = list(itertools.chain.from_iterable(by_expiry.values()))[:50]
+                notes.append(f"nearest_{len(nearest)}_expiries")
             else:
                 instruments_raw = instruments_raw[:50]
 
-        # Convert to compact format
-        instruments = []
-        for inst in instruments_raw:
-            instruments.append(
-                InstrumentCompact(
-                    name=inst.get("instrument_name", ""),
-                    exp_ts=inst.get("expiration_timestamp", 0),
-                    strike=_safe_float(inst.get("strike")),
-                    type=inst.get("option_type"),
-                    tick=inst.get("tick_size", 0),
-                    size=inst.get("contract_size", 0),
-                )
-            )
+        # Convert to compact format, validated as one batch
+        instruments = _INSTRUMENT_LIST_ADAPTER.validate_python(
+            [
+                {
+                    "name": inst.get("instrument_name", ""),
+                    "exp_ts": inst.get("expiration_timestamp", 0),
+                    "strike": _safe_float(inst.get("strike")),
+                    "type": inst.get("option_type"),
+                    "tick": inst.get("tick_size", 0),
+                    "size": inst.get("contract_size", 0),
+                }
+                for inst in instruments_raw
+            ]
+        )
 
         return InstrumentsResponse(
             count=total_count,
             instruments=instruments,
             notes=notes[:6],
-        ).model_dump()
+        )
 
     except DeribitError as e:
         return ErrorResponse(
             code=e.code,
             message=e.message[:100],
             notes=[f"currency:{currency}", f"kind:{kind}"],
-        ).model_dump()
+        )
 
 
 # =============================================================================
@@ -227,7 +294,7 @@ async def deribit_instruments(
 async def deribit_ticker(
     instrument_name: str,
     client: DeribitJsonRpcClient | None = None,
-) -> dict:
+) -> TickerResponse | ErrorResponse:
     """
     Get compact ticker snapshot for an instrument.
 
@@ -267,10 +334,10 @@ async def deribit_ticker(
             iv = iv / 100  # Convert from percentage
             notes.append("iv_pct_converted")
 
-        # Get funding rate for perpetuals
+        # Get funding rate for perpetuals (Deribit names are upper case)
         funding = None
         next_funding_ts = None
-        if "PERPETUAL" in instrument_name.upper():
+        if instrument_name.endswith("-PERPETUAL"):
             funding = _safe_float(result.get("current_funding"))
             next_funding_ts = result.get("funding_8h")
 
@@ -289,14 +356,14 @@ async def deribit_ticker(
             funding=_round_or_none(funding, 8),
             next_funding_ts=next_funding_ts,
             notes=notes[:6],
-        ).model_dump()
+        )
 
     except DeribitError as e:
         return ErrorResponse(
             code=e.code,
             message=e.message[:100],
             notes=[f"instrument:{instrument_name}"],
-        ).model_dump()
+        )
 
 
 # =============================================================================
@@ -304,11 +371,25 @@ async def deribit_ticker(
 # =============================================================================
 
 
+def _summarize_levels(
+    raw_levels: list[list[float]], depth: int
+) -> tuple[list[dict[str, float]], float]:
+    """Extract the top 5 [price, qty] levels and the total qty over `depth` levels in one pass."""
+    top: list[dict[str, float]] = []
+    total = 0.0
+    for i, level in enumerate(raw_levels[: max(depth, 5)]):
+        if i < depth:
+            total += level[1]
+        if i < 5:
+            top.append({"p": round(level[0], 4), "q": round(level[1], 4)})
+    return top, total
+
+
 async def deribit_orderbook_summary(
     instrument_name: str,
     depth: int = 20,
     client: DeribitJsonRpcClient | None = None,
-) -> dict:
+) -> OrderBookSummaryResponse | ErrorResponse:
     """
     Get order book summary with top levels and depth metrics.
 
@@ -338,13 +419,11 @@ async def deribit_orderbook_summary(
         raw_bids = result.get("bids", [])
         raw_asks = result.get("asks", [])
 
-        # Top 5 levels only
-        bids = [PriceLevel(p=round(b[0], 4), q=round(b[1], 4)) for b in raw_bids[:5]]
-        asks = [PriceLevel(p=round(a[0], 4), q=round(a[1], 4)) for a in raw_asks[:5]]
-
-        # Calculate depth sums
-        bid_depth = sum(b[1] for b in raw_bids[:depth])
-        ask_depth = sum(a[1] for a in raw_asks[:depth])
+        # Top 5 levels only, plus depth sums over all fetched levels
+        top_bids, bid_depth = _summarize_levels(raw_bids, depth)
+        top_asks, ask_depth = _summarize_levels(raw_asks, depth)
+        bids = _LEVEL_LIST_ADAPTER.validate_python(top_bids)
+        asks = _LEVEL_LIST_ADAPTER.validate_python(top_asks)
 
         # Best bid/ask
         best_bid = _safe_float(result.get("best_bid_price"))
@@ -375,14 +454,14 @@ async def deribit_orderbook_summary(
             ask_depth=round(ask_depth, 4),
             imbalance=_round_or_none(imbalance, 4),
             notes=notes[:6],
-        ).model_dump()
+        )
 
     except DeribitError as e:
         return ErrorResponse(
             code=e.code,
             message=e.message[:100],
             notes=[f"instrument:{instrument_name}"],
-        ).model_dump()
+        )
 
 
 # =============================================================================
@@ -390,10 +469,14 @@ async def deribit_orderbook_summary(
 # =============================================================================
 
 
+# DVOL index instrument per currency (ticker fallback)
+_DVOL_INSTRUMENTS: dict[str, str] = {"BTC": "BTC_DVOL", "ETH": "ETH_DVOL"}
+
+
 async def dvol_snapshot(
     currency: Currency,
     client: DeribitJsonRpcClient | None = None,
-) -> dict:
+) -> DvolResponse | ErrorResponse:
     """
     Get DVOL (Deribit Volatility Index) snapshot.
 
@@ -409,28 +492,25 @@ async def dvol_snapshot(
     client = client or get_client()
     notes: list[str] = []
 
-    # DVOL index names
-    dvol_index = f"{currency}_DVOL" if currency == "BTC" else f"{currency}DVOL"
-    dvol_index_alt = f"{currency}DVOL" if currency == "BTC" else f"{currency}_DVOL"
-
     try:
         # Try to get DVOL index data
         result = None
         try:
+            window_end = _quantized_ts_ms()
             result = await client.call_public(
                 "public/get_volatility_index_data",
                 {
                     "currency": currency,
                     "resolution": "1D",  # Daily resolution
-                    "start_timestamp": _current_ts_ms() - 86400000,  # Last 24h
-                    "end_timestamp": _current_ts_ms(),
+                    "start_timestamp": window_end - 86400000,  # Last 24h
+                    "end_timestamp": window_end,
                 },
             )
         except DeribitError:
-            # Fallback: try ticker for DVOL instrument
+            # Fallback: ticker for DVOL instrument
             try:
                 ticker = await client.call_public(
-                    "public/ticker", {"instrument_name": f"{currency}_DVOL"}
+                    "public/ticker", {"instrument_name": _DVOL_INSTRUMENTS[currency]}
                 )
                 if ticker:
                     dvol_value = _safe_float(ticker.get("mark_price"))
@@ -442,7 +522,7 @@ async def dvol_snapshot(
                             percentile=None,
                             ts=_current_ts_ms(),
                             notes=["source:ticker_fallback"],
-                        ).model_dump()
+                        )
             except DeribitError:
                 pass
 
@@ -467,7 +547,7 @@ async def dvol_snapshot(
                     percentile=None,  # Would need historical data
                     ts=_current_ts_ms(),
                     notes=notes[:6],
-                ).model_dump()
+                )
 
         # If we get here, no DVOL data available
         notes.append("dvol_unavailable")
@@ -480,14 +560,14 @@ async def dvol_snapshot(
             percentile=None,
             ts=_current_ts_ms(),
             notes=notes[:6],
-        ).model_dump()
+        )
 
     except DeribitError as e:
         return ErrorResponse(
             code=e.code,
             message=e.message[:100],
             notes=[f"currency:{currency}", "dvol_fetch_failed"],
-        ).model_dump()
+        )
 
 
 # =============================================================================
@@ -495,11 +575,226 @@ async def dvol_snapshot(
 # =============================================================================
 
 
+class _OptionIndex(NamedTuple):
+    """Expiry/strike index over one option chain."""
+
+    expiries: list[int]  # ascending
+    strikes: dict[int, list[float]]  # expiry -> distinct strikes, ascending
+
+
+# Indexes of recently seen option chains, keyed by list identity (the list is
+# kept alongside so its id can't be reused while the entry is alive)
+_OPTION_INDEX_CACHE: dict[int, tuple[list[dict[str, Any]], _OptionIndex]] = {}
+_OPTION_INDEX_CACHE_SIZE = 4
+
+
+def _option_index(options: list[dict[str, Any]]) -> _OptionIndex:
+    """
+    Index an option chain once so tenor and ATM lookups can bisect.
+
+    The client cache hands back the same list object until its TTL expires,
+    so the index is memoized on that object and rebuilt only for a fresh
+    chain. Expired expiries are kept; lookups skip them by timestamp.
+    """
+    cached = _OPTION_INDEX_CACHE.get(id(options))
+    if cached is not None and cached[0] is options:
+        return cached[1]
+
+    strikes: dict[int, set[float]] = {}
+    for opt in options:
+        expiry_strikes = strikes.setdefault(opt.get("expiration_timestamp", 0), set())
+        strike = _safe_float(opt.get("strike"))
+        if strike is not None:
+            expiry_strikes.add(strike)
+
+    expiries = sorted(strikes)
+    index = _OptionIndex(expiries, {exp: sorted(strikes[exp]) for exp in expiries})
+
+    if len(_OPTION_INDEX_CACHE) >= _OPTION_INDEX_CACHE_SIZE:
+        del _OPTION_INDEX_CACHE[next(iter(_OPTION_INDEX_CACHE))]
+    _OPTION_INDEX_CACHE[id(options)] = (options, index)
+    return index
+
+
+async def _fetch_option_index(currency: Currency, client: DeribitJsonRpcClient) -> _OptionIndex:
+    """Fetch the live option chain (client-cached) and return its index."""
+    instruments = await client.call_public(
+        "public/get_instruments", {"currency": currency, "kind": "option", "expired": False}
+    )
+    if not isinstance(instruments, list):
+        return _OptionIndex([], {})
+    return _option_index(instruments)
+
+
+def _nearest_expiry_after(
+    expiries: list[int], current_ts: int, min_days: float = 1.0
+) -> int | None:
+    """First expiry (ascending list) more than min_days out."""
+    i = bisect.bisect_right(expiries, current_ts + int(min_days * 86_400_000))
+    return expiries[i] if i < len(expiries) else None
+
+
+def _nearest_tenor_expiry(expiries: list[int], target_days: int, current_ts: int) -> int | None:
+    """Expiry closest to target_days, within half the target distance."""
+    # expiries is sorted, so only the neighbours of the target can be closest;
+    # an already expired neighbour is always out of range
+    i = bisect.bisect_left(expiries, current_ts + target_days * 86_400_000)
+    best_exp = None
+    best_distance = float("inf")
+
+    for exp_ts in expiries[max(i - 1, 0) : i + 1]:
+        days = days_to_expiry_from_ts(exp_ts, current_ts)
+        distance = abs(days - target_days)
+        if distance < best_distance and distance < target_days * 0.5:
+            best_distance = distance
+            best_exp = exp_ts
+
+    return best_exp
+
+
+def _atm_strike(strikes: list[float], spot: float) -> float | None:
+    """Strike closest to spot from an ascending strike list."""
+    i = bisect.bisect_left(strikes, spot)
+    neighbours = strikes[max(i - 1, 0) : i + 1]
+    if not neighbours:
+        return None
+    return min(neighbours, key=lambda strike: abs(strike - spot))
+
+
+def _ticker_iv(ticker: dict[str, Any]) -> float | None:
+    """Mark IV from a ticker as a decimal (Deribit reports percent)."""
+    iv = _safe_float(ticker.get("mark_iv"))
+    if iv and iv > 1:
+        iv = iv / 100
+    return iv
+
+
+# (target_days, matched expiry, (ATM call, 25d call, 25d put) names) per tenor
+_TenorPlan = tuple[int, int | None, tuple[str, str, str] | None]
+
+
+def _plan_surface(
+    currency: Currency, index: _OptionIndex, spot: float, targets: list[int], current_ts: int
+) -> tuple[list[_TenorPlan], dict[str, None]]:
+    """
+    Plan every tenor without I/O: matched expiry, ATM strike and legs.
+
+    Returns (target_days, expiry, leg names) per tenor, and the ordered set of
+    instrument names whose tickers are needed (tenors may share an expiry).
+    """
+    plans: list[_TenorPlan] = []
+    names: dict[str, None] = {}
+    for target_days in targets:
+        best_exp = _nearest_tenor_expiry(index.expiries, target_days, current_ts)
+        atm_strike = _atm_strike(index.strikes[best_exp], spot) if best_exp else None
+        leg_names = None
+        if atm_strike:
+            # For simplicity, estimate 25d strikes as ATM ± 5%
+            # In practice, would need to find actual 25d strikes
+            exp_code = _format_expiry(best_exp)
+            leg_names = (
+                f"{currency}-{exp_code}-{int(atm_strike)}-C",
+                f"{currency}-{exp_code}-{int(atm_strike * 1.05)}-C",
+                f"{currency}-{exp_code}-{int(atm_strike * 0.95)}-P",
+            )
+            names.update(dict.fromkeys(leg_names))
+        plans.append((target_days, best_exp, leg_names))
+
+    return plans, names
+
+
+async def _fetch_tickers(names: Iterable[str], client: DeribitJsonRpcClient) -> dict[str, Any]:
+    """Fetch tickers concurrently; failed ones map to their exception."""
+    name_list = list(names)
+    results = await _gather_limited(
+        *(client.call_public("public/ticker", {"instrument_name": name}) for name in name_list),
+        return_exceptions=True,
+    )
+    return dict(zip(name_list, results, strict=True))
+
+
+def _surface_response(
+    currency: Currency,
+    spot: float,
+    plans: list[_TenorPlan],
+    tickers: dict[str, Any],
+    tenor_days: list[int],
+    current_ts: int,
+    notes: list[str],
+) -> SurfaceResponse:
+    """Build the surface from planned tenors and their fetched tickers."""
+    tenors_result: list[TenorIV] = []
+    matched_expiries = 0
+    for target_days, best_exp, leg_names in plans:
+        if best_exp is None:
+            tenors_result.append(
+                TenorIV(days=target_days, atm_iv=None, rr25=None, fly25=None, fwd=None)
+            )
+            continue
+
+        atm_iv = None
+        rr25 = None
+        fly25 = None
+
+        if leg_names:
+            atm_name, call_name, put_name = leg_names
+            atm_ticker = tickers[atm_name]
+            if isinstance(atm_ticker, DeribitError):
+                notes.append(f"atm_ticker_failed:{target_days}d")
+            elif isinstance(atm_ticker, Exception):
+                logger.warning("Surface tenor %sd failed: %s", target_days, atm_ticker)
+                notes.append(f"tenor_failed:{target_days}d")
+                tenors_result.append(
+                    TenorIV(days=target_days, atm_iv=None, rr25=None, fly25=None, fwd=None)
+                )
+                continue
+            else:
+                atm_iv = _ticker_iv(atm_ticker)
+
+            # Risk reversal / butterfly from the estimated 25d legs
+            call_ticker = tickers[call_name]
+            put_ticker = tickers[put_name]
+            legs_ok = not isinstance(call_ticker, Exception) and not isinstance(
+                put_ticker, Exception
+            )
+            if atm_iv and legs_ok:
+                call_iv = _ticker_iv(call_ticker)
+                put_iv = _ticker_iv(put_ticker)
+                if call_iv and put_iv:
+                    rr25 = calculate_risk_reversal(call_iv, put_iv)
+                    fly25 = calculate_butterfly(call_iv, put_iv, atm_iv)
+
+        matched_expiries += 1
+        tenors_result.append(
+            TenorIV(
+                days=int(days_to_expiry_from_ts(best_exp, current_ts)),
+                atm_iv=_round_or_none(atm_iv, 4),
+                rr25=_round_or_none(rr25, 4),
+                fly25=_round_or_none(fly25, 4),
+                fwd=_round_or_none(spot, 2),  # Simplified: use spot as forward
+            )
+        )
+
+    # Calculate confidence based on data coverage
+    confidence = matched_expiries / len(tenor_days) if tenor_days else 0
+    if confidence < 0.5:
+        notes.append("low_confidence_sparse_data")
+
+    return SurfaceResponse(
+        ccy=currency,
+        spot=round(spot, 2),
+        tenors=tenors_result,
+        confidence=round(confidence, 2),
+        ts=current_ts,
+        notes=notes[:6],
+    )
+
+
 async def options_surface_snapshot(
     currency: Currency,
     tenor_days: list[int] | None = None,
     client: DeribitJsonRpcClient | None = None,
-) -> dict:
+) -> SurfaceResponse | ErrorResponse:
     """
     Get volatility surface snapshot with ATM IV, risk reversal, and butterfly
     for key tenors.
@@ -519,9 +814,10 @@ async def options_surface_snapshot(
     tenor_days = tenor_days or [7, 14, 30, 60]
 
     try:
-        # Get index price first
-        index_result = await client.call_public(
-            "public/get_index_price", {"index_name": f"{currency.lower()}_usd"}
+        # Index price and the option chain are independent; fetch together
+        index_result, index = await asyncio.gather(
+            client.call_public("public/get_index_price", {"index_name": f"{currency.lower()}_usd"}),
+            _fetch_option_index(currency, client),
         )
         spot = _safe_float(index_result.get("index_price", 0))
 
@@ -534,159 +830,36 @@ async def options_surface_snapshot(
                 confidence=0,
                 ts=_current_ts_ms(),
                 notes=notes[:6],
-            ).model_dump()
-
-        # Get options instruments
-        instruments_result = await client.call_public(
-            "public/get_instruments", {"currency": currency, "kind": "option", "expired": False}
-        )
+            )
 
-        all_options = instruments_result if isinstance(instruments_result, list) else []
         current_ts = _current_ts_ms()
 
-        # Group by expiration
-        by_expiry: dict[int, list] = {}
-        for opt in all_options:
-            exp = opt.get("expiration_timestamp", 0)
-            if exp <= current_ts:
-                continue
-            if exp not in by_expiry:
-                by_expiry[exp] = []
-            by_expiry[exp].append(opt)
-
-        # Find expirations closest to target tenors
-        tenors_result: list[TenorIV] = []
-        matched_expiries = 0
-
-        for target_days in tenor_days[:4]:  # Max 4 tenors
-            # Find closest expiration
-            best_exp = None
-            best_distance = float("inf")
-
-            for exp_ts in by_expiry:
-                days = days_to_expiry_from_ts(exp_ts, current_ts)
-                distance = abs(days - target_days)
-                if distance < best_distance and distance < target_days * 0.5:
-                    best_distance = distance
-                    best_exp = exp_ts
-
-            if best_exp is None:
-                tenors_result.append(
-                    TenorIV(
-                        days=target_days,
-                        atm_iv=None,
-                        rr25=None,
-                        fly25=None,
-                        fwd=None,
-                    )
-                )
-                continue
-
-            matched_expiries += 1
-            actual_days = days_to_expiry_from_ts(best_exp, current_ts)
-            expiry_options = by_expiry[best_exp]
-
-            # Find ATM option (closest strike to spot)
-            atm_strike = None
-            atm_iv = None
-            min_distance = float("inf")
-
-            for opt in expiry_options:
-                strike = _safe_float(opt.get("strike"))
-                if strike is None:
-                    continue
-                distance = abs(strike - spot)
-                if distance < min_distance:
-                    min_distance = distance
-                    atm_strike = strike
-
-            # Get ATM IV from ticker
-            if atm_strike:
-                atm_call_name = f"{currency}-{_format_expiry(best_exp)}-{int(atm_strike)}-C"
-                try:
-                    atm_ticker = await client.call_public(
-                        "public/ticker", {"instrument_name": atm_call_name}
-                    )
-                    iv = _safe_float(atm_ticker.get("mark_iv"))
-                    if iv and iv > 1:
-                        iv = iv / 100
-                    atm_iv = iv
-                except DeribitError:
-                    notes.append(f"atm_ticker_failed:{target_days}d")
-
-            # Estimate 25d options for RR/Fly (simplified)
-            # In practice, would need to find actual 25d strikes
-            rr25 = None
-            fly25 = None
-
-            # For simplicity, estimate 25d strikes as ATM ± 5-10%
-            if atm_strike and atm_iv:
-                call_25d_strike = int(atm_strike * 1.05)
-                put_25d_strike = int(atm_strike * 0.95)
-
-                try:
-                    call_name = f"{currency}-{_format_expiry(best_exp)}-{call_25d_strike}-C"
-                    put_name = f"{currency}-{_format_expiry(best_exp)}-{put_25d_strike}-P"
-
-                    call_ticker = await client.call_public(
-                        "public/ticker", {"instrument_name": call_name}
-                    )
-                    put_ticker = await client.call_public(
-                        "public/ticker", {"instrument_name": put_name}
-                    )
-
-                    call_iv = _safe_float(call_ticker.get("mark_iv"))
-                    put_iv = _safe_float(put_ticker.get("mark_iv"))
-
-                    if call_iv and call_iv > 1:
-                        call_iv = call_iv / 100
-                    if put_iv and put_iv > 1:
-                        put_iv = put_iv / 100
-
-                    if call_iv and put_iv:
-                        rr25 = calculate_risk_reversal(call_iv, put_iv)
-                        fly25 = calculate_butterfly(call_iv, put_iv, atm_iv)
-                except DeribitError:
-                    pass
+        plans, names = _plan_surface(currency, index, spot, tenor_days[:4], current_ts)
 
-            tenors_result.append(
-                TenorIV(
-                    days=int(actual_days),
-                    atm_iv=_round_or_none(atm_iv, 4),
-                    rr25=_round_or_none(rr25, 4),
-                    fly25=_round_or_none(fly25, 4),
-                    fwd=_round_or_none(spot, 2),  # Simplified: use spot as forward
-                )
-            )
+        # Fetch all tickers in one concurrent batch; failures come back as
+        # exceptions so one bad instrument doesn't sink the snapshot
+        tickers = await _fetch_tickers(names, client)
 
-        # Calculate confidence based on data coverage
-        confidence = matched_expiries / len(tenor_days) if tenor_days else 0
-        if confidence < 0.5:
-            notes.append("low_confidence_sparse_data")
-
-        return SurfaceResponse(
-            ccy=currency,
-            spot=round(spot, 2),
-            tenors=tenors_result,
-            confidence=round(confidence, 2),
-            ts=current_ts,
-            notes=notes[:6],
-        ).model_dump()
+        return _surface_response(currency, spot, plans, tickers, tenor_days, current_ts, notes)
 
     except DeribitError as e:
         return ErrorResponse(
             code=e.code,
             message=e.message[:100],
             notes=[f"currency:{currency}", "surface_calc_failed"],
-        ).model_dump()
+        )
 
 
-def _format_expiry(ts_ms: int) -> str:
-    """Format expiration timestamp to Deribit format (e.g., 28JUN24)."""
-    import datetime
+_MONTHS = ("JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC")
+
 
-    dt = datetime.datetime.fromtimestamp(ts_ms / 1000, tz=datetime.UTC)
-    return dt.strftime("%d%b%y").upper()
+@lru_cache(maxsize=256)
+def _format_expiry(ts_ms: int) -> str:
+    """Format expiration timestamp to Deribit format (e.g., 28JUN24, 5JUL24)."""
+    # Deribit doesn't zero-pad the day; formatting by hand also avoids
+    # strftime's locale handling
+    dt = datetime.fromtimestamp(ts_ms / 1000, tz=UTC)
+    return f"{dt.day}{_MONTHS[dt.month - 1]}{dt.year % 100:02d}"
 
 
 # =============================================================================
@@ -694,12 +867,61 @@ def _format_expiry(ts_ms: int) -> str:
 # =============================================================================
 
 
+def _expected_move_response(
+    currency: Currency,
+    spot: float,
+    iv_used: float | None,
+    iv_source: str,
+    horizon_minutes: int,
+    confidence: float,
+    notes: list[str],
+) -> ExpectedMoveResponse:
+    """Build the 1σ expected move bands, or a zeroed response without IV."""
+    if iv_used is None or iv_used <= 0:
+        notes.append("iv_unavailable_cannot_calculate")
+        return ExpectedMoveResponse(
+            ccy=currency,
+            spot=round(spot, 2),
+            iv_used=0,
+            iv_source=iv_source,
+            horizon_min=horizon_minutes,
+            move_1s_pts=0,
+            move_1s_bps=0,
+            up_1s=spot,
+            down_1s=spot,
+            confidence=0,
+            notes=notes[:6],
+        )
+
+    result = calculate_expected_move(
+        spot=spot,
+        iv_annualized=iv_used,
+        horizon_minutes=horizon_minutes,
+        iv_source=iv_source,
+        confidence=confidence,
+    )
+
+    return ExpectedMoveResponse(
+        ccy=currency,
+        spot=round(result.spot, 2),
+        iv_used=round(result.iv_used, 4),
+        iv_source=result.iv_source,
+        horizon_min=result.horizon_minutes,
+        move_1s_pts=result.move_points,
+        move_1s_bps=result.move_bps,
+        up_1s=result.up_1sigma,
+        down_1s=result.down_1sigma,
+        confidence=round(result.confidence, 2),
+        notes=notes[:6],
+    )
+
+
 async def expected_move_iv(
     currency: Currency,
     horizon_minutes: int = 60,
     method: Literal["dvol", "atm_iv"] = "dvol",
     client: DeribitJsonRpcClient | None = None,
-) -> dict:
+) -> ExpectedMoveResponse | ErrorResponse:
     """
     Calculate expected price move based on implied volatility.
 
@@ -721,10 +943,21 @@ async def expected_move_iv(
     notes: list[str] = []
 
     try:
-        # Get spot price
-        index_result = await client.call_public(
+        # Get spot price together with the first IV source, which doesn't
+        # depend on it: DVOL, or the option chain for the ATM lookup
+        index_call = client.call_public(
             "public/get_index_price", {"index_name": f"{currency.lower()}_usd"}
         )
+        dvol_result = None
+        index = None
+        if method == "dvol":
+            index_result, dvol_result = await _gather_limited(
+                index_call, dvol_snapshot(currency, client)
+            )
+        else:
+            index_result, index = await _gather_limited(
+                index_call, _fetch_option_index(currency, client)
+            )
         spot = _safe_float(index_result.get("index_price", 0))
 
         if not spot or spot <= 0:
@@ -741,7 +974,7 @@ async def expected_move_iv(
                 down_1s=0,
                 confidence=0,
                 notes=notes[:6],
-            ).model_dump()
+            )
 
         # Get IV based on method
         iv_used = None
@@ -750,11 +983,10 @@ async def expected_move_iv(
 
         if method == "dvol":
             # Try DVOL first
-            dvol_result = await dvol_snapshot(currency, client)
-            if not dvol_result.get("error") and dvol_result.get("dvol", 0) > 0:
+            if isinstance(dvol_result, DvolResponse) and dvol_result.dvol > 0:
                 # DVOL is in percentage form (e.g., 80 = 80%)
-                iv_used = dvol_to_decimal(dvol_result["dvol"])
-                notes.append(f"dvol_raw:{dvol_result['dvol']}")
+                iv_used = dvol_to_decimal(dvol_result.dvol)
+                notes.append(f"dvol_raw:{dvol_result.dvol}")
             else:
                 notes.append("dvol_unavailable_fallback_atm")
                 method = "atm_iv"
@@ -764,100 +996,37 @@ async def expected_move_iv(
             # Get ATM IV from nearest expiry
             iv_source = "atm_iv"
 
-            # Get options
-            instruments = await client.call_public(
-                "public/get_instruments", {"currency": currency, "kind": "option", "expired": False}
-            )
+            # Option index (already fetched unless falling back from DVOL);
+            # the chain is client-cached and its index memoized
+            if index is None:
+                index = await _fetch_option_index(currency, client)
 
-            if instruments:
-                current_ts = _current_ts_ms()
+            nearest_exp = _nearest_expiry_after(index.expiries, _current_ts_ms())
+            atm_strike = _atm_strike(index.strikes[nearest_exp], spot) if nearest_exp else None
 
-                # Find nearest expiry
-                nearest_exp = None
-                min_days = float("inf")
-                for opt in instruments:
-                    exp = opt.get("expiration_timestamp", 0)
-                    if exp <= current_ts:
-                        continue
-                    days = days_to_expiry_from_ts(exp, current_ts)
-                    if 1 < days < min_days:
-                        min_days = days
-                        nearest_exp = exp
-
-                if nearest_exp:
-                    # Find ATM strike
-                    atm_strike = None
-                    min_dist = float("inf")
-                    for opt in instruments:
-                        if opt.get("expiration_timestamp") != nearest_exp:
-                            continue
-                        strike = _safe_float(opt.get("strike"))
-                        if strike:
-                            dist = abs(strike - spot)
-                            if dist < min_dist:
-                                min_dist = dist
-                                atm_strike = strike
-
-                    if atm_strike:
-                        atm_name = f"{currency}-{_format_expiry(nearest_exp)}-{int(atm_strike)}-C"
-                        try:
-                            ticker = await client.call_public(
-                                "public/ticker", {"instrument_name": atm_name}
-                            )
-                            iv = _safe_float(ticker.get("mark_iv"))
-                            if iv:
-                                if iv > 1:
-                                    iv = iv / 100
-                                iv_used = iv
-                                notes.append(f"atm_from:{atm_name}")
-                        except DeribitError as e:
-                            notes.append(f"atm_ticker_error:{e.code}")
-
-        # Calculate expected move
-        if iv_used is None or iv_used <= 0:
-            notes.append("iv_unavailable_cannot_calculate")
-            return ExpectedMoveResponse(
-                ccy=currency,
-                spot=round(spot, 2),
-                iv_used=0,
-                iv_source=iv_source,
-                horizon_min=horizon_minutes,
-                move_1s_pts=0,
-                move_1s_bps=0,
-                up_1s=spot,
-                down_1s=spot,
-                confidence=0,
-                notes=notes[:6],
-            ).model_dump()
-
-        result = calculate_expected_move(
-            spot=spot,
-            iv_annualized=iv_used,
-            horizon_minutes=horizon_minutes,
-            iv_source=iv_source,
-            confidence=confidence,
+            if atm_strike:
+                atm_name = f"{currency}-{_format_expiry(nearest_exp)}-{int(atm_strike)}-C"
+                try:
+                    ticker = await client.call_public(
+                        "public/ticker", {"instrument_name": atm_name}
+                    )
+                    iv = _ticker_iv(ticker)
+                    if iv:
+                        iv_used = iv
+                        notes.append(f"atm_from:{atm_name}")
+                except DeribitError as e:
+                    notes.append(f"atm_ticker_error:{e.code}")
+
+        return _expected_move_response(
+            currency, spot, iv_used, iv_source, horizon_minutes, confidence, notes
         )
 
-        return ExpectedMoveResponse(
-            ccy=currency,
-            spot=round(result.spot, 2),
-            iv_used=round(result.iv_used, 4),
-            iv_source=result.iv_source,
-            horizon_min=result.horizon_minutes,
-            move_1s_pts=result.move_points,
-            move_1s_bps=result.move_bps,
-            up_1s=result.up_1sigma,
-            down_1s=result.down_1sigma,
-            confidence=round(result.confidence, 2),
-            notes=notes[:6],
-        ).model_dump()
-
     except DeribitError as e:
         return ErrorResponse(
             code=e.code,
             message=e.message[:100],
             notes=[f"currency:{currency}", "expected_move_failed"],
-        ).model_dump()
+        )
 
 
 # =============================================================================
@@ -868,7 +1037,7 @@ async def expected_move_iv(
 async def funding_snapshot(
     currency: Currency,
     client: DeribitJsonRpcClient | None = None,
-) -> dict:
+) -> FundingResponse | ErrorResponse:
     """
     Get perpetual funding rate snapshot.
 
@@ -882,35 +1051,41 @@ async def funding_snapshot(
     notes: list[str] = []
     perp_name = f"{currency}-PERPETUAL"
 
-    try:
-        # Get current funding rate from ticker
-        ticker = await client.call_public("public/ticker", {"instrument_name": perp_name})
-
-        current_funding = _safe_float(ticker.get("current_funding"))
-
-        # Get funding rate history (last 5 periods)
-        history: list[FundingEntry] = []
+    async def fetch_history() -> list[dict[str, Any]] | None:
+        # Funding history (last 5 periods) is optional
+        window_end = _quantized_ts_ms()
         try:
-            current_ts = _current_ts_ms()
-            history_result = await client.call_public(
+            history: list[dict[str, Any]] = await client.call_public(
                 "public/get_funding_rate_history",
                 {
                     "instrument_name": perp_name,
-                    "start_timestamp": current_ts - (8 * 3600 * 1000 * 5),  # ~5 periods
-                    "end_timestamp": current_ts,
+                    "start_timestamp": window_end - (8 * 3600 * 1000 * 5),  # ~5 periods
+                    "end_timestamp": window_end,
                 },
             )
-
-            if history_result:
-                for entry in history_result[-5:]:  # Last 5 entries
-                    history.append(
-                        FundingEntry(
-                            ts=entry.get("timestamp", 0),
-                            rate=round(entry.get("interest_8h", 0), 8),
-                        )
-                    )
+            return history
         except DeribitError:
             notes.append("history_unavailable")
+            return None
+
+    try:
+        # Current funding rate from the ticker; history is independent of it
+        ticker, history_result = await asyncio.gather(
+            client.call_public("public/ticker", {"instrument_name": perp_name}),
+            fetch_history(),
+        )
+
+        current_funding = _safe_float(ticker.get("current_funding"))
+
+        history: list[FundingEntry] = []
+        if history_result:
+            for entry in history_result[-5:]:  # Last 5 entries
+                history.append(
+                    FundingEntry(
+                        ts=entry.get("timestamp", 0),
+                        rate=round(entry.get("interest_8h", 0), 8),
+                    )
+                )
 
         # Calculate 8h annualized rate
         rate_8h = None
@@ -929,14 +1104,111 @@ async def funding_snapshot(
             next_ts=next_ts,
             history=history,
             notes=notes[:6],
-        ).model_dump()
+        )
 
     except DeribitError as e:
         return ErrorResponse(
             code=e.code,
             message=e.message[:100],
             notes=[f"perp:{perp_name}", "funding_fetch_failed"],
-        ).model_dump()
+        )
+
+
+# =============================================================================
+# Tool 9: market_iv_snapshot
+# =============================================================================
+
+
+async def market_iv_snapshot(
+    currency: Currency,
+    tenor_days: list[int] | None = None,
+    horizon_minutes: int = 60,
+    client: DeribitJsonRpcClient | None = None,
+) -> MarketIVResponse | ErrorResponse:
+    """
+    Get the volatility surface and the expected move in one pass.
+
+    Equivalent to options_surface_snapshot followed by expected_move_iv
+    (method 'dvol'), but spot, the option chain and DVOL are fetched once and
+    concurrently. If DVOL is unavailable, the ATM ticker for the expected move
+    joins the surface's ticker batch instead of costing another round trip.
+
+    Args:
+        currency: BTC or ETH
+        tenor_days: Target tenors in days (default: [7, 14, 30, 60])
+        horizon_minutes: Expected move horizon in minutes (default: 60)
+
+    Returns:
+        MarketIVResponse with the surface and expected move.
+    """
+    client = client or get_client()
+    surface_notes: list[str] = []
+    move_notes: list[str] = []
+    tenor_days = tenor_days or [7, 14, 30, 60]
+
+    try:
+        index_result, index, dvol_result = await _gather_limited(
+            client.call_public("public/get_index_price", {"index_name": f"{currency.lower()}_usd"}),
+            _fetch_option_index(currency, client),
+            dvol_snapshot(currency, client),
+        )
+        spot = _safe_float(index_result.get("index_price", 0))
+
+        if not spot or spot <= 0:
+            return ErrorResponse(
+                code=-1,
+                message="Spot price unavailable",
+                notes=[f"currency:{currency}", "spot_unavailable"],
+            )
+
+        current_ts = _current_ts_ms()
+        plans, names = _plan_surface(currency, index, spot, tenor_days[:4], current_ts)
+
+        # Expected move IV: DVOL, else the ATM call of the nearest expiry
+        # more than a day out, fetched in the same batch as the surface
+        iv_used = None
+        iv_source = "dvol"
+        confidence = 1.0
+        move_atm_name = None
+        if isinstance(dvol_result, DvolResponse) and dvol_result.dvol > 0:
+            iv_used = dvol_to_decimal(dvol_result.dvol)
+            move_notes.append(f"dvol_raw:{dvol_result.dvol}")
+        else:
+            move_notes.append("dvol_unavailable_fallback_atm")
+            iv_source = "atm_iv"
+            confidence = 0.7
+            nearest_exp = _nearest_expiry_after(index.expiries, current_ts)
+            atm_strike = _atm_strike(index.strikes[nearest_exp], spot) if nearest_exp else None
+            if atm_strike:
+                move_atm_name = f"{currency}-{_format_expiry(nearest_exp)}-{int(atm_strike)}-C"
+                names[move_atm_name] = None
+
+        tickers = await _fetch_tickers(names, client)
+
+        if move_atm_name:
+            ticker = tickers[move_atm_name]
+            if isinstance(ticker, DeribitError):
+                move_notes.append(f"atm_ticker_error:{ticker.code}")
+            elif not isinstance(ticker, Exception):
+                iv_used = _ticker_iv(ticker)
+                if iv_used:
+                    move_notes.append(f"atm_from:{move_atm_name}")
+
+        return MarketIVResponse(
+            surface=_surface_response(
+                currency, spot, plans, tickers, tenor_days, current_ts, surface_notes
+            ),
+            move=_expected_move_response(
+                currency, spot, iv_used, iv_source, horizon_minutes, confidence, move_notes
+            ),
+        )
+
+    except DeribitError as e:
+        return ErrorResponse(
+            code=e.code,
+            message=e.message[:100],
+            notes=[f"currency:{currency}", "market_iv_failed"],
+        )
 
 
 # =============================================================================
@@ -947,7 +1219,7 @@ async def funding_snapshot(
 async def account_summary(
     currency: Currency,
     client: DeribitJsonRpcClient | None = None,
-) -> dict:
+) -> AccountSummaryResponse | ErrorResponse:
     """
     Get account summary (requires authentication).
 
@@ -963,7 +1235,7 @@ async def account_summary(
             code=403,
             message="Private API disabled. Set DERIBIT_ENABLE_PRIVATE=true",
             notes=["private_api_disabled"],
-        ).model_dump()
+        )
 
     client = client or get_client()
 
@@ -981,21 +1253,21 @@ async def account_summary(
             im=_round_or_none(_safe_float(result.get("initial_margin")), 8),
             delta_total=_round_or_none(_safe_float(result.get("delta_total")), 4),
             notes=[],
-        ).model_dump()
+        )
 
     except DeribitError as e:
         return ErrorResponse(
             code=e.code,
             message=e.message[:100],
             notes=[f"currency:{currency}", "auth_required"],
-        ).model_dump()
+        )
 
 
 async def positions(
     currency: Currency,
     kind: InstrumentKind = "future",
     client: DeribitJsonRpcClient | None = None,
-) -> dict:
+) -> PositionsResponse | ErrorResponse:
     """
     Get open positions (requires authentication).
 
@@ -1012,7 +1284,7 @@ async def positions(
             code=403,
             message="Private API disabled. Set DERIBIT_ENABLE_PRIVATE=true",
             notes=["private_api_disabled"],
-        ).model_dump()
+        )
 
     client = client or get_client()
     notes: list[str] = []
@@ -1023,50 +1295,53 @@ async def positions(
         )
 
         positions_list = result if isinstance(result, list) else []
-        total = len(positions_list)
 
-        if total > 20:
-            notes.append(f"truncated_from:{total}")
-            positions_list = positions_list[:20]
-
-        compact_positions = []
+        # Drop flat positions before truncating, so up to 20 open ones are
+        # shown and only those are turned into models
+        open_positions = []
         for pos in positions_list:
             size = _safe_float(pos.get("size"), 0)
-            if size == 0:
-                continue
+            if size != 0:
+                open_positions.append((size, pos))
+        total = len(open_positions)
 
-            compact_positions.append(
-                PositionCompact(
-                    inst=pos.get("instrument_name", ""),
-                    size=abs(size),
-                    side="long" if size > 0 else "short",
-                    entry=round(_safe_float(pos.get("average_price"), 0), 4),
-                    mark=round(_safe_float(pos.get("mark_price"), 0), 4),
-                    pnl=round(_safe_float(pos.get("floating_profit_loss"), 0), 4),
-                    liq=_round_or_none(_safe_float(pos.get("estimated_liquidation_price")), 2),
-                )
+        if total > 20:
+            notes.append(f"truncated_from:{total}")
+            open_positions = open_positions[:20]
+
+        compact_positions = [
+            PositionCompact(
+                inst=pos.get("instrument_name", ""),
+                size=abs(size),
+                side="long" if size > 0 else "short",
+                entry=round(_safe_float(pos.get("average_price"), 0), 4),
+                mark=round(_safe_float(pos.get("mark_price"), 0), 4),
+                pnl=round(_safe_float(pos.get("floating_profit_loss"), 0), 4),
+                liq=_round_or_none(_safe_float(pos.get("estimated_liquidation_price")), 2),
             )
+            for size, pos in open_positions
+        ]
 
         return PositionsResponse(
             ccy=currency,
             count=total,
             positions=compact_positions,
             notes=notes[:6],
-        ).model_dump()
+        )
 
     except DeribitError as e:
         return ErrorResponse(
             code=e.code,
             message=e.message[:100],
             notes=[f"currency:{currency}", f"kind:{kind}"],
-        ).model_dump()
+        )
 
 
 async def open_orders(
     currency: Currency | None = None,
     instrument_name: str | None = None,
     client: DeribitJsonRpcClient | None = None,
-) -> dict:
+) -> OpenOrdersResponse | ErrorResponse:
     """
     Get open orders (requires authentication).
 
@@ -1083,7 +1358,7 @@ async def open_orders(
             code=403,
             message="Private API disabled. Set DERIBIT_ENABLE_PRIVATE=true",
             notes=["private_api_disabled"],
-        ).model_dump()
+        )
 
     client = client or get_client()
     notes: list[str] = []
@@ -1102,7 +1377,7 @@ async def open_orders(
                 code=400,
                 message="Either currency or instrument_name required",
                 notes=[],
-            ).model_dump()
+            )
 
         orders_list = result if isinstance(result, list) else []
         total = len(orders_list)
@@ -1130,20 +1405,20 @@ async def open_orders(
             count=total,
             orders=compact_orders,
             notes=notes[:6],
-        ).model_dump()
+        )
 
     except DeribitError as e:
         return ErrorResponse(
             code=e.code,
             message=e.message[:100],
             notes=["auth_required"],
-        ).model_dump()
+        )
 
 
 async def place_order(
     request: PlaceOrderRequest,
     client: DeribitJsonRpcClient | None = None,
-) -> dict:
+) -> PlaceOrderResponse | ErrorResponse:
     """
     Place an order (requires authentication).
 
@@ -1162,7 +1437,7 @@ async def place_order(
             code=403,
             message="Private API disabled. Set DERIBIT_ENABLE_PRIVATE=true",
             notes=["private_api_disabled"],
-        ).model_dump()
+        )
 
     client = client or get_client()
     notes: list[str] = []
@@ -1197,7 +1472,7 @@ async def place_order(
             order_id=None,
             status="simulated",
             notes=notes[:6],
-        ).model_dump()
+        )
 
     # LIVE TRADING
     try:
@@ -1212,20 +1487,20 @@ async def place_order(
             order_id=order_data.get("order_id"),
             status=order_data.get("order_state", "submitted"),
             notes=notes[:6],
-        ).model_dump()
+        )
 
     except DeribitError as e:
         return ErrorResponse(
             code=e.code,
             message=e.message[:100],
             notes=[f"instrument:{request.instrument}", "order_failed"],
-        ).model_dump()
+        )
 
 
 async def cancel_order(
     order_id: str,
     client: DeribitJsonRpcClient | None = None,
-) -> dict:
+) -> dict | ErrorResponse:
     """
     Cancel an order (requires authentication).
 
@@ -1243,7 +1518,7 @@ async def cancel_order(
             code=403,
             message="Private API disabled. Set DERIBIT_ENABLE_PRIVATE=true",
             notes=["private_api_disabled"],
-        ).model_dump()
+        )
 
     client = client or get_client()
     notes: list[str] = []
@@ -1272,4 +1547,4 @@ async def cancel_order(
             code=e.code,
             message=e.message[:100],
             notes=[f"order_id:{order_id}", "cancel_failed"],
-        ).model_dump()
+        )
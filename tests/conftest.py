@@ -3,53 +3,61 @@ Pytest configuration and fixtures.
 """
 
 import os
+from types import MappingProxyType
+
 import pytest
 
-# Set test environment variables before importing modules
-os.environ.setdefault("DERIBIT_ENV", "test")
-os.environ.setdefault("DERIBIT_ENABLE_PRIVATE", "false")
-os.environ.setdefault("DERIBIT_CLIENT_ID", "")
-os.environ.setdefault("DERIBIT_CLIENT_SECRET", "")
-os.environ.setdefault("DERIBIT_TIMEOUT_S", "5")
-os.environ.setdefault("DERIBIT_MAX_RPS", "10")
-os.environ.setdefault("DERIBIT_CACHE_TTL_FAST", "1")
-os.environ.setdefault("DERIBIT_CACHE_TTL_SLOW", "30")
+# Test environment defaults, applied before importing modules.
+# Variables already set in the environment take precedence.
+_TEST_ENV = MappingProxyType(
+    {
+        "DERIBIT_ENV": "test",
+        "DERIBIT_ENABLE_PRIVATE": "false",
+        "DERIBIT_CLIENT_ID": "",
+        "DERIBIT_CLIENT_SECRET": "",
+        "DERIBIT_TIMEOUT_S": "5",
+        "DERIBIT_MAX_RPS": "10",
+        "DERIBIT_CACHE_TTL_FAST": "1",
+        "DERIBIT_CACHE_TTL_SLOW": "30",
+    }
+)
+os.environ.update({k: v for k, v in _TEST_ENV.items() if k not in os.environ})
+
+from deribit_mcp.config import get_settings, get_settings_view  # noqa: E402
 
 
-@pytest.fixture(autouse=True)
-def reset_settings():
-    """Reset settings cache before each test."""
-    from deribit_mcp.config import get_settings
+@pytest.fixture
+def clear_settings_cache():
+    """
+    Clear the cached settings around a test.
 
+    Use in tests that change DERIBIT_* environment variables, so the change
+    is picked up and doesn't leak into later tests.
+    """
     get_settings.cache_clear()
+    get_settings_view.cache_clear()
     yield
     get_settings.cache_clear()
+    get_settings_view.cache_clear()
 
 
-@pytest.fixture
-def mock_api_response():
-    """Factory for creating mock API responses."""
+def _create_response(result=None, error=None):
+    """Build a JSON-RPC response envelope (a fresh dict per call)."""
+    if error:
+        return {"jsonrpc": "2.0", "id": 1, "error": error}
+    return {"jsonrpc": "2.0", "id": 1, "result": result}
 
-    def _create_response(result=None, error=None):
-        if error:
-            return {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "error": error,
-            }
-        return {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "result": result,
-        }
 
+@pytest.fixture(scope="session")
+def mock_api_response():
+    """Factory for creating mock API responses."""
     return _create_response
 
 
-@pytest.fixture
-def sample_ticker_response():
-    """Sample ticker response data."""
-    return {
+# Read-only sample payloads, shared by every test that requests them; copy
+# with dict(...) before mutating
+_SAMPLE_TICKER = MappingProxyType(
+    {
         "best_bid_price": 50000.0,
         "best_ask_price": 50001.0,
         "mark_price": 50000.5,
@@ -57,45 +65,58 @@ def sample_ticker_response():
         "underlying_price": 50000.0,
         "mark_iv": 80.0,  # Percentage form
         "open_interest": 1000000,
-        "stats": {"volume": 50000},
+        "stats": MappingProxyType({"volume": 50000}),
         "current_funding": 0.0001,
-        "greeks": {
-            "delta": 0.5,
-            "gamma": 0.0001,
-            "vega": 100,
-            "theta": -50,
-        },
+        "greeks": MappingProxyType(
+            {
+                "delta": 0.5,
+                "gamma": 0.0001,
+                "vega": 100,
+                "theta": -50,
+            }
+        ),
     }
+)
 
-
-@pytest.fixture
-def sample_orderbook_response():
-    """Sample orderbook response data."""
-    return {
+_SAMPLE_ORDERBOOK = MappingProxyType(
+    {
         "best_bid_price": 50000.0,
         "best_ask_price": 50001.0,
-        "bids": [
-            [50000.0, 1.0],
-            [49999.0, 2.0],
-            [49998.0, 3.0],
-            [49997.0, 4.0],
-            [49996.0, 5.0],
-            [49995.0, 6.0],  # Will be truncated
-        ],
-        "asks": [
-            [50001.0, 1.0],
-            [50002.0, 2.0],
-            [50003.0, 3.0],
-            [50004.0, 4.0],
-            [50005.0, 5.0],
-            [50006.0, 6.0],  # Will be truncated
-        ],
+        "bids": (
+            (50000.0, 1.0),
+            (49999.0, 2.0),
+            (49998.0, 3.0),
+            (49997.0, 4.0),
+            (49996.0, 5.0),
+            (49995.0, 6.0),  # Will be truncated
+        ),
+        "asks": (
+            (50001.0, 1.0),
+            (50002.0, 2.0),
+            (50003.0, 3.0),
+            (50004.0, 4.0),
+            (50005.0, 5.0),
+            (50006.0, 6.0),  # Will be truncated
+        ),
     }
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_ticker_response():
+    """Sample ticker response data (read-only)."""
+    return _SAMPLE_TICKER
+
+
+@pytest.fixture(scope="session")
+def sample_orderbook_response():
+    """Sample orderbook response data (read-only)."""
+    return _SAMPLE_ORDERBOOK
+
+
+@pytest.fixture(scope="session")
 def sample_instruments_response():
-    """Sample instruments response data."""
+    """Sample instruments response data (built once; treat as read-only)."""
     return [
         {
             "instrument_name": f"BTC-28JUN24-{50000 + i * 1000}-C",
@@ -9,6 +9,8 @@ Covers:
 """
 
 import math
+from functools import partial
+
 import pytest
 
 from deribit_mcp.analytics import (
@@ -23,30 +25,24 @@ from deribit_mcp.analytics import (
     MINUTES_PER_YEAR,
 )
 
+# Tolerance for exact closed-form results
+_close = partial(math.isclose, abs_tol=1e-10)
 
-class TestIVConversion:
-    """Tests for IV conversion functions."""
-
-    def test_iv_annualized_to_horizon_1hour(self):
-        """Test IV conversion for 1 hour horizon."""
-        iv_annual = 0.80  # 80% annual IV
-        horizon_minutes = 60  # 1 hour
-
-        result = iv_annualized_to_horizon(iv_annual, horizon_minutes)
+# sqrt(horizon / year) for the horizons under test, keyed by minutes
+_SQRT_T = {h: math.sqrt(h / MINUTES_PER_YEAR) for h in (60, 240, 1440, 10080)}
 
-        # Expected: 0.80 * sqrt(60 / 525600) ≈ 0.00855
-        expected = 0.80 * math.sqrt(60 / MINUTES_PER_YEAR)
-        assert abs(result - expected) < 1e-10
 
-    def test_iv_annualized_to_horizon_1day(self):
-        """Test IV conversion for 1 day horizon."""
-        iv_annual = 0.80
-        horizon_minutes = 1440  # 24 hours
+class TestIVConversion:
+    """Tests for IV conversion functions."""
 
-        result = iv_annualized_to_horizon(iv_annual, horizon_minutes)
+    @pytest.mark.parametrize("horizon_minutes", [60, 240, 1440, 10080])
+    def test_iv_annualized_to_horizon(self, horizon_minutes):
+        """Test IV scales with the square root of the horizon (1h to 1w)."""
+        result = iv_annualized_to_horizon(0.80, horizon_minutes)
 
-        expected = 0.80 * math.sqrt(1440 / MINUTES_PER_YEAR)
-        assert abs(result - expected) < 1e-10
+        # e.g. 1h: 0.80 * sqrt(60 / 525600) ≈ 0.00855
+        expected = 0.80 * _SQRT_T[horizon_minutes]
+        assert _close(result, expected)
 
     def test_iv_annualized_zero_horizon(self):
         """Test IV conversion with zero horizon returns 0."""
@@ -78,8 +74,8 @@ class TestExpectedMove:
         assert result.confidence == 1.0
 
         # Verify math: 100000 * 0.80 * sqrt(60/525600) ≈ 854.6
-        expected_move = spot * iv_annual * math.sqrt(horizon_minutes / MINUTES_PER_YEAR)
-        assert abs(result.move_points - expected_move) < 0.1
+        expected_move = spot * iv_annual * _SQRT_T[horizon_minutes]
+        assert math.isclose(result.move_points, expected_move, abs_tol=0.1)
 
     def test_expected_move_bps(self):
         """Test expected move in basis points."""
@@ -91,7 +87,7 @@ class TestExpectedMove:
 
         # BPS = (move_points / spot) * 10000
         expected_bps = (result.move_points / spot) * 10000
-        assert abs(result.move_bps - expected_bps) < 0.01
+        assert math.isclose(result.move_bps, expected_bps, abs_tol=0.01)
 
     def test_expected_move_bands(self):
         """Test expected move bands (up/down 1σ)."""
@@ -128,7 +124,7 @@ class TestExpectedMove:
 
         # 4h move should be ~2x the 1h move (sqrt(4) = 2)
         ratio = result_4h.move_points / result_1h.move_points
-        assert abs(ratio - 2.0) < 0.01
+        assert math.isclose(ratio, 2.0, abs_tol=0.01)
 
 
 class TestRiskReversal:
@@ -141,7 +137,7 @@ class TestRiskReversal:
 
         rr = calculate_risk_reversal(call_iv, put_iv)
 
-        assert abs(rr - 0.05) < 1e-10  # Calls more expensive
+        assert _close(rr, 0.05)  # Calls more expensive
 
     def test_risk_reversal_bearish(self):
         """Test negative risk reversal (bearish skew)."""
@@ -150,7 +146,7 @@ class TestRiskReversal:
 
         rr = calculate_risk_reversal(call_iv, put_iv)
 
-        assert abs(rr - (-0.10)) < 1e-10  # Puts more expensive
+        assert _close(rr, -0.10)  # Puts more expensive
 
     def test_risk_reversal_none(self):
         """Test risk reversal with missing data."""
@@ -171,7 +167,7 @@ class TestButterfly:
         fly = calculate_butterfly(call_iv, put_iv, atm_iv)
 
         # (0.85 + 0.85) / 2 - 0.80 = 0.05
-        assert abs(fly - 0.05) < 1e-10
+        assert _close(fly, 0.05)
 
     def test_butterfly_negative(self):
         """Test negative butterfly (thin tails)."""
@@ -181,7 +177,7 @@ class TestButterfly:
 
         fly = calculate_butterfly(call_iv, put_iv, atm_iv)
 
-        assert abs(fly - (-0.05)) < 1e-10
+        assert _close(fly, -0.05)
 
     def test_butterfly_none(self):
         """Test butterfly with missing data."""
@@ -193,61 +189,40 @@ class TestButterfly:
 class TestSpreadCalculations:
     """Tests for spread calculations."""
 
-    def test_spread_in_bps(self):
+    @pytest.mark.parametrize(
+        ("bid", "ask", "expected"),
+        [
+            (99.0, 101.0, 200.0),  # spread 2, mid 100
+            (99.99, 100.01, 2.0),  # spread 0.02, mid 100
+        ],
+    )
+    def test_spread_in_bps(self, bid, ask, expected):
         """Test spread calculation in basis points."""
-        bid = 99.0
-        ask = 101.0
-
-        result = spread_in_bps(bid, ask)
+        assert spread_in_bps(bid, ask) == pytest.approx(expected, abs=0.01)
 
-        # Spread = 2, mid = 100, bps = 2/100 * 10000 = 200
-        assert abs(result - 200) < 0.01
-
-    def test_spread_in_bps_tight(self):
-        """Test tight spread calculation."""
-        bid = 99.99
-        ask = 100.01
-
-        result = spread_in_bps(bid, ask)
-
-        # Spread = 0.02, mid = 100, bps = 2
-        assert abs(result - 2) < 0.01
-
-    def test_spread_invalid(self):
+    @pytest.mark.parametrize(("bid", "ask"), [(0, 100), (100, 0), (-1, 100)])
+    def test_spread_invalid(self, bid, ask):
         """Test spread with invalid inputs."""
-        assert spread_in_bps(0, 100) is None
-        assert spread_in_bps(100, 0) is None
-        assert spread_in_bps(-1, 100) is None
+        assert spread_in_bps(bid, ask) is None
 
 
 class TestImbalance:
     """Tests for order book imbalance calculation."""
 
-    def test_imbalance_balanced(self):
-        """Test balanced book."""
-        result = calculate_imbalance(100, 100)
-        assert result == 0.0
-
-    def test_imbalance_bid_heavy(self):
-        """Test bid-heavy book."""
-        result = calculate_imbalance(100, 0)
-        assert result == 1.0
-
-    def test_imbalance_ask_heavy(self):
-        """Test ask-heavy book."""
-        result = calculate_imbalance(0, 100)
-        assert result == -1.0
-
-    def test_imbalance_partial(self):
-        """Test partial imbalance."""
-        result = calculate_imbalance(75, 25)
-        # (75 - 25) / 100 = 0.5
-        assert result == 0.5
-
-    def test_imbalance_zero(self):
-        """Test zero depth."""
-        result = calculate_imbalance(0, 0)
-        assert result is None
+    @pytest.mark.parametrize(
+        ("bid_depth", "ask_depth", "expected"),
+        [
+            (100, 100, 0.0),  # balanced
+            (100, 0, 1.0),  # bid heavy
+            (0, 100, -1.0),  # ask heavy
+            (75, 25, 0.5),  # (75 - 25) / 100
+            (0, 0, None),  # no depth
+        ],
+        ids=["balanced", "bid_heavy", "ask_heavy", "partial", "zero"],
+    )
+    def test_imbalance(self, bid_depth, ask_depth, expected):
+        """Test imbalance across balanced, one-sided and empty books."""
+        assert calculate_imbalance(bid_depth, ask_depth) == expected
 
 
 class TestDaysToExpiry:
@@ -260,7 +235,7 @@ class TestDaysToExpiry:
 
         result = days_to_expiry_from_ts(expiry_ts_ms, current_ts_ms)
 
-        assert abs(result - 7.0) < 0.001
+        assert math.isclose(result, 7.0, abs_tol=0.001)
 
     def test_days_to_expiry_expired(self):
         """Test expired option returns 0."""
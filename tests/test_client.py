@@ -10,9 +10,12 @@ Covers:
 
 import asyncio
 import time
+from functools import cache
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import respx
 
 from deribit_mcp.client import (
     CacheEntry,
@@ -22,13 +25,27 @@ from deribit_mcp.client import (
     DeribitTimeoutError,
     TokenBucket,
 )
-from deribit_mcp.config import Settings
+from deribit_mcp.config import Settings, get_settings, get_settings_view, sanitize_log_message
 
 
-@pytest.fixture
+@cache
+def _cached_settings(items: tuple) -> Settings:
+    return Settings(**dict(items))
+
+
+def make_settings(**kwargs) -> Settings:
+    """
+    Build Settings once per distinct set of overrides and reuse it.
+
+    Instances are shared between tests, so treat them as read-only.
+    """
+    return _cached_settings(tuple(sorted(kwargs.items())))
+
+
+@pytest.fixture(scope="session")
 def mock_settings():
-    """Create mock settings for testing."""
-    return Settings(
+    """Create mock settings for testing (read-only, shared by all tests)."""
+    return make_settings(
         env="test",
         enable_private=False,
         client_id="",
@@ -42,10 +59,42 @@ def mock_settings():
 
 @pytest.fixture
 def client(mock_settings):
-    """Create a client with mock settings."""
+    """Create a fresh client with mock settings (cheap; no I/O until used)."""
     return DeribitJsonRpcClient(settings=mock_settings)
 
 
+class _AsyncioProxy:
+    """Stand-in for the asyncio module with its own sleep; everything else delegates."""
+
+    def __init__(self, sleep):
+        self.sleep = sleep
+
+    def __getattr__(self, name):
+        return getattr(asyncio, name)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """
+    Drive the client module's monotonic clock by hand.
+
+    Sleeping advances the clock instead of waiting. Only the client module's
+    `time` and `asyncio` names are replaced; the real modules, and so the
+    event loop and other libraries, are left untouched.
+    """
+    clock = {"now": 0.0}
+
+    async def fake_sleep(delay):
+        clock["now"] += delay
+
+    monkeypatch.setattr(
+        "deribit_mcp.client.time",
+        SimpleNamespace(monotonic=lambda: clock["now"], time=time.time),
+    )
+    monkeypatch.setattr("deribit_mcp.client.asyncio", _AsyncioProxy(fake_sleep))
+    return clock
+
+
 class TestTokenBucket:
     """Tests for token bucket rate limiter."""
 
@@ -60,33 +109,34 @@ class TestTokenBucket:
         assert bucket.tokens == 9.0
 
     @pytest.mark.asyncio
-    async def test_acquire_wait(self):
+    async def test_acquire_wait(self, fake_clock):
         """Test waiting when tokens not available."""
-        bucket = TokenBucket(rate=10.0, capacity=1.0)
+        bucket = TokenBucket(rate=10.0, capacity=1.0, last_update=0.0)
         bucket.tokens = 0.0
 
-        start = time.monotonic()
         wait_time = await bucket.acquire(1.0)
-        elapsed = time.monotonic() - start
 
-        # Should have waited ~0.1s (1 token at 10/s rate)
-        assert wait_time > 0
-        assert elapsed >= 0.09  # Allow some tolerance
+        # Should have waited 0.1s (1 token at 10/s rate)
+        assert wait_time == pytest.approx(0.1)
+        assert fake_clock["now"] == pytest.approx(0.1)
+
+    def test_fake_clock_leaves_asyncio_alone(self, fake_clock):
+        """Test the fake clock only patches the client module's view of asyncio."""
+        assert asyncio.sleep.__module__ == "asyncio.tasks"
 
     @pytest.mark.asyncio
-    async def test_token_refill(self):
+    async def test_token_refill(self, fake_clock):
         """Test token refill over time."""
-        bucket = TokenBucket(rate=10.0, capacity=10.0)
+        bucket = TokenBucket(rate=10.0, capacity=10.0, last_update=0.0)
         bucket.tokens = 5.0
 
-        # Wait a bit for tokens to refill
-        await asyncio.sleep(0.2)
+        fake_clock["now"] += 0.2
 
         # Acquire should trigger refill calculation
         await bucket.acquire(1.0)
 
-        # Should have refilled ~2 tokens in 0.2s at 10/s
-        assert bucket.tokens >= 5.5  # At least some refill
+        # Should have refilled 2 tokens in 0.2s at 10/s, then spent 1
+        assert bucket.tokens == pytest.approx(6.0)
 
 
 class TestCache:
@@ -108,6 +158,7 @@ class TestCache:
 
         assert fast_ttl == client.settings.cache_ttl_fast
         assert slow_ttl == client.settings.cache_ttl_slow
+        assert client._get_cache_ttl("public/get_volatility_index_data") == slow_ttl
 
     def test_cache_hit(self, client):
         """Test cache hit returns cached value."""
@@ -199,6 +250,13 @@ class TestErrorHandling:
         assert isinstance(error, DeribitError)
         assert error.code == 10028
 
+    def test_error_message_bounded(self):
+        """Test long upstream messages are truncated once at construction."""
+        error = DeribitError(code=-1, message="x" * 5000)
+
+        assert len(error.message) == DeribitError.MAX_MESSAGE_LENGTH
+        assert len(str(error)) < 300
+
     def test_timeout_error(self):
         """Test timeout error is subclass."""
         error = DeribitTimeoutError(code=-1, message="Request timeout")
@@ -215,14 +273,64 @@ class TestErrorHandling:
         # Set cache
         client._set_cache(method, params, cached_value)
 
-        # Mock the request method to track calls
-        client._do_request = AsyncMock()
+        # Track calls to the request method without the mock machinery
+        called = False
+
+        async def _should_not_be_called(*args, **kwargs):
+            nonlocal called
+            called = True
+
+        client._do_request = _should_not_be_called
 
         # Call should use cache
         result = await client.call(method, params)
 
         assert result == cached_value
-        client._do_request.assert_not_called()
+        assert not called
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_coalesced(self, client):
+        """Test concurrent identical public calls share one request."""
+        release = asyncio.Event()
+
+        async def slow_request(method, params=None, access_token=None):
+            await release.wait()
+            return {"mark_price": 50000}
+
+        client._do_request = AsyncMock(side_effect=slow_request)
+        params = {"instrument_name": "BTC-PERPETUAL"}
+
+        calls = [asyncio.create_task(client.call("public/ticker", params)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*calls)
+
+        assert results == [{"mark_price": 50000}] * 3
+        client._do_request.assert_awaited_once()
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_private_calls_not_coalesced(self, client):
+        """Test authenticated calls are never shared between callers."""
+        release = asyncio.Event()
+
+        async def slow_request(method, params=None, access_token=None):
+            await release.wait()
+            return []
+
+        client._do_request = AsyncMock(side_effect=slow_request)
+        client._get_access_token = AsyncMock(return_value="token")
+        method = "private/get_open_orders_by_currency"
+
+        calls = [
+            asyncio.create_task(client.call(method, {"currency": "BTC"}, use_auth=True))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*calls)
+
+        assert client._do_request.await_count == 2
 
 
 class TestClientIntegration:
@@ -240,6 +348,55 @@ class TestClientIntegration:
 
         assert client._http_client is None
 
+    @pytest.mark.asyncio
+    async def test_http_client_reused(self, client):
+        """Test the pooled HTTP client is built once and reused."""
+        http_client = client.http_client
+
+        assert client.http_client is http_client
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_do_request_decodes_result(self, client):
+        """Test JSON-RPC responses are decoded and unwrapped."""
+        with respx.mock(base_url=client.settings.base_url) as router:
+            router.post("").respond(
+                json={"jsonrpc": "2.0", "id": 1, "result": {"timestamp": 1700000000000}}
+            )
+
+            result = await client._do_request("public/get_time")
+
+        assert result == {"timestamp": 1700000000000}
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_do_request_encodes_payload(self, client):
+        """Test the JSON-RPC request body is sent as compact JSON."""
+        with respx.mock(base_url=client.settings.base_url) as router:
+            route = router.post("").respond(json={"jsonrpc": "2.0", "id": 1, "result": 1})
+
+            await client._do_request("public/ticker", {"instrument_name": "BTC-PERPETUAL"})
+
+        request = route.calls.last.request
+        assert request.content == (
+            b'{"jsonrpc":"2.0","id":1,"method":"public/ticker",'
+            b'"params":{"instrument_name":"BTC-PERPETUAL"}}'
+        )
+        assert request.headers["Content-Type"] == "application/json"
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_do_request_invalid_json(self, client):
+        """Test undecodable bodies surface as DeribitError."""
+        with respx.mock(base_url=client.settings.base_url) as router:
+            router.post("").respond(content=b"<html>bad gateway</html>")
+
+            with pytest.raises(DeribitError) as exc_info:
+                await client._do_request("public/get_time")
+
+        assert exc_info.value.code == -1
+        await client.close()
+
     def test_request_id_increments(self, client):
         """Test request ID increments correctly."""
         id1 = client._next_request_id()
@@ -256,7 +413,7 @@ class TestConfigSecurity:
 
     def test_secret_not_in_summary(self):
         """Test that secrets are masked in config summary."""
-        settings = Settings(
+        settings = make_settings(
             env="prod",
             client_id="test_client_123",
             client_secret="super_secret_key_abc",
@@ -271,16 +428,39 @@ class TestConfigSecurity:
 
     def test_has_credentials_check(self):
         """Test credentials check."""
-        no_creds = Settings(client_id="", client_secret="")
-        has_creds = Settings(client_id="id", client_secret="secret")
+        no_creds = make_settings(client_id="", client_secret="")
+        has_creds = make_settings(client_id="id", client_secret="secret")
 
         assert not no_creds.has_credentials
         assert has_creds.has_credentials
 
     def test_base_url_selection(self):
         """Test correct base URL for environment."""
-        prod = Settings(env="prod")
-        test = Settings(env="test")
+        prod = make_settings(env="prod")
+        test = make_settings(env="test")
 
         assert "www.deribit.com" in prod.base_url
         assert "test.deribit.com" in test.base_url
+
+    def test_settings_view_snapshot(self, monkeypatch, clear_settings_cache):
+        """Test settings view mirrors settings and is cached."""
+        monkeypatch.setenv("DERIBIT_ENABLE_PRIVATE", "true")
+
+        view = get_settings_view()
+
+        assert view.enable_private is True
+        assert view.env_value == get_settings().env.value
+        assert view.sse_max_queue_size == get_settings().sse_max_queue_size
+        assert get_settings_view() is view
+
+    def test_sanitize_log_message_patterns(self):
+        """Test generic secret patterns are redacted."""
+        settings = make_settings(client_id="", client_secret="")
+
+        sanitized = sanitize_log_message(
+            '{"access_token": "abc123", "instrument": "BTC-PERPETUAL"}', settings
+        )
+
+        assert "abc123" not in sanitized
+        assert "***REDACTED***" in sanitized
+        assert "BTC-PERPETUAL" in sanitized
@@ -0,0 +1,473 @@
+"""
+Tests for the HTTP/SSE transport.
+
+Covers:
+- JSON response rendering
+- Health check probe caching
+- Request body parsing
+- Cached tool listing
+- MCP message delivery over SSE
+- Session expiry and backpressure
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from starlette.responses import Response
+from starlette.testclient import TestClient
+
+from deribit_mcp import http_server
+from deribit_mcp.http_server import ORJSONResponse, SSESession
+from deribit_mcp.models import StatusResponse
+
+
+class TestORJSONResponse:
+    """Tests for the orjson-backed response class."""
+
+    def test_render_compact(self):
+        """Body should be compact JSON with the JSON media type."""
+        response = ORJSONResponse({"a": 1, "b": [1, 2]})
+        assert response.body == b'{"a":1,"b":[1,2]}'
+        assert response.media_type == "application/json"
+
+    def test_render_non_ascii(self):
+        """Non-ASCII text should be emitted as UTF-8, not escaped."""
+        response = ORJSONResponse({"note": "数据"})
+        assert json.loads(response.body) == {"note": "数据"}
+        assert "数据".encode() in response.body
+
+    def test_bytes_passed_through(self):
+        """Pre-encoded bodies should be sent unchanged with a Content-Length."""
+        body = b'{"jsonrpc":"2.0","id":1,"result":{}}'
+        response = ORJSONResponse(body)
+        assert response.body == body
+        assert response.headers["content-length"] == str(len(body))
+
+    def test_status_code(self):
+        """Status code should pass through."""
+        response = ORJSONResponse({"error": True}, status_code=400)
+        assert response.status_code == 400
+
+
+class TestHealthCheck:
+    """Tests for the /health endpoint."""
+
+    async def test_probe_is_cached(self, monkeypatch):
+        """Rapid health checks should reuse the last public API probe."""
+        calls = []
+
+        async def fake_status(client=None):
+            calls.append(client)
+            return StatusResponse(env="prod", api_ok=True, server_time_ms=1700000000000)
+
+        monkeypatch.setattr(http_server, "deribit_status", fake_status)
+        monkeypatch.setattr(http_server, "get_client", lambda: None)
+        monkeypatch.setattr(http_server, "_health_probe", http_server._HealthProbe())
+
+        first = json.loads((await http_server.health_check(None)).body)
+        second = json.loads((await http_server.health_check(None)).body)
+
+        assert len(calls) == 1
+        assert first["api_ok"] is True
+        assert second["server_time_ms"] == 1700000000000
+
+    async def test_probe_failure_reported(self, monkeypatch):
+        """A failed probe should mark the server unhealthy."""
+
+        async def failing_status(client=None):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(http_server, "deribit_status", failing_status)
+        monkeypatch.setattr(http_server, "get_client", lambda: None)
+        monkeypatch.setattr(http_server, "_health_probe", http_server._HealthProbe())
+
+        body = json.loads((await http_server.health_check(None)).body)
+
+        assert body["status"] == "unhealthy"
+        assert body["errors"] == ["Public API error: boom"]
+
+    async def test_concurrent_stale_checks_share_probe(self, monkeypatch):
+        """Concurrent checks that find the probe stale should share one probe."""
+        calls = []
+        release = asyncio.Event()
+
+        async def slow_status(client=None):
+            calls.append(client)
+            await release.wait()
+            return StatusResponse(env="prod", api_ok=True, server_time_ms=1700000000000)
+
+        monkeypatch.setattr(http_server, "deribit_status", slow_status)
+        monkeypatch.setattr(http_server, "get_client", lambda: None)
+        monkeypatch.setattr(http_server, "_health_probe", http_server._HealthProbe())
+
+        checks = [asyncio.ensure_future(http_server.health_check(None)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        bodies = [json.loads(response.body) for response in await asyncio.gather(*checks)]
+
+        assert len(calls) == 1
+        assert all(body["api_ok"] is True for body in bodies)
+        assert http_server._health_probe_task is None
+
+
+class TestRequestParsing:
+    """Tests for JSON request body handling."""
+
+    def test_call_tool_invalid_json(self):
+        """Malformed bodies should be rejected with a 400."""
+        client = TestClient(http_server.app)
+        response = client.post("/tools/call", content=b"{not json")
+        assert response.status_code == 400
+        assert response.json() == {"error": True, "code": 400, "message": "Invalid JSON"}
+
+    def test_mcp_message_parse_error(self):
+        """Malformed JSON-RPC bodies should return a parse error."""
+        client = TestClient(http_server.app)
+        response = client.post("/mcp/message", content=b"[1,")
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == -32700
+
+    def test_call_tool_missing_name(self):
+        """Valid JSON without a tool name should be rejected."""
+        client = TestClient(http_server.app)
+        response = client.post("/tools/call", content=b'{"arguments":{}}')
+        assert response.status_code == 400
+        assert response.json()["message"] == "Missing tool name"
+
+
+@pytest.fixture
+async def sse_session(monkeypatch):
+    """Register a bare SSE session without opening a stream."""
+    session = SSESession("a" * 32)
+    monkeypatch.setitem(http_server._sessions, session.session_id, session)
+    return session
+
+
+async def _post_message(body: dict) -> httpx.Response:
+    transport = httpx.ASGITransport(app=http_server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.post("/mcp/message", json=body)
+
+
+class TestMessageDelivery:
+    """Tests for JSON-RPC responses pushed over the SSE stream."""
+
+    async def test_response_pushed_over_sse(self, sse_session):
+        """By default the response goes to the stream and the HTTP body."""
+        body = {"method": "initialize", "id": 7, "session_id": sse_session.session_id}
+        response = await _post_message(body)
+
+        assert response.json()["id"] == 7
+        assert sse_session.queue.qsize() == 1
+
+    async def test_stream_opt_out(self, sse_session):
+        """stream=false should only return the HTTP body."""
+        body = {
+            "method": "initialize",
+            "id": 8,
+            "session_id": sse_session.session_id,
+            "stream": False,
+        }
+        response = await _post_message(body)
+
+        assert response.json()["result"]["serverInfo"]["name"] == "deribit-mcp-server"
+        assert sse_session.queue.empty()
+
+    async def test_unknown_method(self, sse_session):
+        """Unknown methods should return a method-not-found error."""
+        body = {"method": "resources/list", "id": 9, "session_id": sse_session.session_id}
+        response = await _post_message(body)
+
+        assert response.json()["error"]["code"] == -32601
+
+    async def test_tools_list_method(self, sse_session):
+        """tools/list should return the cached tool listing."""
+        body = {"method": "tools/list", "id": 10, "session_id": sse_session.session_id}
+        response = await _post_message(body)
+
+        assert response.json()["result"] == http_server._tools_result(False)
+
+    async def test_tools_call_template(self, sse_session, monkeypatch):
+        """Templated tools/call bodies should carry the result as JSON text."""
+        result = {"inst": "BTC-PERPETUAL", "note": 'quoted "text"'}
+        monkeypatch.setattr(http_server, "_dispatch_tool", AsyncMock(return_value=result))
+        body = {
+            "method": "tools/call",
+            "id": "call-1",
+            "session_id": sse_session.session_id,
+            "params": {"name": "deribit_ticker", "arguments": {}},
+            "stream": False,
+        }
+        response = await _post_message(body)
+
+        payload = response.json()
+        assert payload["id"] == "call-1"
+        assert payload["result"]["content"][0]["type"] == "text"
+        assert json.loads(payload["result"]["content"][0]["text"]) == result
+
+    async def test_error_frame_template(self, sse_session):
+        """Templated error bodies should match a regular JSON-RPC error."""
+        body = {"method": "tools/call", "id": "req-1", "session_id": sse_session.session_id}
+        response = await _post_message(body)
+
+        expected = {
+            "jsonrpc": "2.0",
+            "id": "req-1",
+            "error": {"code": -32602, "message": "Missing tool name"},
+        }
+        assert response.json() == expected
+        assert _frame_payload(sse_session.queue.get_nowait()) == expected
+
+    async def test_missing_session_error(self):
+        """Requests without a session id should get a 400 JSON-RPC error."""
+        response = await _post_message({"method": "tools/list", "id": 3})
+
+        assert response.status_code == 400
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["error"]["code"] == -32602
+        assert response.json()["id"] == 3
+
+
+class TestSessionLifetime:
+    """Tests for SSE session expiry."""
+
+    async def test_fresh_session_active(self):
+        """A new session should not be timed out."""
+        session = SSESession("b" * 32)
+        assert not session.is_timed_out()
+
+    async def test_idle_timeout(self):
+        """Sessions idle past CONNECTION_TIMEOUT should expire."""
+        session = SSESession("c" * 32)
+        session.last_activity -= SSESession.CONNECTION_TIMEOUT + 1
+        assert session.is_timed_out()
+
+    async def test_expiry_timer_closes_idle_session(self):
+        """The per-session timer should close and unregister idle sessions."""
+        loop = asyncio.get_running_loop()
+        session = SSESession("9" * 32)
+        http_server._sessions[session.session_id] = session
+
+        # Armed for the idle timeout; fire it as if that much time had passed
+        assert session._expiry_timer.when() == pytest.approx(
+            loop.time() + SSESession.CONNECTION_TIMEOUT, abs=1.0
+        )
+        session._expiry_timer.cancel()
+        session.last_activity -= SSESession.CONNECTION_TIMEOUT + 1
+        session._on_expiry_timer()
+
+        assert session._closed
+        assert session.session_id not in http_server._sessions
+        assert session.queue.get_nowait() is None
+
+    async def test_expiry_timer_rearms_on_activity(self):
+        """Activity should push expiry out instead of closing the session."""
+        session = SSESession("8" * 32)
+        session._expiry_timer.cancel()
+
+        # The timer fires CONNECTION_TIMEOUT after creation, but the session
+        # saw activity 10s before that
+        session.created_at -= SSESession.CONNECTION_TIMEOUT
+        session.last_activity = session.created_at + SSESession.CONNECTION_TIMEOUT - 10
+        session._on_expiry_timer()
+
+        assert not session._closed
+        assert session._expiry_timer.when() == pytest.approx(
+            session.last_activity + SSESession.CONNECTION_TIMEOUT, abs=1.0
+        )
+        await session.close()
+
+    async def test_sessions_released_when_unreferenced(self):
+        """Closed sessions should drop out of the registry once released."""
+        session = SSESession("7" * 32)
+        http_server._sessions[session.session_id] = session
+        await session.close()
+        del session
+
+        assert "7" * 32 not in http_server._sessions
+
+    async def test_close_all_sessions(self, monkeypatch):
+        """Shutdown should close every registered session."""
+        sessions = [SSESession(f"{i}" * 32) for i in range(3)]
+        for session in sessions:
+            monkeypatch.setitem(http_server._sessions, session.session_id, session)
+
+        await http_server._close_all_sessions()
+
+        assert all(session._closed for session in sessions)
+
+    async def test_max_connection_duration(self):
+        """Active sessions should still expire after MAX_CONNECTION_DURATION."""
+        session = SSESession("d" * 32)
+        session.created_at -= SSESession.MAX_CONNECTION_DURATION + 1
+        session.mark_activity()
+        assert session.is_timed_out()
+
+
+def _frame_payload(frame: bytes) -> dict:
+    """Decode the JSON payload of an encoded SSE message frame."""
+    assert frame.startswith(b"event: message\ndata: ")
+    assert frame.endswith(b"\n\n")
+    return json.loads(frame[len(b"event: message\ndata: ") : -2])
+
+
+class TestSessionBackpressure:
+    """Tests for the bounded per-session queue."""
+
+    async def test_drop_oldest_when_full(self, monkeypatch):
+        """A full queue should drop its oldest message instead of blocking."""
+        monkeypatch.setattr(SSESession, "total_evictions", 0)
+        session = SSESession("e" * 32, max_queue_size=2)
+
+        for i in range(3):
+            await session.send("response", {"id": i})
+
+        assert session.queue.qsize() == 2
+        assert session.slow_evictions == 1
+        assert SSESession.total_evictions == 1
+        assert _frame_payload(session.queue.get_nowait()) == {"id": 1}
+
+    async def test_slow_client_closed(self, monkeypatch):
+        """Sessions should close after max_evictions dropped messages."""
+        monkeypatch.setattr(SSESession, "total_evictions", 0)
+        session = SSESession("f" * 32, max_queue_size=1, max_evictions=2)
+
+        for i in range(3):
+            await session.send("response", {"id": i})
+
+        assert session._closed
+        assert session.queue.get_nowait() is None
+
+    async def test_close_on_full_queue(self, monkeypatch):
+        """Closing must not block when the queue is full."""
+        monkeypatch.setattr(SSESession, "total_evictions", 0)
+        session = SSESession("0" * 32, max_queue_size=1)
+        await session.send("response", {"id": 1})
+
+        await asyncio.wait_for(session.close(), timeout=1.0)
+
+        assert session.queue.get_nowait() is None
+
+    async def test_drain_batches_ready_frames(self):
+        """Queued frames should be flushed together in order."""
+        session = SSESession("1" * 32)
+        for i in range(3):
+            await session.send("response", {"id": i})
+
+        first = session.queue.get_nowait()
+        payload, closing = http_server._drain_frames(session.queue, first)
+
+        assert not closing
+        assert payload.count(b"event: message") == 3
+        assert payload.index(b'{"id":0}') < payload.index(b'{"id":2}')
+        assert session.queue.empty()
+        await session.close()
+
+    async def test_drain_stops_at_close_sentinel(self):
+        """Frames before the close sentinel are kept and the close is reported."""
+        session = SSESession("2" * 32)
+        await session.send("response", {"id": 1})
+        await session.send("response", {"id": 2})
+        await session.close()
+
+        first = session.queue.get_nowait()
+        payload, closing = http_server._drain_frames(session.queue, first)
+
+        assert closing
+        assert payload.count(b"event: message") == 2
+
+
+class TestToolListing:
+    """Tests for the cached tools/list payload."""
+
+    def test_public_tools_listed(self):
+        """GET /tools should list the public tools only by default."""
+        client = TestClient(http_server.app)
+        response = client.get("/tools")
+        names = [tool["name"] for tool in response.json()["tools"]]
+
+        assert response.status_code == 200
+        assert "deribit_ticker" in names
+        assert "place_order" not in names
+
+    def test_tool_listing_gzipped(self):
+        """Large JSON responses should be gzip-compressed when accepted."""
+        client = TestClient(http_server.app)
+        response = client.get("/tools", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["tools"]
+
+    async def test_sse_route_not_compressed(self):
+        """The SSE route must bypass compression."""
+        frame = b"event: message\ndata: " + b"x" * 4096 + b"\n\n"
+
+        async def stream_app(scope, receive, send):
+            await Response(frame, media_type="text/event-stream")(scope, receive, send)
+
+        app = http_server.StreamSafeGZipMiddleware(stream_app, minimum_size=1024)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/sse", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.content == frame
+
+    def test_private_tools_included(self):
+        """Private tools should be appended when private mode is on."""
+        result = http_server._tools_result(True)
+        names = [tool["name"] for tool in result["tools"]]
+
+        assert names[: len(http_server.get_public_tools())] == [
+            tool.name for tool in http_server.get_public_tools()
+        ]
+        assert "place_order" in names
+
+    def test_payload_reused(self):
+        """Serialized payload should be built once per mode."""
+        assert http_server._tools_body(False) is http_server._tools_body(False)
+        assert http_server._tools_result(False) is not http_server._tools_result(True)
+
+
+class TestSessionFrames:
+    """Tests for pre-encoded SSE frames."""
+
+    async def test_send_encodes_frame(self):
+        """send() should enqueue a complete SSE message frame."""
+        session = SSESession("1" * 32)
+        await session.send("response", {"jsonrpc": "2.0", "id": 1, "result": {}})
+
+        frame = session.queue.get_nowait()
+
+        assert _frame_payload(frame) == {"jsonrpc": "2.0", "id": 1, "result": {}}
+        assert b"\n" not in frame[:-2].split(b"data: ", 1)[1]
+
+    async def test_keepalive_only_when_idle(self, monkeypatch):
+        """Keep-alive comments should only be queued on an idle stream."""
+        monkeypatch.setattr(SSESession, "KEEPALIVE_INTERVAL", 0)
+        session = SSESession("2" * 32)
+        task = asyncio.create_task(http_server._send_keepalive(session))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert session.queue.get_nowait() == http_server._KEEPALIVE_FRAME
+
+        session._keepalive_task = task
+        await session.close()
+        await asyncio.sleep(0)
+        assert task.cancelled() or task.done()
+
+
+class TestWorkers:
+    """Tests for worker count resolution."""
+
+    def test_explicit_workers(self):
+        """An explicit worker count should be used as-is."""
+        assert http_server._resolve_workers(3) == 3
+
+    def test_auto_workers(self):
+        """Zero should resolve to at least one worker."""
+        assert http_server._resolve_workers(0) >= 1
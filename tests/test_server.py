@@ -0,0 +1,139 @@
+"""
+Tests for the MCP server tool layer.
+
+Covers:
+- Cached tool listing
+- Tool argument validation
+- Tool dispatch
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from deribit_mcp.server import (
+    _HANDLERS,
+    _VALIDATORS,
+    _dispatch_tool,
+    _initialization_options,
+    call_tool,
+    get_private_tools,
+    get_public_tools,
+    list_tools,
+)
+
+
+@pytest.fixture
+def mock_client():
+    """Keep dispatch from constructing a real API client."""
+    with patch("deribit_mcp.server.get_client", return_value=MagicMock()) as get_client:
+        yield get_client.return_value
+
+
+class TestToolListing:
+    """Tests for the module-level tool lists."""
+
+    def test_tool_lists_cached(self):
+        """Tool lists should be built once and shared."""
+        assert get_public_tools() is get_public_tools()
+        assert get_private_tools() is get_private_tools()
+
+    async def test_list_tools_public_only(self):
+        """Private tools should only be listed when enabled."""
+        tools = await list_tools()
+
+        assert tools is get_public_tools()
+
+    async def test_list_tools_with_private(self, monkeypatch, clear_settings_cache):
+        """Enabling private tools should not mutate the public list."""
+        monkeypatch.setenv("DERIBIT_ENABLE_PRIVATE", "true")
+        public_count = len(get_public_tools())
+
+        tools = await list_tools()
+
+        assert len(tools) == public_count + len(get_private_tools())
+        assert len(get_public_tools()) == public_count
+
+    def test_initialization_options_cached(self):
+        """Initialization options should be built once and advertise tools."""
+        options = _initialization_options()
+
+        assert options is _initialization_options()
+        assert options.server_name == "deribit-mcp-server"
+        assert options.capabilities.tools is not None
+
+
+class TestArgumentValidation:
+    """Tests for the precompiled input schema validators."""
+
+    def test_validator_per_tool(self):
+        """Every public and private tool should have a validator."""
+        assert "deribit_ticker" in _VALIDATORS
+        assert "place_order" in _VALIDATORS
+
+    async def test_missing_required_argument(self, mock_client):
+        """Missing required arguments should return an error result."""
+        result = await _dispatch_tool("deribit_ticker", {})
+
+        assert result["error"] is True
+        assert result["code"] == 400
+        assert result["notes"] == ["invalid_params"]
+
+    async def test_enum_violation(self, mock_client):
+        """Values outside a schema enum should be rejected."""
+        result = await _dispatch_tool("dvol_snapshot", {"currency": "DOGE"})
+
+        assert result["error"] is True
+        assert "Invalid arguments" in result["message"]
+
+    async def test_defaults_applied(self, mock_client):
+        """Schema defaults should be filled in before dispatch."""
+        handler = AsyncMock(return_value={"count": 0})
+        with patch("deribit_mcp.server.deribit_instruments", handler):
+            await _dispatch_tool("deribit_instruments", {"currency": "BTC"})
+
+        handler.assert_awaited_once_with(
+            currency="BTC", kind="option", expired=False, client=mock_client
+        )
+
+    async def test_dispatch_with_only_required_arguments(self, mock_client):
+        """Handlers should read defaulted keys filled in by the validator."""
+        handler = AsyncMock(return_value={"ok": True})
+        with patch("deribit_mcp.server.expected_move_iv", handler):
+            await _dispatch_tool("expected_move_iv", {"currency": "ETH"})
+
+        handler.assert_awaited_once_with(
+            currency="ETH", horizon_minutes=60, method="dvol", client=mock_client
+        )
+
+    def test_handler_per_tool(self):
+        """Every listed tool should have a dispatch handler."""
+        assert set(_HANDLERS) == set(_VALIDATORS)
+
+    async def test_unknown_tool(self, mock_client):
+        """Unknown tools skip validation and return a 404 result."""
+        result = await _dispatch_tool("no_such_tool", {})
+
+        assert result["code"] == 404
+
+
+class TestCallTool:
+    """Tests for the stdio call_tool handler."""
+
+    async def test_result_encoded_as_text(self, mock_client):
+        """Results should be returned as a single compact JSON text item."""
+        with patch(
+            "deribit_mcp.server.dvol_snapshot",
+            AsyncMock(return_value={"ccy": "BTC", "dvol": 80.5, "notes": ["数据"]}),
+        ):
+            content = await call_tool("dvol_snapshot", {"currency": "BTC"})
+
+        assert len(content) == 1
+        assert content[0].text == '{"ccy":"BTC","dvol":80.5,"notes":["数据"]}'
+
+    async def test_errors_degrade(self, mock_client):
+        """Unexpected errors should become a compact error result."""
+        with patch("deribit_mcp.server.dvol_snapshot", AsyncMock(side_effect=RuntimeError("boom"))):
+            content = await call_tool("dvol_snapshot", {"currency": "BTC"})
+
+        assert '"notes":["internal_error"]' in content[0].text
@@ -7,25 +7,49 @@ Covers:
 - Error degradation
 """
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from pydantic import ValidationError
 
+from deribit_mcp._json import compact_json, dumps
+from deribit_mcp.client import DeribitError
 from deribit_mcp.models import (
     DvolResponse,
+    ErrorResponse,
     ExpectedMoveResponse,
     FundingResponse,
     InstrumentCompact,
     InstrumentsResponse,
     OrderBookSummaryResponse,
+    PriceLevel,
     StatusResponse,
     SurfaceResponse,
+    TenorIV,
     TickerResponse,
 )
 from deribit_mcp.tools import (
+    _atm_strike,
+    _current_ts_ms,
+    _format_expiry,
+    _gather_limited,
+    _nearest_tenor_expiry,
+    _option_index,
+    _quantized_ts_ms,
     _round_or_none,
     _safe_float,
+    deribit_instruments,
+    deribit_orderbook_summary,
+    deribit_status,
+    deribit_ticker,
+    dvol_snapshot,
+    expected_move_iv,
+    funding_snapshot,
+    market_iv_snapshot,
+    options_surface_snapshot,
+    positions,
 )
 
 
@@ -38,6 +62,12 @@ class TestHelperFunctions:
         assert _safe_float("2.5") == 2.5
         assert _safe_float(100) == 100.0
 
+    def test_safe_float_types(self):
+        """Test safe_float always returns a float for numeric input."""
+        assert type(_safe_float(100)) is float
+        assert _safe_float(True) == 1.0
+        assert _safe_float(0.0, default=5.0) == 0.0
+
     def test_safe_float_invalid(self):
         """Test safe_float with invalid inputs."""
         assert _safe_float(None) is None
@@ -50,173 +80,568 @@ class TestHelperFunctions:
         assert _round_or_none(None, 2) is None
         assert _round_or_none(1.999999, 4) == 2.0
 
+    def test_nearest_tenor_expiry(self):
+        """Test the closest expiry within half the target distance wins."""
+        day = 86_400_000
+        expiries = [2 * day, 6 * day, 15 * day, 90 * day]
+
+        assert _nearest_tenor_expiry(expiries, 7, 0) == 6 * day
+        assert _nearest_tenor_expiry(expiries, 14, 0) == 15 * day
+        assert _nearest_tenor_expiry(expiries, 45, 0) is None
+        assert _nearest_tenor_expiry([], 7, 0) is None
+
+    def test_atm_strike(self):
+        """Test the strike closest to spot is picked from a sorted list."""
+        strikes = [30000.0, 35000.0, 40000.0]
+
+        assert _atm_strike(strikes, 36000) == 35000.0
+        assert _atm_strike(strikes, 10000) == 30000.0
+        assert _atm_strike(strikes, 99000) == 40000.0
+        assert _atm_strike([], 36000) is None
+
+    def test_option_index_memoized(self):
+        """Test a chain is indexed once and rebuilt only for a new list."""
+        chain = [
+            {"expiration_timestamp": 2, "strike": 40000},
+            {"expiration_timestamp": 1, "strike": 35000},
+            {"expiration_timestamp": 1, "strike": 30000},
+            {"expiration_timestamp": 1, "strike": 35000},
+        ]
+
+        index = _option_index(chain)
+
+        assert index.expiries == [1, 2]
+        assert index.strikes[1] == [30000.0, 35000.0]
+        assert _option_index(chain) is index
+        assert _option_index(list(chain)) is not index
+
+    def test_format_expiry(self):
+        """Test expiries use Deribit's instrument-name date format."""
+        assert _format_expiry(1719561600000) == "28JUN24"
+        assert _format_expiry(1720166400000) == "5JUL24"
+
+    def test_current_ts_ms(self):
+        """Test timestamps are integer milliseconds."""
+        with patch("deribit_mcp.tools.time.time_ns", return_value=1700000000123999999):
+            assert _current_ts_ms() == 1700000000123
+
+    def test_quantized_ts_ms(self):
+        """Test history windows are stable within a step."""
+        with patch("deribit_mcp.tools._current_ts_ms", return_value=1700000059999):
+            assert _quantized_ts_ms() == 1700000040000
+            assert _quantized_ts_ms(1000) == 1700000059000
+
+    async def test_gather_limited_bounds_concurrency(self):
+        """Test at most `limit` awaitables run at once, results in order."""
+        running = 0
+        peak = 0
+
+        async def work(i):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            if i == 3:
+                raise ValueError(i)
+            return i
+
+        results = await _gather_limited(
+            *(work(i) for i in range(6)), limit=2, return_exceptions=True
+        )
+
+        assert peak == 2
+        assert results[:3] == [0, 1, 2]
+        assert isinstance(results[3], ValueError)
+        assert results[4:] == [4, 5]
+
+
+# Static response payloads, built and encoded once per module (wire bytes)
+
+
+@pytest.fixture(scope="module")
+def status_payload():
+    """StatusResponse and its encoded JSON."""
+    response = StatusResponse(
+        env="prod",
+        api_ok=True,
+        server_time_ms=1700000000000,
+        notes=["note1", "note2", "note3"],
+    )
+    return response, dumps(response)
+
+
+@pytest.fixture(scope="module")
+def instruments_payload():
+    """InstrumentsResponse truncated to 50 instruments and its encoded JSON."""
+    # Plain dicts are validated into InstrumentCompact in one pass by the parent model
+    instruments = [
+        {
+            "name": f"BTC-28JUN24-{50000 + i * 1000}-C",
+            "exp_ts": 1719561600000,
+            "strike": 50000 + i * 1000,
+            "type": "call",
+            "tick": 0.0001,
+            "size": 1.0,
+        }
+        for i in range(50)
+    ]
+
+    response = InstrumentsResponse(
+        count=100,  # Original count was higher
+        instruments=instruments,
+        notes=["truncated_from:100"],
+    )
+    return response, dumps(response)
+
+
+@pytest.fixture(scope="module")
+def ticker_payload():
+    """Perpetual TickerResponse and its encoded JSON."""
+    response = TickerResponse(
+        inst="BTC-PERPETUAL",
+        bid=50000.0,
+        ask=50001.0,
+        mid=50000.5,
+        mark=50000.25,
+        idx=50000.0,
+        und=50000.0,
+        iv=0.80,
+        greeks=None,
+        oi=1000000.0,
+        vol_24h=50000.0,
+        funding=0.0001,
+        next_funding_ts=1700003600000,
+        notes=[],
+    )
+    return response, dumps(response)
+
+
+@pytest.fixture(scope="module")
+def orderbook_payload():
+    """OrderBookSummaryResponse with 5 levels per side and its encoded JSON."""
+    response = OrderBookSummaryResponse(
+        inst="BTC-PERPETUAL",
+        bid=50000.0,
+        ask=50001.0,
+        spread_pts=1.0,
+        spread_bps=2.0,
+        bids=[{"p": 50000 - i, "q": 1.0} for i in range(5)],
+        asks=[{"p": 50001 + i, "q": 1.0} for i in range(5)],
+        bid_depth=100.0,
+        ask_depth=100.0,
+        imbalance=0.0,
+        notes=[],
+    )
+    return response, dumps(response)
+
+
+@pytest.fixture(scope="module")
+def dvol_payload():
+    """DvolResponse and its encoded JSON."""
+    response = DvolResponse(
+        ccy="BTC",
+        dvol=80.5,
+        dvol_chg_24h=2.5,
+        percentile=65.0,
+        ts=1700000000000,
+        notes=["source:index"],
+    )
+    return response, dumps(response)
+
+
+@pytest.fixture(scope="module")
+def surface_payload():
+    """SurfaceResponse with 4 tenors and its encoded JSON."""
+    response = SurfaceResponse(
+        ccy="BTC",
+        spot=50000.0,
+        tenors=[
+            TenorIV(days=7, atm_iv=0.80, rr25=0.02, fly25=0.01, fwd=50100),
+            TenorIV(days=14, atm_iv=0.78, rr25=0.01, fly25=0.005, fwd=50200),
+            TenorIV(days=30, atm_iv=0.75, rr25=0.005, fly25=0.002, fwd=50500),
+            TenorIV(days=60, atm_iv=0.72, rr25=0.003, fly25=0.001, fwd=51000),
+        ],
+        confidence=0.95,
+        ts=1700000000000,
+        notes=[],
+    )
+    return response, dumps(response)
+
+
+@pytest.fixture(scope="module")
+def expected_move_payload():
+    """ExpectedMoveResponse and its encoded JSON."""
+    response = ExpectedMoveResponse(
+        ccy="BTC",
+        spot=50000.0,
+        iv_used=0.80,
+        iv_source="dvol",
+        horizon_min=60,
+        move_1s_pts=427.5,
+        move_1s_bps=85.5,
+        up_1s=50427.5,
+        down_1s=49572.5,
+        confidence=0.95,
+        notes=["dvol_raw:80"],
+    )
+    return response, dumps(response)
+
+
+@pytest.fixture(scope="module")
+def funding_payload():
+    """FundingResponse with 5 history entries and its encoded JSON."""
+    response = FundingResponse(
+        ccy="BTC",
+        perp="BTC-PERPETUAL",
+        rate=0.0001,
+        rate_8h=0.1095,
+        next_ts=1700003600000,
+        history=[{"ts": 1700000000000 - i * 28800000, "rate": 0.0001} for i in range(5)],
+        notes=[],
+    )
+    return response, dumps(response)
+
 
 class TestOutputSizeLimits:
     """Tests to verify output stays within size limits."""
 
-    def test_status_response_size(self):
-        """Test StatusResponse stays compact."""
-        response = StatusResponse(
-            env="prod",
-            api_ok=True,
-            server_time_ms=1700000000000,
-            notes=["note1", "note2", "note3"],
-        )
-
-        json_str = response.model_dump_json()
-
-        assert len(json_str) < 200  # Status should be tiny
-
-    def test_instruments_response_max_50(self):
-        """Test InstrumentsResponse respects 50 item limit."""
-        instruments = [
-            InstrumentCompact(
-                name=f"BTC-28JUN24-{50000 + i * 1000}-C",
-                exp_ts=1719561600000,
-                strike=50000 + i * 1000,
-                type="call",
-                tick=0.0001,
-                size=1.0,
-            )
-            for i in range(50)
+    @pytest.mark.parametrize(
+        ("payload", "limit"),
+        [
+            ("status_payload", 200),  # Status should be tiny
+            ("instruments_payload", 6000),  # 50 instruments; 5KB is a soft target
+            ("ticker_payload", 500),
+            ("orderbook_payload", 1000),
+            ("dvol_payload", 200),
+            ("surface_payload", 1000),
+            ("expected_move_payload", 400),
+            ("funding_payload", 500),
+        ],
+    )
+    def test_response_under_limit(self, request, payload, limit):
+        """Test each response encodes within its byte budget."""
+        _, encoded = request.getfixturevalue(payload)
+
+        assert len(encoded) < limit
+
+    @pytest.mark.parametrize(
+        ("payload", "field", "max_items"),
+        [
+            ("instruments_payload", "instruments", 50),
+            ("orderbook_payload", "bids", 5),
+            ("orderbook_payload", "asks", 5),
+            ("surface_payload", "tenors", 6),
+            ("funding_payload", "history", 5),
+        ],
+    )
+    def test_list_field_capped(self, request, payload, field, max_items):
+        """Test list fields stay within their item caps."""
+        response, _ = request.getfixturevalue(payload)
+
+        assert len(getattr(response, field)) <= max_items
+
+
+class TestInstrumentSelection:
+    """Tests for trimming large instrument lists."""
+
+    async def test_nearest_expiries_first(self):
+        """Large option lists should keep the nearest 3 expiries, nearest first."""
+        now = 1700000000000
+        day = 86400000
+        # Interleave expiries so API order differs from expiry order
+        raw = [
+            {
+                "instrument_name": f"BTC-{exp}-{strike}-C",
+                "expiration_timestamp": now + exp * day,
+                "strike": strike,
+                "option_type": "call",
+            }
+            for strike in range(20)
+            for exp in (30, 7, -1, 14, 60)
         ]
+        client = AsyncMock()
+        client.call_public.return_value = raw
 
-        response = InstrumentsResponse(
-            count=100,  # Original count was higher
-            instruments=instruments,
-            notes=["truncated_from:100"],
-        )
+        with patch("deribit_mcp.tools._current_ts_ms", return_value=now):
+            response = await deribit_instruments("BTC", client=client)
 
-        json_str = response.model_dump_json()
-
-        # 50 instruments should fit within reasonable size
-        # Using 6KB as limit (hardcoded 5KB is a soft target)
-        assert len(json_str) < 6000
-        assert len(response.instruments) <= 50
-
-    def test_ticker_response_size(self):
-        """Test TickerResponse stays compact."""
-        response = TickerResponse(
-            inst="BTC-PERPETUAL",
-            bid=50000.0,
-            ask=50001.0,
-            mid=50000.5,
-            mark=50000.25,
-            idx=50000.0,
-            und=50000.0,
-            iv=0.80,
-            greeks=None,
-            oi=1000000.0,
-            vol_24h=50000.0,
-            funding=0.0001,
-            next_funding_ts=1700003600000,
-            notes=[],
-        )
+        expiries = [inst.exp_ts for inst in response.instruments]
+        assert response.count == 100
+        assert len(expiries) == 50
+        assert expiries == sorted(expiries)
+        assert set(expiries) == {now + 7 * day, now + 14 * day, now + 30 * day}
+        assert "nearest_3_expiries" in response.notes
 
-        json_str = response.model_dump_json()
-
-        assert len(json_str) < 500  # Ticker should be compact
-
-    def test_orderbook_summary_max_5_levels(self):
-        """Test OrderBookSummaryResponse limits to 5 levels."""
-        from deribit_mcp.models import PriceLevel
-
-        response = OrderBookSummaryResponse(
-            inst="BTC-PERPETUAL",
-            bid=50000.0,
-            ask=50001.0,
-            spread_pts=1.0,
-            spread_bps=2.0,
-            bids=[PriceLevel(p=50000 - i, q=1.0) for i in range(5)],
-            asks=[PriceLevel(p=50001 + i, q=1.0) for i in range(5)],
-            bid_depth=100.0,
-            ask_depth=100.0,
-            imbalance=0.0,
-            notes=[],
-        )
 
-        json_str = response.model_dump_json()
+class TestStatus:
+    """Tests for the status tool."""
 
-        assert len(json_str) < 1000  # Should be under 1KB
-        assert len(response.bids) <= 5
-        assert len(response.asks) <= 5
+    async def test_status_ok(self):
+        """Server time and platform status should both be reported."""
+        client = AsyncMock()
+        client.call_public.side_effect = [1700000000000, {"locked": True}]
+        client.get_cache_stats = lambda: {"total_entries": 0}
 
-    def test_dvol_response_size(self):
-        """Test DvolResponse stays compact."""
-        response = DvolResponse(
-            ccy="BTC",
-            dvol=80.5,
-            dvol_chg_24h=2.5,
-            percentile=65.0,
-            ts=1700000000000,
-            notes=["source:index"],
-        )
+        response = await deribit_status(client=client)
 
-        json_str = response.model_dump_json()
+        assert response.api_ok is True
+        assert response.server_time_ms == 1700000000000
+        assert response.notes == ["platform_locked"]
 
-        assert len(json_str) < 200
+    async def test_status_time_error(self):
+        """A failed time probe should mark the API as down."""
+        client = AsyncMock()
+        client.call_public.side_effect = [DeribitError(10028, "Too many requests"), {}]
 
-    def test_surface_response_max_tenors(self):
-        """Test SurfaceResponse limits tenors."""
-        from deribit_mcp.models import TenorIV
+        response = await deribit_status(client=client)
 
-        response = SurfaceResponse(
-            ccy="BTC",
-            spot=50000.0,
-            tenors=[
-                TenorIV(days=7, atm_iv=0.80, rr25=0.02, fly25=0.01, fwd=50100),
-                TenorIV(days=14, atm_iv=0.78, rr25=0.01, fly25=0.005, fwd=50200),
-                TenorIV(days=30, atm_iv=0.75, rr25=0.005, fly25=0.002, fwd=50500),
-                TenorIV(days=60, atm_iv=0.72, rr25=0.003, fly25=0.001, fwd=51000),
-            ],
-            confidence=0.95,
-            ts=1700000000000,
-            notes=[],
-        )
+        assert response.api_ok is False
+        assert response.notes == ["error:10028", "Too many requests"]
 
-        json_str = response.model_dump_json()
+    async def test_status_time_cancelled(self):
+        """A cancelled time probe should not be reported as the server time."""
+        client = AsyncMock()
+        client.call_public.side_effect = [asyncio.CancelledError(), {}]
 
-        assert len(json_str) < 1000
-        assert len(response.tenors) <= 6  # Max 6 tenors
+        response = await deribit_status(client=client)
 
-    def test_expected_move_response_size(self):
-        """Test ExpectedMoveResponse stays compact."""
-        response = ExpectedMoveResponse(
-            ccy="BTC",
-            spot=50000.0,
-            iv_used=0.80,
-            iv_source="dvol",
-            horizon_min=60,
-            move_1s_pts=427.5,
-            move_1s_bps=85.5,
-            up_1s=50427.5,
-            down_1s=49572.5,
-            confidence=0.95,
-            notes=["dvol_raw:80"],
-        )
+        assert response.api_ok is False
+        assert response.server_time_ms == 0
+        assert response.notes == ["connection_error:CancelledError"]
 
-        json_str = response.model_dump_json()
 
-        assert len(json_str) < 400
+class TestDvolSnapshot:
+    """Tests for the DVOL snapshot tool."""
 
-    def test_funding_response_max_history(self):
-        """Test FundingResponse limits history."""
-        from deribit_mcp.models import FundingEntry
+    async def test_index_data_preferred(self):
+        """Index data should be used when available, without a ticker request."""
 
-        response = FundingResponse(
-            ccy="BTC",
-            perp="BTC-PERPETUAL",
-            rate=0.0001,
-            rate_8h=0.1095,
-            next_ts=1700003600000,
-            history=[FundingEntry(ts=1700000000000 - i * 28800000, rate=0.0001) for i in range(5)],
-            notes=[],
-        )
+        async def call_public(method, params=None):
+            if method == "public/ticker":
+                raise DeribitError(10001, "unexpected fallback")
+            return {"data": [[0, 50, 55, 45, 50.0], [1, 50, 56, 49, 52.5]]}
 
-        json_str = response.model_dump_json()
+        client = AsyncMock()
+        client.call_public.side_effect = call_public
 
-        assert len(json_str) < 500
-        assert len(response.history) <= 5
+        response = await dvol_snapshot("BTC", client=client)
+
+        assert response.dvol == 52.5
+        assert response.dvol_chg_24h == 2.5
+        assert [c.args[0] for c in client.call_public.call_args_list] == [
+            "public/get_volatility_index_data"
+        ]
+
+    async def test_ticker_fallback_after_index_failure(self):
+        """The ticker fallback should only be requested once index data fails."""
+        started = []
+
+        async def call_public(method, params=None):
+            started.append(method)
+            if method == "public/get_volatility_index_data":
+                raise DeribitError(10001, "not found")
+            return {"mark_price": 48.7}
+
+        client = AsyncMock()
+        client.call_public.side_effect = call_public
+
+        response = await dvol_snapshot("ETH", client=client)
+
+        assert started == ["public/get_volatility_index_data", "public/ticker"]
+        assert response.dvol == 48.7
+        assert response.notes == ["source:ticker_fallback"]
+
+
+class TestExpectedMove:
+    """Tests for the expected move tool."""
+
+    async def test_dvol_failure_falls_back_to_atm_iv(self):
+        """Without DVOL, IV should come from the nearest expiry's ATM option."""
+        expiry = _current_ts_ms() + 10 * 86_400_000
+        chain = [
+            {"expiration_timestamp": expiry, "strike": strike} for strike in (35000, 40000, 45000)
+        ]
+        requested = []
+
+        async def call_public(method, params=None):
+            requested.append(method)
+            if method == "public/get_index_price":
+                return {"index_price": 40100.0}
+            if method == "public/get_instruments":
+                return chain
+            if method == "public/ticker" and not params["instrument_name"].endswith("_DVOL"):
+                assert params["instrument_name"].endswith("-40000-C")
+                return {"mark_iv": 50.0}
+            raise DeribitError(10001, "unavailable")
+
+        client = AsyncMock()
+        client.call_public.side_effect = call_public
+
+        response = await expected_move_iv("BTC", 60, "dvol", client=client)
+
+        assert response.iv_source == "atm_iv"
+        assert response.iv_used == 0.5
+        assert response.confidence == 0.7
+        assert requested.count("public/get_instruments") == 1
+
+
+class TestMarketIVSnapshot:
+    """Tests for the combined surface + expected move tool."""
+
+    async def test_shared_fetches_and_atm_fallback(self):
+        """Spot and the chain are fetched once; the move ATM joins the batch."""
+        expiry = _current_ts_ms() + 7 * 86_400_000
+        chain = [
+            {"expiration_timestamp": expiry, "strike": strike} for strike in (38000, 40000, 42000)
+        ]
+        requested = []
+
+        async def call_public(method, params=None):
+            requested.append(method)
+            if method == "public/get_index_price":
+                return {"index_price": 40000.0}
+            if method == "public/get_instruments":
+                return chain
+            if method == "public/ticker" and params["instrument_name"].endswith("-40000-C"):
+                return {"mark_iv": 60.0}
+            raise DeribitError(10001, "unavailable")
+
+        client = AsyncMock()
+        client.call_public.side_effect = call_public
+
+        response = await market_iv_snapshot("BTC", [7], 60, client=client)
+
+        assert response.surface.tenors[0].atm_iv == 0.6
+        assert response.move.iv_source == "atm_iv"
+        assert response.move.iv_used == 0.6
+        assert requested.count("public/get_index_price") == 1
+        assert requested.count("public/get_instruments") == 1
+        assert len(dumps(response)) <= 2048
+
+
+class TestFundingSnapshot:
+    """Tests for the funding snapshot tool."""
+
+    async def test_history_failure_degrades(self):
+        """A failed history query should not sink the current rate."""
+
+        async def call_public(method, params=None):
+            if method == "public/get_funding_rate_history":
+                raise DeribitError(10001, "unavailable")
+            return {"current_funding": 0.0001}
+
+        client = AsyncMock()
+        client.call_public.side_effect = call_public
+
+        response = await funding_snapshot("BTC", client=client)
+
+        assert response.rate == 0.0001
+        assert response.history == []
+        assert response.notes == ["history_unavailable"]
+
+
+class TestPositions:
+    """Tests for the positions tool."""
+
+    async def test_flat_positions_filtered_before_truncation(
+        self, monkeypatch, clear_settings_cache
+    ):
+        """Flat positions should neither count nor take display slots."""
+        monkeypatch.setenv("DERIBIT_ENABLE_PRIVATE", "true")
+        flat = [{"instrument_name": f"BTC-FLAT-{i}", "size": 0} for i in range(5)]
+        live = [{"instrument_name": f"BTC-{i}", "size": -10} for i in range(25)]
+        client = AsyncMock()
+        client.call_private.return_value = flat + live
+
+        response = await positions("BTC", client=client)
+
+        assert response.count == 25
+        assert len(response.positions) == 20
+        assert response.positions[0].inst == "BTC-0"
+        assert response.positions[0].side == "short"
+        assert response.notes == ["truncated_from:25"]
+
+
+class TestTicker:
+    """Tests for ticker snapshots."""
+
+    @pytest.mark.parametrize(
+        ("instrument", "has_funding"),
+        [
+            ("BTC-PERPETUAL", True),
+            ("BTC_USDC-PERPETUAL", True),
+            ("BTC-28JUN24-70000-C", False),
+            ("BTC-28JUN24", False),
+        ],
+    )
+    async def test_funding_only_for_perpetuals(self, instrument, has_funding):
+        """Funding fields should only be filled for perpetual instruments."""
+        client = AsyncMock()
+        client.call_public.return_value = {
+            "mark_price": 50000.0,
+            "current_funding": 0.0001,
+        }
+
+        response = await deribit_ticker(instrument, client=client)
+
+        assert (response.funding is not None) is has_funding
+
+
+class TestOrderBookSummary:
+    """Tests for order book summarisation."""
+
+    async def test_levels_and_depth(self):
+        """Top 5 levels are returned while depth sums every fetched level."""
+        book = {
+            "bids": [[50000.0 - i, 1.0] for i in range(8)],
+            "asks": [[50001.0 + i, 2.0] for i in range(3)],
+            "best_bid_price": 50000.0,
+            "best_ask_price": 50001.0,
+        }
+        client = AsyncMock()
+        client.call_public.return_value = book
+
+        response = await deribit_orderbook_summary("BTC-PERPETUAL", depth=20, client=client)
+
+        assert [level.p for level in response.bids] == [50000.0 - i for i in range(5)]
+        assert len(response.asks) == 3
+        assert response.bid_depth == 8.0
+        assert response.ask_depth == 6.0
+        assert "levels_truncated_from:8" in response.notes
+
+
+class TestSurfaceSnapshot:
+    """Tests for the per-tenor surface fan-out."""
+
+    async def test_failed_tenor_degrades(self):
+        """A failing tenor should add a note without failing the snapshot."""
+        now = 1700000000000
+        day = 86400000
+        options = [
+            {"expiration_timestamp": now + days * day, "strike": 50000.0} for days in (7, 30)
+        ]
+
+        async def call_public(method, params=None):
+            if method == "public/get_index_price":
+                return {"index_price": 50000.0}
+            if method == "public/get_instruments":
+                return options
+            name = params["instrument_name"]
+            if name.startswith("BTC-21NOV23-"):
+                return {"mark_iv": 60.0} if name.endswith("-50000-C") else {}
+            raise RuntimeError("boom")
+
+        client = AsyncMock()
+        client.call_public.side_effect = call_public
+
+        with patch("deribit_mcp.tools._current_ts_ms", return_value=now):
+            response = await options_surface_snapshot("BTC", tenor_days=[7, 30], client=client)
+
+        assert [tenor.days for tenor in response.tenors] == [7, 30]
+        assert response.tenors[0].atm_iv == 0.6
+        assert response.tenors[1].atm_iv is None
+        assert "tenor_failed:30d" in response.notes
 
 
 class TestCompactJson:
@@ -225,57 +650,44 @@ class TestCompactJson:
     def test_compact_json_no_spaces(self):
         """Test compact JSON has no unnecessary spaces."""
         data = {"key": "value", "number": 123, "list": [1, 2, 3]}
-        result = json.dumps(data, separators=(",", ":"))
 
-        assert " " not in result.replace('"key"', "").replace('"value"', "")
-        assert '{"key":"value","number":123,"list":[1,2,3]}' == result
+        assert dumps(data) == b'{"key":"value","number":123,"list":[1,2,3]}'
 
+    def test_compact_json_matches_stdlib(self):
+        """Test the shared encoder matches stdlib compact output."""
+        data = {"key": "数据", "number": 1.5, "nested": {"list": [1, None, True]}}
+        expected = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
 
-class TestNotesLimit:
-    """Tests for notes array limit."""
+        assert compact_json(data) == expected
+        assert dumps(data) == expected.encode()
 
-    def test_status_notes_max_6(self):
-        """Test StatusResponse rejects more than 6 notes."""
-        import pytest
-        from pydantic import ValidationError
+    def test_compact_json_models(self):
+        """Response models should encode the same as their dumped dict."""
+        response = DvolResponse(ccy="BTC", dvol=80.5, ts=1700000000000, notes=["数据"])
 
-        # Pydantic should raise ValidationError for more than 6 notes
-        with pytest.raises(ValidationError):
-            StatusResponse(
-                env="prod",
-                api_ok=True,
-                server_time_ms=1700000000000,
-                notes=["1", "2", "3", "4", "5", "6", "7", "8"],
-            )
+        assert dumps(response) == dumps(response.model_dump())
+        assert compact_json(response) == response.model_dump_json()
 
-        # Exactly 6 should work
-        response = StatusResponse(
-            env="prod",
-            api_ok=True,
-            server_time_ms=1700000000000,
-            notes=["1", "2", "3", "4", "5", "6"],
-        )
-        assert len(response.notes) == 6
 
-    def test_ticker_notes_max_6(self):
-        """Test TickerResponse rejects more than 6 notes."""
-        import pytest
-        from pydantic import ValidationError
+class TestNotesLimit:
+    """Tests for notes array limit."""
 
+    @pytest.mark.parametrize(
+        ("model", "base"),
+        [
+            (StatusResponse, {"env": "prod", "api_ok": True, "server_time_ms": 1700000000000}),
+            (TickerResponse, {"inst": "BTC-PERPETUAL", "mark": 50000.0}),
+        ],
+        ids=["status", "ticker"],
+    )
+    def test_notes_max_6(self, model, base):
+        """Test responses reject more than 6 notes."""
         # Pydantic should raise ValidationError for more than 6 notes
         with pytest.raises(ValidationError):
-            TickerResponse(
-                inst="BTC-PERPETUAL",
-                mark=50000.0,
-                notes=["1", "2", "3", "4", "5", "6", "7"],
-            )
+            model(**base, notes=["1", "2", "3", "4", "5", "6", "7"])
 
         # Exactly 6 should work
-        response = TickerResponse(
-            inst="BTC-PERPETUAL",
-            mark=50000.0,
-            notes=["1", "2", "3", "4", "5", "6"],
-        )
+        response = model(**base, notes=["1", "2", "3", "4", "5", "6"])
         assert len(response.notes) == 6
 
 
@@ -284,8 +696,6 @@ class TestErrorDegradation:
 
     def test_error_response_structure(self):
         """Test error response has expected structure."""
-        from deribit_mcp.models import ErrorResponse
-
         error = ErrorResponse(
             code=10001,
             message="Test error message",
@@ -299,13 +709,16 @@ class TestErrorDegradation:
         assert "message" in data
         assert len(data["notes"]) == 2
 
-    def test_error_message_truncation(self):
+    async def test_error_message_truncation(self):
         """Test long error messages get truncated in tool output."""
-        # In tools.py, we truncate messages to 100 chars
-        long_message = "A" * 200
-        truncated = long_message[:100]
+        client = AsyncMock()
+        client.call_public.side_effect = DeribitError(10001, "A" * 200)
 
-        assert len(truncated) == 100
+        response = await deribit_instruments("BTC", client=client)
+
+        # Tools truncate upstream messages to 100 chars
+        assert response.error is True
+        assert response.message == "A" * 100
 
 
 class TestModelValidation:
@@ -339,6 +752,13 @@ class TestModelValidation:
 
         assert 0 <= response.confidence <= 1
 
+    def test_output_models_frozen(self):
+        """Output models should reject mutation after construction."""
+        level = PriceLevel(p=50000.0, q=1.0)
+
+        with pytest.raises(ValidationError):
+            level.p = 1.0
+
     def test_instrument_compact_fields(self):
         """Test InstrumentCompact has minimal fields."""
         inst = InstrumentCompact(